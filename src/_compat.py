@@ -0,0 +1,15 @@
+"""
+Python version compatibility helpers.
+
+The package supports Python 3.9+ (see pyproject.toml); features that need a
+newer interpreter are switched on here so call sites stay version-agnostic.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict
+
+# Keyword arguments for @dataclass(**DATACLASS_SLOTS): slotted instances on
+# Python 3.10+, a regular __dict__-backed dataclass on 3.9.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
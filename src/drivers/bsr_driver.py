@@ -15,9 +15,10 @@ from typing import Any, Dict, Optional
 from loguru import logger
 
 from src.drivers.radar_driver_base import (
+    CONNECT_STATUS_BY_NAME,
+    STATUS_GENERAL_ERROR,
+    STATUS_OK,
     ConnectResponse,
-    ConnectStatus,
-    DetectionData,
     HeartbeatData,
     PointCloudFrame,
     RadarDriverBase,
@@ -53,6 +54,8 @@ class BSRDriver(RadarDriverBase):
     - Recording
     """
 
+    __slots__ = ("_radar", "_rtool_config", "_fw_version", "_state")
+
     def __init__(
         self,
         ip: str,
@@ -83,7 +86,7 @@ class BSRDriver(RadarDriverBase):
     def connect(self, ping_timeout: int = 10) -> ConnectResponse:
         if not BSR_APIS_AVAILABLE or self._radar is None:
             return ConnectResponse(
-                status=ConnectStatus.GENERAL_ERROR,
+                status=STATUS_GENERAL_ERROR,
                 message="bsr_apis not installed",
             )
         try:
@@ -95,7 +98,7 @@ class BSRDriver(RadarDriverBase):
                 loc_name = location.name if location else "UNKNOWN"
                 logger.info(f"BSRDriver: Connected to {self.radar_type} at {self.ip}")
                 return ConnectResponse(
-                    status=ConnectStatus.OK,
+                    status=STATUS_OK,
                     message="Connected successfully",
                     fw_version=self._fw_version,
                     physical_location=loc_name,
@@ -104,13 +107,13 @@ class BSRDriver(RadarDriverBase):
                 status_val = getattr(response, "status", None)
                 status_name = status_val.name if status_val else "UNKNOWN"
                 return ConnectResponse(
-                    status=ConnectStatus(status_name) if status_name in ConnectStatus.__members__ else ConnectStatus.GENERAL_ERROR,
+                    status=CONNECT_STATUS_BY_NAME.get(status_name, STATUS_GENERAL_ERROR),
                     message=f"Connect failed: {status_name}",
                 )
         except Exception as e:
             logger.error(f"BSRDriver: Connect error: {e}")
             return ConnectResponse(
-                status=ConnectStatus.GENERAL_ERROR,
+                status=STATUS_GENERAL_ERROR,
                 message=str(e),
             )
 
@@ -162,25 +165,22 @@ class BSRDriver(RadarDriverBase):
             pc1 = self._radar.get_pc1(timeout=timeout)
             if pc1 is None:
                 return None
-            detections = []
-            for i in range(len(pc1.detections)):
+            frame = PointCloudFrame.preallocated(len(pc1.detections))
+            for i, out in enumerate(frame.detections):
                 det = pc1.detections[i]
-                detections.append(DetectionData(
-                    distance=float(det.get("range", 0)) if hasattr(det, "get") else 0.0,
-                    azimuth=float(det.get("azimuth", 0)) if hasattr(det, "get") else 0.0,
-                    elevation=float(det.get("elevation", 0)) if hasattr(det, "get") else 0.0,
-                    velocity=float(det.get("doppler", 0)) if hasattr(det, "get") else 0.0,
-                    rcs=float(det.get("rcs", 0)) if hasattr(det, "get") else 0.0,
-                    x=float(det.get("x", 0)) if hasattr(det, "get") else 0.0,
-                    y=float(det.get("y", 0)) if hasattr(det, "get") else 0.0,
-                    z=float(det.get("z", 0)) if hasattr(det, "get") else 0.0,
-                ))
-            return PointCloudFrame(
-                cycle_count=pc1.generic_header.get("cycle_count", 0) if hasattr(pc1.generic_header, "get") else 0,
-                valid_detections=len(detections),
-                detections=detections,
-                latency_ms=getattr(pc1, "latency", 0.0),
-            )
+                if not hasattr(det, "get"):
+                    continue  # Leave the zeroed defaults
+                out.distance = float(det.get("range", 0))
+                out.azimuth = float(det.get("azimuth", 0))
+                out.elevation = float(det.get("elevation", 0))
+                out.velocity = float(det.get("doppler", 0))
+                out.rcs = float(det.get("rcs", 0))
+                out.x = float(det.get("x", 0))
+                out.y = float(det.get("y", 0))
+                out.z = float(det.get("z", 0))
+            frame.cycle_count = pc1.generic_header.get("cycle_count", 0) if hasattr(pc1.generic_header, "get") else 0
+            frame.latency_ms = getattr(pc1, "latency", 0.0)
+            return frame
         except Exception as e:
             logger.error(f"BSRDriver: get_point_cloud error: {e}")
             return None
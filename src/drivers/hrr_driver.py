@@ -9,14 +9,15 @@ Reference: hrr_apis_0.2.0_user_guide.html
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import Any, Dict, Optional
 
 from loguru import logger
 
 from src.drivers.radar_driver_base import (
+    STATUS_GENERAL_ERROR,
+    STATUS_OK,
     ConnectResponse,
-    ConnectStatus,
-    DetectionData,
     HeartbeatData,
     PointCloudFrame,
     RadarDriverBase,
@@ -31,6 +32,10 @@ except ImportError:
     HRR_APIS_AVAILABLE = False
     logger.warning("hrr_apis package not installed — HRR driver will not be functional")
 
+# Multi-attribute getters for hrr_apis statistics windows
+_FPS_FIELDS = attrgetter("current", "mean", "minimum", "maximum")
+_LATENCY_FIELDS = attrgetter("current", "mean")
+
 
 class HRRDriver(RadarDriverBase):
     """
@@ -47,6 +52,8 @@ class HRRDriver(RadarDriverBase):
     - Recording (HDF5)
     """
 
+    __slots__ = ("_radar", "_fw_version", "_state")
+
     def __init__(
         self,
         ip: str,
@@ -60,41 +67,41 @@ class HRRDriver(RadarDriverBase):
 
         if HRR_APIS_AVAILABLE:
             self._radar = HRRRadar(ip=ip)
-            logger.info(f"HRRDriver: hrr_apis.Radar instantiated at {ip}")
+            logger.info("HRRDriver: hrr_apis.Radar instantiated at {}", ip)
         else:
             logger.error("HRRDriver: hrr_apis not available")
 
     def connect(self, ping_timeout: int = 10) -> ConnectResponse:
         if not HRR_APIS_AVAILABLE or self._radar is None:
             return ConnectResponse(
-                status=ConnectStatus.GENERAL_ERROR,
+                status=STATUS_GENERAL_ERROR,
                 message="hrr_apis not installed",
             )
         try:
             response = self._radar.connect(ping_timeout=ping_timeout)
             if response and response.status == ConnectResponseStatus.OK:
                 self._connected = True
-                logger.info(f"HRRDriver: Connected to HRR at {self.ip}")
+                logger.info("HRRDriver: Connected to HRR at {}", self.ip)
                 return ConnectResponse(
-                    status=ConnectStatus.OK,
+                    status=STATUS_OK,
                     message="Connected successfully",
                 )
             else:
                 status_str = str(getattr(response, "status", "UNKNOWN"))
                 return ConnectResponse(
-                    status=ConnectStatus.GENERAL_ERROR,
+                    status=STATUS_GENERAL_ERROR,
                     message=f"Connect failed: {status_str}",
                 )
         except Exception as e:
-            logger.error(f"HRRDriver: Connect error: {e}")
-            return ConnectResponse(status=ConnectStatus.GENERAL_ERROR, message=str(e))
+            logger.exception("HRRDriver: Connect error")
+            return ConnectResponse(status=STATUS_GENERAL_ERROR, message=str(e))
 
     def disconnect(self) -> None:
         if self._radar and self._connected:
             try:
                 self._radar.disconnect()
             except Exception as e:
-                logger.warning(f"HRRDriver: Disconnect error (ignored): {e}")
+                logger.warning("HRRDriver: Disconnect error (ignored): {}", e)
             self._connected = False
             logger.info("HRRDriver: Disconnected")
 
@@ -125,8 +132,8 @@ class HRRDriver(RadarDriverBase):
                 fw_version=str(getattr(getattr(hb, "versions", None), "fw_main_app_ver_high", "")),
                 temperatures=self._extract_temperatures(hb),
             )
-        except Exception as e:
-            logger.error(f"HRRDriver: get_heartbeat error: {e}")
+        except Exception:
+            logger.exception("HRRDriver: get_heartbeat error")
             return None
 
     def get_point_cloud(self, timeout: int = 5) -> Optional[PointCloudFrame]:
@@ -137,27 +144,23 @@ class HRRDriver(RadarDriverBase):
             soda = self._radar.get_soda(timeout=timeout)
             if soda is None:
                 return None
-            detections = []
-            for i in range(len(soda.detections)):
+            frame = PointCloudFrame.preallocated(len(soda.detections))
+            for i, out in enumerate(frame.detections):
                 det = soda.detections[i]
-                detections.append(DetectionData(
-                    distance=float(det["HRR_F_Dtctn_Dist"]) * 0.005,
-                    azimuth=float(det["HRR_F_Dtctn_Azi"]) * 5.0e-5 - 1.571,
-                    elevation=float(det["HRR_F_Dtctn_Elev"]) * 5.0e-5 - 1.571,
-                    velocity=float(det["HRR_F_Dtctn_RadVelo"]),
-                    rcs=float(det["HRR_F_Dtctn_RCS"]),
-                    x=float(det["x"]),
-                    y=float(det["y"]),
-                    z=float(det["z"]),
-                ))
-            return PointCloudFrame(
-                cycle_count=soda.generic_header.get("HRR_F_Cycl_Count", 0),
-                valid_detections=soda.radar_header.get("HRR_F_ValidDtctn", 0),
-                detections=detections,
-                latency_ms=getattr(soda, "latency", 0.0),
-            )
-        except Exception as e:
-            logger.error(f"HRRDriver: get_point_cloud (SODA) error: {e}")
+                out.distance = float(det["HRR_F_Dtctn_Dist"]) * 0.005
+                out.azimuth = float(det["HRR_F_Dtctn_Azi"]) * 5.0e-5 - 1.571
+                out.elevation = float(det["HRR_F_Dtctn_Elev"]) * 5.0e-5 - 1.571
+                out.velocity = float(det["HRR_F_Dtctn_RadVelo"])
+                out.rcs = float(det["HRR_F_Dtctn_RCS"])
+                out.x = float(det["x"])
+                out.y = float(det["y"])
+                out.z = float(det["z"])
+            frame.cycle_count = soda.generic_header.get("HRR_F_Cycl_Count", 0)
+            frame.valid_detections = soda.radar_header.get("HRR_F_ValidDtctn", 0)
+            frame.latency_ms = getattr(soda, "latency", 0.0)
+            return frame
+        except Exception:
+            logger.exception("HRRDriver: get_point_cloud (SODA) error")
             return None
 
     def get_statistics(self) -> StatisticsData:
@@ -165,17 +168,19 @@ class HRRDriver(RadarDriverBase):
             return StatisticsData()
         try:
             stats = self._radar.get_statistics()
+            fps_current, fps_mean, fps_min, fps_max = _FPS_FIELDS(stats.fps)
+            latency_current, latency_mean = _LATENCY_FIELDS(stats.latency)
             return StatisticsData(
-                fps_current=getattr(stats.fps, "current", 0.0),
-                fps_mean=getattr(stats.fps, "mean", 0.0),
-                fps_min=getattr(stats.fps, "minimum", 0.0),
-                fps_max=getattr(stats.fps, "maximum", 0.0),
-                latency_current_ms=getattr(stats.latency, "current", 0.0),
-                latency_mean_ms=getattr(stats.latency, "mean", 0.0),
+                fps_current=fps_current,
+                fps_mean=fps_mean,
+                fps_min=fps_min,
+                fps_max=fps_max,
+                latency_current_ms=latency_current,
+                latency_mean_ms=latency_mean,
                 sync_loss_counter=getattr(stats, "sync_loss_counter", 0),
             )
-        except Exception as e:
-            logger.error(f"HRRDriver: get_statistics error: {e}")
+        except Exception:
+            logger.exception("HRRDriver: get_statistics error")
             return StatisticsData()
 
     def update_fw(self, modality: Optional[str] = None, force: bool = False) -> bool:
@@ -196,8 +201,8 @@ class HRRDriver(RadarDriverBase):
             return False
         try:
             return bool(self._radar.start_recording(out_dir, amount=amount))
-        except Exception as e:
-            logger.error(f"HRRDriver: start_recording error: {e}")
+        except Exception:
+            logger.exception("HRRDriver: start_recording error")
             return False
 
     def stop_recording(self) -> bool:
@@ -206,8 +211,8 @@ class HRRDriver(RadarDriverBase):
         try:
             self._radar.stop_recording()
             return True
-        except Exception as e:
-            logger.error(f"HRRDriver: stop_recording error: {e}")
+        except Exception:
+            logger.exception("HRRDriver: stop_recording error")
             return False
 
     def set_physical_location(self, location: str) -> bool:
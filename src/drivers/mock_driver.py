@@ -10,6 +10,7 @@ the entire test framework to run in simulation mode. This enables:
 
 from __future__ import annotations
 
+import math
 import random
 import time
 from typing import Any, Dict, List, Optional
@@ -17,8 +18,9 @@ from typing import Any, Dict, List, Optional
 from loguru import logger
 
 from src.drivers.radar_driver_base import (
+    STATUS_NO_PING,
+    STATUS_OK,
     ConnectResponse,
-    ConnectStatus,
     DetectionData,
     HeartbeatData,
     PointCloudFrame,
@@ -27,14 +29,43 @@ from src.drivers.radar_driver_base import (
 )
 
 
+def _fill_detections(rng: random.Random, detections: List[DetectionData]) -> None:
+    """Fill preallocated detections with random draws from `rng` in a single pass."""
+    uniform = rng.uniform
+    cos = math.cos
+    sin = math.sin
+    for det in detections:
+        dist = uniform(1.0, 200.0)
+        azi = uniform(-1.0, 1.0)
+        elev = uniform(-0.3, 0.3)
+        cos_elev = cos(elev)
+        det.distance = dist
+        det.azimuth = azi
+        det.elevation = elev
+        det.velocity = uniform(-30.0, 30.0)
+        det.rcs = uniform(-10.0, 30.0)
+        det.x = dist * cos(azi) * cos_elev
+        det.y = dist * sin(azi) * cos_elev
+        det.z = dist * sin(elev)
+
+
 class MockRadarDriver(RadarDriverBase):
     """
     Mock radar driver that simulates BSR/HRR radar behavior.
 
     Generates realistic mock data for all radar operations including
     heartbeat, point cloud / SODA frames, and statistics.
+
+    Pass `num_detections` to emit fixed-size frames (e.g. thousands of
+    detections for saturation tests); by default each frame carries 5–50.
     """
 
+    __slots__ = (
+        "_fail_connect", "_fail_ping", "_num_detections", "_rng", "_fw_version",
+        "_state", "_location", "_lldp_enabled", "_rloc_timeout", "_recording",
+        "_beat_counter", "_cycle_counter", "_start_time",
+    )
+
     def __init__(
         self,
         ip: str = "192.168.101.190",
@@ -43,10 +74,13 @@ class MockRadarDriver(RadarDriverBase):
         password: Optional[str] = None,
         fail_connect: bool = False,
         fail_ping: bool = False,
+        num_detections: Optional[int] = None,
     ) -> None:
         super().__init__(ip=ip, radar_type=radar_type, is_hrr=is_hrr, password=password)
         self._fail_connect = fail_connect
         self._fail_ping = fail_ping
+        self._num_detections = num_detections
+        self._rng = random.Random()
         self._fw_version = "v5.4.1-0-ge7cdd756" if not is_hrr else "v4.6.5-40-gb2c16779"
         self._state = "STANDBY"
         self._location = "FRONT_CENTER_BOTTOM"
@@ -56,20 +90,20 @@ class MockRadarDriver(RadarDriverBase):
         self._beat_counter = 0
         self._cycle_counter = 0
         self._start_time = time.time()
-        logger.info(f"MockRadarDriver [{radar_type}] initialized — simulation mode at {ip}")
+        logger.info("MockRadarDriver [{}] initialized — simulation mode at {}", radar_type, ip)
 
     def connect(self, ping_timeout: int = 10) -> ConnectResponse:
         if self._fail_connect:
-            logger.warning(f"MockDriver: Simulating connection failure to {self.ip}")
+            logger.warning("MockDriver: Simulating connection failure to {}", self.ip)
             return ConnectResponse(
-                status=ConnectStatus.NO_PING,
+                status=STATUS_NO_PING,
                 message="Simulated connection failure",
             )
         self._connected = True
         self._state = "STANDBY"
-        logger.info(f"MockDriver: Connected to {self.radar_type} at {self.ip}")
+        logger.info("MockDriver: Connected to {} at {}", self.radar_type, self.ip)
         return ConnectResponse(
-            status=ConnectStatus.OK,
+            status=STATUS_OK,
             message="Mock connection established",
             fw_version=self._fw_version,
             sensor_id=f"MOCK-{self.radar_type}-001",
@@ -79,7 +113,7 @@ class MockRadarDriver(RadarDriverBase):
     def disconnect(self) -> None:
         self._connected = False
         self._recording = False
-        logger.info(f"MockDriver: Disconnected from {self.ip}")
+        logger.info("MockDriver: Disconnected from {}", self.ip)
 
     def ping(self, timeout: int = 5) -> bool:
         if self._fail_ping:
@@ -100,8 +134,8 @@ class MockRadarDriver(RadarDriverBase):
             sensor_type=self.radar_type,
             fw_version=self._fw_version,
             temperatures={
-                "tsip_0": round(random.uniform(35.0, 50.0), 1),
-                "tsip_1": round(random.uniform(35.0, 50.0), 1),
+                "tsip_0": self._rng.uniform(35.0, 50.0),
+                "tsip_1": self._rng.uniform(35.0, 50.0),
             },
             voltages={
                 "main": 12.01,
@@ -118,58 +152,41 @@ class MockRadarDriver(RadarDriverBase):
         if not self._connected:
             return None
         self._cycle_counter += 1
-        num_detections = random.randint(5, 50)
-        detections: List[DetectionData] = []
-        for _ in range(num_detections):
-            dist = random.uniform(1.0, 200.0)
-            azi = random.uniform(-1.0, 1.0)
-            elev = random.uniform(-0.3, 0.3)
-            import math
-            x = dist * math.cos(azi) * math.cos(elev)
-            y = dist * math.sin(azi) * math.cos(elev)
-            z = dist * math.sin(elev)
-            detections.append(DetectionData(
-                distance=round(dist, 3),
-                azimuth=round(azi, 4),
-                elevation=round(elev, 4),
-                velocity=round(random.uniform(-30.0, 30.0), 2),
-                rcs=round(random.uniform(-10.0, 30.0), 1),
-                x=round(x, 2),
-                y=round(y, 2),
-                z=round(z, 2),
-            ))
-        now = time.time()
-        return PointCloudFrame(
-            cycle_count=self._cycle_counter,
-            timestamp_sec=int(now),
-            timestamp_nsec=int((now % 1) * 1e9),
-            valid_detections=num_detections,
-            detections=detections,
-            latency_ms=round(random.uniform(5.0, 25.0), 2),
+        num_detections = (
+            self._num_detections if self._num_detections is not None
+            else self._rng.randint(5, 50)
         )
+        frame = PointCloudFrame.preallocated(num_detections)
+        _fill_detections(self._rng, frame.detections)
+        now = time.time()
+        frame.cycle_count = self._cycle_counter
+        frame.timestamp_sec = int(now)
+        frame.timestamp_nsec = int((now % 1) * 1e9)
+        frame.latency_ms = self._rng.uniform(5.0, 25.0)
+        return frame
 
     def get_statistics(self) -> StatisticsData:
         return StatisticsData(
-            fps_current=round(random.uniform(9.5, 10.5), 1),
+            fps_current=round(self._rng.uniform(9.5, 10.5), 1),
             fps_mean=10.0,
             fps_min=9.2,
             fps_max=10.8,
-            latency_current_ms=round(random.uniform(8.0, 15.0), 2),
+            latency_current_ms=round(self._rng.uniform(8.0, 15.0), 2),
             latency_mean_ms=11.5,
             drops_counters={"soda": 0, "heartbeat": 0},
             sync_loss_counter=0,
             temperatures={
-                "tsip_0_current": round(random.uniform(35.0, 50.0), 1),
+                "tsip_0_current": round(self._rng.uniform(35.0, 50.0), 1),
             },
         )
 
     def update_fw(self, modality: Optional[str] = None, force: bool = False) -> bool:
-        logger.info(f"MockDriver: Simulating FW update (modality={modality}, force={force})")
+        logger.info("MockDriver: Simulating FW update (modality={}, force={})", modality, force)
         time.sleep(0.1)  # Simulate brief delay
         return True
 
     def reset(self, reset_type: str = "COLD") -> bool:
-        logger.info(f"MockDriver: Simulating {reset_type} reset")
+        logger.info("MockDriver: Simulating {} reset", reset_type)
         self._state = "STANDBY"
         self._cycle_counter = 0
         return True
@@ -177,10 +194,10 @@ class MockRadarDriver(RadarDriverBase):
     def set_state(self, state: str) -> bool:
         valid_states = ["STANDBY", "SCANNING", "FW_UPDATE"]
         if state not in valid_states:
-            logger.error(f"MockDriver: Invalid state '{state}'. Valid: {valid_states}")
+            logger.error("MockDriver: Invalid state '{}'. Valid: {}", state, valid_states)
             return False
         self._state = state
-        logger.info(f"MockDriver: State changed to {state}")
+        logger.info("MockDriver: State changed to {}", state)
         return True
 
     def start_recording(self, out_dir: str, amount: Optional[int] = None) -> bool:
@@ -188,7 +205,7 @@ class MockRadarDriver(RadarDriverBase):
             logger.warning("MockDriver: Recording already in progress")
             return False
         self._recording = True
-        logger.info(f"MockDriver: Recording started — dir={out_dir}, amount={amount}")
+        logger.info("MockDriver: Recording started — dir={}, amount={}", out_dir, amount)
         return True
 
     def stop_recording(self) -> bool:
@@ -203,11 +220,11 @@ class MockRadarDriver(RadarDriverBase):
             "FRONT_RIGHT", "FRONT_LEFT",
         ]
         if location not in valid_locations:
-            logger.error(f"MockDriver: Unknown location '{location}'")
+            logger.error("MockDriver: Unknown location '{}'", location)
             return False
         old_location = self._location
         self._location = location
-        logger.info(f"MockDriver: Physical location changed {old_location} -> {location}")
+        logger.info("MockDriver: Physical location changed {} -> {}", old_location, location)
         return True
 
     def get_physical_location(self) -> str:
@@ -220,7 +237,7 @@ class MockRadarDriver(RadarDriverBase):
 
     def set_rloc_timeout(self, timeout_sec: int) -> bool:
         self._rloc_timeout = timeout_sec
-        logger.info(f"MockDriver: RLOC timeout set to {timeout_sec}s")
+        logger.info("MockDriver: RLOC timeout set to {}s", timeout_sec)
         return True
 
     @property
@@ -232,7 +249,7 @@ class MockRadarDriver(RadarDriverBase):
         return self._fw_version
 
     def set_statistics_window_size(self, fps: int = 10, latency: int = 1) -> None:
-        logger.debug(f"MockDriver: Statistics window set — fps={fps}, latency={latency}")
+        logger.debug("MockDriver: Statistics window set — fps={}, latency={}", fps, latency)
 
     def __enter__(self):
         return self
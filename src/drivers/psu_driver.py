@@ -13,17 +13,46 @@ Features:
 
 from __future__ import annotations
 
+import fcntl
 import os
+import re
 import socket
+import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, Generator, Optional
+from typing import Any, Callable, ClassVar, Dict, Generator, List, Optional, Tuple
 
 from loguru import logger
 
+from src._compat import DATACLASS_SLOTS
 
-@dataclass
+# SYST:ERR? reply, e.g. +0,"No error" or -113,"Undefined header"
+_SCPI_ERROR_REPLY_RE = re.compile(r'^[+-]?\d+,".*"$')
+# Compound measure reply: <volts>;<amps>;<output state>, e.g. +1.20000000E+01;+1.5E+00;1
+_SCPI_NUMBER = r"([-+]?\d+\.?\d*(?:[eE][-+]?\d+)?)"
+_MEAS_REPLY_RE = re.compile(rf"{_SCPI_NUMBER};{_SCPI_NUMBER};(\d)")
+
+
+def _is_query_only(command: str) -> bool:
+    """True if every part of a (compound) SCPI command is a query."""
+    return all("?" in part for part in command.split(";"))
+
+
+# Simulation-mode replies, keyed by SCPI query header
+_MOCK_RESPONSES: Dict[str, str] = {
+    "*IDN?": "Keysight Technologies,E36233A,MY12345678,1.0.0",
+    "*OPC?": "1",
+    "MEAS:VOLT?": "12.010",
+    "MEAS:CURR?": "2.350",
+    "OUTP?": "1",
+    "VOLT?": "12.000",
+    "CURR?": "10.000",
+    "SYST:ERR?": '0,"No error"',
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class PSUMeasurement:
     """PSU measurement result."""
     voltage_v: float = 0.0
@@ -43,85 +72,104 @@ class PSUConfig:
     current_limit_a: float = 10.0
     lock_file_dir: str = ""  # Directory for lock files
     lock_timeout_sec: int = 30
+    keep_socket_open: bool = True  # Reuse one SCPI socket across sessions
+    pool_socket: bool = True  # Hand idle sockets to other drivers for the same PSU
     simulate: bool = False
+    mock_cycle_delay_sec: float = 0.0  # Off-time simulated by MockPSUDriver.power_cycle
 
 
 class PSUFileLock:
     """
-    Simple file-based lock to prevent PSU command collisions.
+    Advisory file lock (flock) to prevent PSU command collisions.
 
     Two hosts share one Ethernet connection to the PSU through a dumb switch.
-    This lock ensures only one host sends SCPI commands at a time.
+    This lock ensures only one host sends SCPI commands at a time. The kernel
+    releases the lock when the holder exits, so no stale-lock cleanup is needed.
+
+    With `port` set, the lock covers a single output channel; without it,
+    it is the PSU-wide lock (taken shared by per-port sessions and
+    exclusive by instrument-global commands).
+
+    One lock object has one holder at a time: threads sharing it (e.g. a
+    PSUDriver used from several threads) wait for each other in-process,
+    since the kernel would let a second flock on the same fd through.
     """
 
-    def __init__(self, lock_dir: str, psu_ip: str, timeout_sec: int = 30) -> None:
+    POLL_INTERVAL_SEC = 0.05
+
+    def __init__(
+        self,
+        lock_dir: str,
+        psu_ip: str,
+        timeout_sec: int = 30,
+        port: Optional[int] = None,
+    ) -> None:
         self.lock_dir = lock_dir or os.path.join(os.path.expanduser("~"), ".psu_locks")
         os.makedirs(self.lock_dir, exist_ok=True)
         safe_ip = psu_ip.replace(".", "_")
+        if port is not None:
+            safe_ip = f"{safe_ip}_p{port}"
         self.lock_file = os.path.join(self.lock_dir, f"psu_{safe_ip}.lock")
         self.timeout_sec = timeout_sec
-        self._fd = None
+        self._fd: Optional[int] = None
+        # Held from acquire() to release(); guards _fd and the flock on it
+        self._holder = threading.Lock()
+
+    def acquire(self, shared: bool = False) -> bool:
+        """Acquire the PSU lock (exclusive unless `shared`). Returns True if acquired."""
+        deadline = time.monotonic() + self.timeout_sec
+        if not self._holder.acquire(timeout=self.timeout_sec):
+            logger.error(f"PSUFileLock: Timeout acquiring lock after {self.timeout_sec}s")
+            return False
+        try:
+            # A fresh fd per hold, so no other holder's flock is reused
+            self._fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            self._holder.release()
+            logger.error(f"PSUFileLock: Error opening lock file: {e}")
+            return False
 
-    def acquire(self) -> bool:
-        """Acquire the PSU lock. Returns True if acquired."""
-        start = time.time()
-        while (time.time() - start) < self.timeout_sec:
+        mode = (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | fcntl.LOCK_NB
+        while True:
             try:
-                self._fd = os.open(
-                    self.lock_file,
-                    os.O_CREAT | os.O_EXCL | os.O_WRONLY,
-                )
-                os.write(self._fd, f"{os.getpid()}\n".encode())
-                logger.debug(f"PSUFileLock: Acquired lock {self.lock_file}")
+                fcntl.flock(self._fd, mode)
+                logger.debug("PSUFileLock: Acquired lock {}", self.lock_file)
                 return True
-            except FileExistsError:
-                # Check if the holding process is still alive (stale lock)
-                if self._is_stale():
-                    self._force_release()
-                    continue
-                time.sleep(0.5)
-            except Exception as e:
+            except BlockingIOError:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(self.POLL_INTERVAL_SEC, remaining))
+            except OSError as e:
                 logger.error(f"PSUFileLock: Error acquiring lock: {e}")
-                time.sleep(1)
+                self._close_fd()
+                self._holder.release()
+                return False
+        self._close_fd()
+        self._holder.release()
         logger.error(f"PSUFileLock: Timeout acquiring lock after {self.timeout_sec}s")
         return False
 
     def release(self) -> None:
         """Release the PSU lock."""
+        if self._fd is None:
+            return
         try:
-            if self._fd is not None:
-                os.close(self._fd)
-                self._fd = None
-            if os.path.exists(self.lock_file):
-                os.remove(self.lock_file)
-                logger.debug(f"PSUFileLock: Released lock {self.lock_file}")
-        except Exception as e:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            logger.debug("PSUFileLock: Released lock {}", self.lock_file)
+        except OSError as e:
             logger.warning(f"PSUFileLock: Error releasing lock: {e}")
+        finally:
+            self._close_fd()
+            self._holder.release()
 
-    def _is_stale(self) -> bool:
-        """Check if an existing lock file is from a dead process."""
-        try:
-            with open(self.lock_file, "r") as f:
-                pid_str = f.read().strip()
-            if not pid_str:
-                return True
-            pid = int(pid_str)
-            # Check if process is still running
+    def _close_fd(self) -> None:
+        if self._fd is not None:
             try:
-                os.kill(pid, 0)
-                return False  # Process is alive
-            except (ProcessLookupError, PermissionError):
-                return True  # Process is dead
-        except Exception:
-            return True
-
-    def _force_release(self) -> None:
-        """Force-release a stale lock."""
-        try:
-            os.remove(self.lock_file)
-            logger.warning(f"PSUFileLock: Force-released stale lock {self.lock_file}")
-        except Exception:
-            pass
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
 
 
 class PSUDriver:
@@ -130,6 +178,14 @@ class PSUDriver:
 
     Uses SCPI commands over TCP/IP to control the PSU.
     Includes file-based locking for shared Ethernet access.
+
+    The SCPI socket is opened on the first command and kept open across
+    sessions (unless `keep_socket_open` is False); call `close()` when done.
+
+    With `pool_socket` enabled, a released socket is parked in a process-wide
+    pool keyed by (ip, scpi_port) instead of being closed, so the next driver
+    instance for the same PSU (e.g. the other port) picks it up without a
+    new TCP connect. Call `close_all_pooled()` at teardown.
     """
 
     # Keysight E36233A specs
@@ -137,58 +193,137 @@ class PSUDriver:
     MAX_CURRENT = 20.0
     DEFAULT_RADAR_VOLTAGE = 12.0
     DEFAULT_RADAR_CURRENT_LIMIT = 10.0
+    RECV_CHUNK_SIZE = 512
+    SOCKET_BUFFER_SIZE = 32768
+    # Detect a half-open connection after ~5s idle + 3 probes 2s apart
+    KEEPALIVE_IDLE_SEC = 5
+    KEEPALIVE_INTERVAL_SEC = 2
+    KEEPALIVE_PROBES = 3
+
+    # Idle SCPI sockets shared by all instances in the process
+    _socket_pool: ClassVar[Dict[Tuple[str, int], socket.socket]] = {}
+    _pool_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self, config: PSUConfig) -> None:
         self.config = config
         self._socket: Optional[socket.socket] = None
         self._connected = False
+        self._rx = bytearray()  # Bytes received but not yet consumed as a reply
+        self._rx_chunk = bytearray(self.RECV_CHUNK_SIZE)
+        self._global_lock = PSUFileLock(
+            config.lock_file_dir,
+            config.ip,
+            config.lock_timeout_sec,
+        )
         self._lock = PSUFileLock(
             config.lock_file_dir,
             config.ip,
             config.lock_timeout_sec,
+            port=config.port,
         )
         self._simulate = config.simulate
+        self._reuse = config.pool_socket
+        self._pool_key = (config.ip, config.scpi_port)
+        # The output port is fixed for the driver's lifetime — build the
+        # channel selector and the constant per-port commands once.
+        self._ch = f"(@{config.port})"
+        self._outp_query = f"OUTP? {self._ch}"
+        self._outp_off_cmd = f"OUTP OFF,{self._ch};*OPC?"
+        self._meas_query = (
+            f"MEAS:VOLT? {self._ch};:MEAS:CURR? {self._ch};:OUTP? {self._ch}"
+        )
         logger.info(
             f"PSUDriver initialized — IP={config.ip}, Port={config.port}, "
             f"Simulate={config.simulate}"
         )
 
     @contextmanager
-    def _scpi_session(self) -> Generator[None, None, None]:
+    def _scpi_session(self, instrument_wide: bool = False) -> Generator[None, None, None]:
         """
         Context manager for SCPI communication with PSU lock.
-        Acquires the file lock, opens socket, yields, then cleans up.
+        Acquires the file locks, ensures the socket is open, yields, then
+        releases the locks. The socket is dropped only on error (or when
+        `keep_socket_open` is disabled).
+
+        Per-port sessions hold the PSU-wide lock shared plus this port's lock,
+        so the two outputs can be driven in parallel. `instrument_wide`
+        sessions (e.g. *IDN?, SYST:ERR?) hold the PSU-wide lock exclusively.
+        Locks are always taken PSU-wide first, then per-port.
         """
         if self._simulate:
             yield
             return
 
-        if not self._lock.acquire():
-            raise TimeoutError(
-                f"Could not acquire PSU lock for {self.config.ip} "
-                f"within {self.config.lock_timeout_sec}s"
-            )
+        held = self._acquire_locks(instrument_wide)
         try:
-            self._open_socket()
+            if self._socket is None:
+                self._open_socket()
             yield
-        finally:
+        except Exception:
             self._close_socket()
-            self._lock.release()
+            raise
+        finally:
+            if not self.config.keep_socket_open:
+                self._release_socket()
+            for lock in reversed(held):
+                lock.release()
+
+    def _acquire_locks(self, instrument_wide: bool) -> List[PSUFileLock]:
+        """Take the PSU-wide lock, then (for per-port sessions) the port lock."""
+        wanted = [(self._global_lock, not instrument_wide)]
+        if not instrument_wide:
+            wanted.append((self._lock, False))
+        held: List[PSUFileLock] = []
+        for lock, shared in wanted:
+            if not lock.acquire(shared=shared):
+                for acquired in reversed(held):
+                    acquired.release()
+                raise TimeoutError(
+                    f"Could not acquire PSU lock for {self.config.ip} "
+                    f"within {self.config.lock_timeout_sec}s"
+                )
+            held.append(lock)
+        return held
 
     def _open_socket(self) -> None:
-        """Open TCP socket to PSU."""
+        """Open TCP socket to PSU (or take an idle one from the pool)."""
         if self._simulate:
             return
+        if self._reuse:
+            with self._pool_lock:
+                pooled = self._socket_pool.pop(self._pool_key, None)
+            if pooled is not None:
+                self._socket = pooled
+                self._connected = True
+                logger.debug("PSU socket to {}:{} taken from pool", *self._pool_key)
+                return
         try:
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._configure_socket(self._socket)
             self._socket.settimeout(10)
             self._socket.connect((self.config.ip, self.config.scpi_port))
             self._connected = True
-            logger.debug(f"PSU socket connected to {self.config.ip}:{self.config.scpi_port}")
+            logger.debug("PSU socket connected to {}:{}", self.config.ip, self.config.scpi_port)
         except Exception as e:
             logger.error(f"PSU socket connection failed: {e}")
             raise
 
+    def _configure_socket(self, sock: socket.socket) -> None:
+        """Set Nagle off, TCP keepalive and modest buffers on a new PSU socket."""
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Keepalive timing knobs are Linux names; not all platforms expose them
+        for name, value in (
+            ("TCP_KEEPIDLE", self.KEEPALIVE_IDLE_SEC),
+            ("TCP_KEEPINTVL", self.KEEPALIVE_INTERVAL_SEC),
+            ("TCP_KEEPCNT", self.KEEPALIVE_PROBES),
+        ):
+            option = getattr(socket, name, None)
+            if option is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, option, value)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.SOCKET_BUFFER_SIZE)
+
     def _close_socket(self) -> None:
         """Close TCP socket."""
         if self._socket:
@@ -198,74 +333,132 @@ class PSUDriver:
                 pass
             self._socket = None
             self._connected = False
+        self._rx.clear()
+
+    def _release_socket(self) -> None:
+        """Park a healthy socket in the pool, or close it if pooling is off."""
+        # Unconsumed reply bytes mean the stream is out of step — don't share it
+        if not self._reuse or self._socket is None or self._rx:
+            self._close_socket()
+            return
+        with self._pool_lock:
+            displaced = self._socket_pool.get(self._pool_key)
+            self._socket_pool[self._pool_key] = self._socket
+        if displaced is not None:
+            displaced.close()
+        self._socket = None
+        self._connected = False
+
+    def close(self) -> None:
+        """Release the persistent SCPI socket (reopened on the next command)."""
+        self._release_socket()
+
+    @classmethod
+    def close_all_pooled(cls) -> None:
+        """Close every idle pooled socket (call at process/test-session teardown)."""
+        with cls._pool_lock:
+            pooled = list(cls._socket_pool.values())
+            cls._socket_pool.clear()
+        for sock in pooled:
+            try:
+                sock.close()
+            except OSError:
+                pass
 
     def _send_scpi(self, command: str) -> str:
         """Send a SCPI command and return the response (if query)."""
         if self._simulate:
             return self._mock_scpi_response(command)
 
+        try:
+            return self._transact(command)
+        except (ConnectionError, socket.timeout) as e:
+            self._close_socket()
+            if not _is_query_only(command):
+                # The instrument may already have applied the setting before
+                # the failure, so a blind re-send could apply it twice; the
+                # next session reconnects
+                logger.warning(f"PSU socket error ({e}) on a set command — not re-sending")
+                raise
+            logger.warning(f"PSU socket error ({e}) — reconnecting and retrying query once")
+            self._open_socket()
+            return self._transact(command)
+
+    def _transact(self, command: str) -> str:
+        """Write one SCPI command on the open socket and read its reply."""
         if not self._socket:
             raise ConnectionError("PSU socket not connected")
 
-        cmd_bytes = (command.strip() + "\n").encode()
-        self._socket.sendall(cmd_bytes)
-        logger.debug(f"PSU SCPI >> {command.strip()}")
+        command = command.strip()
+        self._socket.sendall((command + "\n").encode())
+        logger.debug("PSU SCPI >> {}", command)
 
         if "?" in command:
-            response = self._socket.recv(4096).decode().strip()
-            logger.debug(f"PSU SCPI << {response}")
+            response = self._read_line()
+            logger.debug("PSU SCPI << {}", response)
             return response
         return ""
 
+    def _read_line(self) -> str:
+        """Read one newline-terminated SCPI reply, keeping any excess bytes."""
+        chunk = memoryview(self._rx_chunk)
+        while True:
+            end = self._rx.find(b"\n")
+            if end >= 0:
+                line = self._rx[:end]
+                del self._rx[:end + 1]
+                return line.decode().strip()
+            received = self._socket.recv_into(chunk)
+            if not received:
+                raise ConnectionError("PSU closed the SCPI connection")
+            self._rx += chunk[:received]
+
     def _mock_scpi_response(self, command: str) -> str:
         """Generate mock SCPI responses for simulation mode."""
-        cmd = command.strip().upper()
-        if "*IDN?" in cmd:
-            return "Keysight Technologies,E36233A,MY12345678,1.0.0"
-        if "MEAS:VOLT?" in cmd:
-            return "12.010"
-        if "MEAS:CURR?" in cmd:
-            return "2.350"
-        if "OUTP?" in cmd:
-            return "1"
-        if "VOLT?" in cmd:
-            return "12.000"
-        if "CURR?" in cmd:
-            return "10.000"
-        if "SYST:ERR?" in cmd:
-            return '0,"No error"'
-        return ""
+        # Compound commands answer each query part, joined by ";" (as the PSU does)
+        replies = [
+            self._mock_query_response(part)
+            for part in command.strip().upper().split(";")
+            if "?" in part
+        ]
+        return ";".join(replies)
+
+    def _mock_query_response(self, cmd: str) -> str:
+        """Mock reply for a single SCPI query, looked up by its header."""
+        header = cmd.strip().lstrip(":").split(" ", 1)[0].split(",", 1)[0]
+        return _MOCK_RESPONSES.get(header, "")
 
     @property
     def channel_prefix(self) -> str:
         """SCPI channel selector prefix for the configured port."""
-        return f"(@{self.config.port})"
+        return self._ch
 
     def identify(self) -> str:
         """Query PSU identity (*IDN?)."""
-        with self._scpi_session():
-            return self._send_scpi("*IDN?")
+        return self._observe("*IDN?", lambda reply: reply.count(",") == 3)
 
     def power_on(self) -> bool:
         """
         Enable output on the configured port with safe voltage/current.
 
-        Sequence:
+        Sequence (sent as one SCPI compound command):
         1. Set voltage to configured value (default 12V)
         2. Set current limit (default 10A)
         3. Enable output
+        4. Wait for completion (*OPC?)
         """
         logger.info(f"PSU: Powering ON port {self.config.port} "
                      f"({self.config.voltage_v}V / {self.config.current_limit_a}A)")
         with self._scpi_session():
-            ch = self.channel_prefix
-            self._send_scpi(f"VOLT {self.config.voltage_v},{ch}")
-            self._send_scpi(f"CURR {self.config.current_limit_a},{ch}")
-            self._send_scpi(f"OUTP ON,{ch}")
+            ch = self._ch
+            self._send_scpi(
+                f"VOLT {self.config.voltage_v},{ch};"
+                f":CURR {self.config.current_limit_a},{ch};"
+                f":OUTP ON,{ch};*OPC?"
+            )
 
             # Verify
-            time.sleep(0.2)
-            state = self._send_scpi(f"OUTP? {ch}")
+            state = self._send_scpi(self._outp_query)
             if state.strip() in ("1", "ON"):
                 logger.info(f"PSU: Port {self.config.port} is ON")
                 return True
@@ -276,11 +469,9 @@ class PSUDriver:
         """Disable output on the configured port."""
         logger.info(f"PSU: Powering OFF port {self.config.port}")
         with self._scpi_session():
-            ch = self.channel_prefix
-            self._send_scpi(f"OUTP OFF,{ch}")
+            self._send_scpi(self._outp_off_cmd)
 
-            time.sleep(0.2)
-            state = self._send_scpi(f"OUTP? {ch}")
+            state = self._send_scpi(self._outp_query)
             if state.strip() in ("0", "OFF"):
                 logger.info(f"PSU: Port {self.config.port} is OFF")
                 return True
@@ -288,17 +479,19 @@ class PSUDriver:
             return False
 
     def measure(self) -> PSUMeasurement:
-        """Measure voltage, current, and power on the configured port."""
+        """Measure voltage, current, and power on the configured port (one round trip)."""
         with self._scpi_session():
-            ch = self.channel_prefix
-            voltage = float(self._send_scpi(f"MEAS:VOLT? {ch}"))
-            current = float(self._send_scpi(f"MEAS:CURR? {ch}"))
-            state = self._send_scpi(f"OUTP? {ch}")
+            reply = self._send_scpi(self._meas_query)
+            match = _MEAS_REPLY_RE.match(reply)
+            if match is None:
+                raise ValueError(f"PSU: Unexpected measure reply: {reply!r}")
+            voltage = float(match.group(1))
+            current = float(match.group(2))
             return PSUMeasurement(
                 voltage_v=voltage,
                 current_a=current,
                 power_w=round(voltage * current, 3),
-                output_enabled=state.strip() in ("1", "ON"),
+                output_enabled=match.group(3) == "1",
                 port=self.config.port,
             )
 
@@ -308,7 +501,7 @@ class PSUDriver:
             logger.error(f"PSU: Voltage {voltage_v}V out of range [0, {self.MAX_VOLTAGE}]")
             return False
         with self._scpi_session():
-            self._send_scpi(f"VOLT {voltage_v},{self.channel_prefix}")
+            self._send_scpi(f"VOLT {voltage_v},{self._ch}")
             return True
 
     def set_current_limit(self, current_a: float) -> bool:
@@ -317,13 +510,32 @@ class PSUDriver:
             logger.error(f"PSU: Current {current_a}A out of range [0, {self.MAX_CURRENT}]")
             return False
         with self._scpi_session():
-            self._send_scpi(f"CURR {current_a},{self.channel_prefix}")
+            self._send_scpi(f"CURR {current_a},{self._ch}")
             return True
 
     def check_errors(self) -> str:
         """Query system error queue."""
-        with self._scpi_session():
-            return self._send_scpi("SYST:ERR?")
+        return self._observe("SYST:ERR?", _SCPI_ERROR_REPLY_RE.match)
+
+    def _observe(self, query: str, is_valid: Callable[[str], Any]) -> str:
+        """
+        Run a read-only instrument-wide query, optimistically without locks.
+
+        If the socket is already open the query is sent directly; on a socket
+        error or a reply that does not look like an answer to `query`, the
+        socket is dropped and the query is retried under the PSU-wide lock.
+        """
+        if not self._simulate and self._socket is not None:
+            try:
+                reply = self._transact(query)
+                if is_valid(reply):
+                    return reply
+                logger.debug("PSU: Unexpected reply to {} ({!r}) — retrying locked", query, reply)
+            except OSError as e:
+                logger.debug("PSU: Lock-free {} failed ({}) — retrying locked", query, e)
+            self._close_socket()
+        with self._scpi_session(instrument_wide=True):
+            return self._send_scpi(query)
 
     def power_cycle(self, off_duration_sec: float = 5.0) -> bool:
         """
@@ -396,7 +608,8 @@ class MockPSUDriver(PSUDriver):
     def power_cycle(self, off_duration_sec: float = 5.0) -> bool:
         logger.info(f"MockPSU: Power cycle port {self.config.port} (off={off_duration_sec}s)")
         self._output_on = False
-        time.sleep(min(off_duration_sec, 0.1))  # Short wait in mock
+        if self.config.mock_cycle_delay_sec > 0:
+            time.sleep(min(off_duration_sec, self.config.mock_cycle_delay_sec))
         self._output_on = True
         return True
 
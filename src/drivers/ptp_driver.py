@@ -12,8 +12,8 @@ PTP configuration (ptp.txt):
     logAnnounceInterval -2
     logMinDelayReqInterval -2
 
-Command:
-    echo "$password" | sudo -S ptp4l -f ptp.txt -E2 -m -H -l 6 -i $eth
+Command (password fed to sudo on stdin, no shell involved):
+    sudo -S ptp4l -f ptp.txt -E -2 -m -H -l 6 -i $eth
 
 Note: In the future, this will transition to gPTP and the command
 structure will need to change accordingly.
@@ -22,15 +22,27 @@ structure will need to change accordingly.
 from __future__ import annotations
 
 import os
+import re
 import subprocess
+import threading
 import time
 from dataclasses import dataclass
 from typing import Optional
 
 from loguru import logger
 
+from src._compat import DATACLASS_SLOTS
 
-@dataclass
+# ptp4l -m output, e.g.:
+#   ptp4l[812.301]: port 1: UNCALIBRATED to SLAVE on MASTER_CLOCK_SELECTED
+#   ptp4l[813.302]: master offset         -5 s2 freq   -1234 path delay       250
+#   ptp4l[814.303]: rms   12 max   25 freq -1234 +/-   5 delay   250 +/-   1
+_PORT_STATE_RE = re.compile(r"port \d+: (\w+) to (\w+)")
+_OFFSET_RE = re.compile(r"master offset\s+(-?\d+)\s+s\d\s+freq\s+[-+]?\d+\s+path delay\s+(-?\d+)")
+_RMS_RE = re.compile(r"rms\s+(\d+)\s+max\s+\d+.*?(?:delay\s+(\d+))?\s*(?:\+/-\s+\d+)?$")
+
+
+@dataclass(**DATACLASS_SLOTS)
 class PTPStatus:
     """PTP synchronization status."""
     running: bool = False
@@ -78,13 +90,23 @@ class PTPDriver:
         self._synced = False
         self._start_time = 0.0
         self._simulate = config.simulate
+        self._sync_event = threading.Event()
+        self._reader: Optional[threading.Thread] = None
+        self._port_state = ""
+        self._offset_ns = 0.0
+        self._delay_ns = 0.0
         logger.info(
             f"PTPDriver initialized — interface={config.interface}, "
             f"domain={config.domain}, simulate={config.simulate}"
         )
 
     def _generate_config_file(self) -> str:
-        """Generate ptp.txt configuration file and return its path."""
+        """
+        Generate ptp.txt configuration file and return its path.
+
+        The file is left untouched when its content is already current;
+        otherwise it is written to a temp file and atomically swapped in.
+        """
         config_content = (
             "[global]\n"
             f"domainNumber {self.config.domain}\n"
@@ -94,8 +116,19 @@ class PTPDriver:
             f"logMinDelayReqInterval {self.config.log_min_delay_req_interval}\n"
         )
         config_path = os.path.abspath(self.config.config_file)
-        with open(config_path, "w") as f:
-            f.write(config_content)
+        new_content = config_content.encode()
+        try:
+            with open(config_path, "rb") as f:
+                if f.read() == new_content:
+                    logger.info(f"PTP config file unchanged: {config_path}")
+                    return config_path
+        except FileNotFoundError:
+            pass
+
+        tmp_path = config_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(new_content)
+        os.replace(tmp_path, config_path)
         logger.info(f"PTP config file written: {config_path}")
         return config_path
 
@@ -104,7 +137,7 @@ class PTPDriver:
         Start ptp4l synchronization.
 
         Command:
-            echo "$password" | sudo -S ptp4l -f ptp.txt -E2 -m -H -l 6 -i $eth
+            sudo -S ptp4l -f ptp.txt -E -2 -m -H -l 6 -i $eth
         """
         if self._running:
             logger.warning("PTPDriver: ptp4l already running")
@@ -119,19 +152,26 @@ class PTPDriver:
 
         try:
             config_path = self._generate_config_file()
-            cmd = (
-                f'echo "{self.config.password}" | sudo -S '
-                f'ptp4l -f {config_path} -E2 -m -H -l 6 -i {self.config.interface}'
-            )
+            cmd = [
+                "sudo", "-S",
+                "ptp4l", "-f", config_path, "-E", "-2", "-m", "-H", "-l", "6",
+                "-i", self.config.interface,
+            ]
             logger.info(f"PTPDriver: Starting ptp4l on {self.config.interface}")
             self._process = subprocess.Popen(
                 cmd,
-                shell=True,
+                stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=1,
+                text=True,
             )
+            self._process.stdin.write(self.config.password + "\n")
+            self._process.stdin.flush()
+            self._process.stdin.close()
             self._running = True
             self._start_time = time.time()
+            self._start_output_reader()
 
             # Wait for synchronization
             if self._wait_for_sync():
@@ -167,6 +207,9 @@ class PTPDriver:
                 return False
             finally:
                 self._process = None
+        if self._reader is not None:
+            self._reader.join(timeout=1)
+            self._reader = None
         self._running = False
         self._synced = False
         return True
@@ -186,23 +229,62 @@ class PTPDriver:
         if not self._running or not self._process:
             return PTPStatus(running=False)
 
-        # In a real implementation, we'd parse ptp4l output
         return PTPStatus(
             running=self._process.poll() is None,
             synced=self._synced,
-            state="SLAVE" if self._synced else "LISTENING",
+            offset_ns=self._offset_ns,
+            delay_ns=self._delay_ns,
+            state=self._port_state or "LISTENING",
+            port_state=self._port_state,
             uptime_sec=int(time.time() - self._start_time),
         )
 
+    def _start_output_reader(self) -> None:
+        """Consume ptp4l output on a daemon thread (keeps the pipe drained)."""
+        self._sync_event.clear()
+        self._port_state = ""
+        self._reader = threading.Thread(
+            target=self._read_output,
+            args=(self._process.stdout,),
+            name="ptp4l-reader",
+            daemon=True,
+        )
+        self._reader.start()
+
+    def _read_output(self, stream) -> None:
+        for line in stream:
+            self._handle_output_line(line)
+        # EOF — ptp4l exited; wake any waiter so it can report the failure
+        self._sync_event.set()
+
+    def _handle_output_line(self, line: str) -> None:
+        """Update port state / offset / delay from one line of ptp4l output."""
+        match = _PORT_STATE_RE.search(line)
+        if match:
+            self._port_state = match.group(2)
+            self._synced = self._port_state == "SLAVE"
+            logger.debug(f"PTPDriver: port state {match.group(1)} -> {match.group(2)}")
+            if self._synced:
+                self._sync_event.set()
+            return
+        match = _OFFSET_RE.search(line)
+        if match:
+            self._offset_ns = float(match.group(1))
+            self._delay_ns = float(match.group(2))
+            return
+        match = _RMS_RE.search(line)
+        if match:
+            self._offset_ns = float(match.group(1))
+            if match.group(2):
+                self._delay_ns = float(match.group(2))
+
     def _wait_for_sync(self) -> bool:
-        """Wait for ptp4l to reach SLAVE state."""
-        start = time.time()
-        while (time.time() - start) < self.config.sync_timeout_sec:
-            if self._process and self._process.poll() is not None:
-                logger.error("PTPDriver: ptp4l process terminated unexpectedly")
-                return False
-            # In real implementation: parse ptp4l stdout for "SLAVE" state
-            time.sleep(1)
+        """Wait for ptp4l to report the SLAVE port state."""
+        if not self._sync_event.wait(timeout=self.config.sync_timeout_sec):
+            return False
+        if self._port_state == "SLAVE":
+            return True
+        logger.error("PTPDriver: ptp4l process terminated unexpectedly")
         return False
 
     @property
@@ -10,10 +10,20 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
+from src._compat import DATACLASS_SLOTS
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 
 class ConnectStatus(Enum):
     """Connection status codes aligned with bsr_apis/hrr_apis."""
@@ -26,6 +36,16 @@ class ConnectStatus(Enum):
     TIMEOUT = "TIMEOUT"
 
 
+# Member aliases for the connect paths: drivers load these as plain module
+# globals rather than resolving ConnectStatus.<member> on every call.
+STATUS_OK = ConnectStatus.OK
+STATUS_NO_PING = ConnectStatus.NO_PING
+STATUS_GENERAL_ERROR = ConnectStatus.GENERAL_ERROR
+
+# Vendor API status name -> ConnectStatus (bsr_apis uses the same member names)
+CONNECT_STATUS_BY_NAME: Dict[str, ConnectStatus] = dict(ConnectStatus.__members__)
+
+
 @dataclass
 class ConnectResponse:
     """Response from a radar connection attempt."""
@@ -36,7 +56,7 @@ class ConnectResponse:
     physical_location: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class HeartbeatData:
     """Parsed heartbeat data from the radar."""
     beat_id: int = 0
@@ -52,7 +72,7 @@ class HeartbeatData:
     uptime_sec: int = 0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DetectionData:
     """Single radar detection."""
     distance: float = 0.0
@@ -64,8 +84,29 @@ class DetectionData:
     y: float = 0.0
     z: float = 0.0
 
-
-@dataclass
+    def to_display_dict(self) -> Dict[str, float]:
+        """Serialize the detection, rounded for logs and reports."""
+        return {
+            name: round(getattr(self, name), digits)
+            for name, digits in _DETECTION_DISPLAY_DIGITS.items()
+        }
+
+
+# Display precision per DetectionData field (rounding happens at serialization,
+# not on the acquisition path).
+_DETECTION_DISPLAY_DIGITS: Dict[str, int] = {
+    "distance": 3,
+    "azimuth": 4,
+    "elevation": 4,
+    "velocity": 2,
+    "rcs": 1,
+    "x": 2,
+    "y": 2,
+    "z": 2,
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class PointCloudFrame:
     """A single frame of radar detections (PC1/SODA)."""
     cycle_count: int = 0
@@ -75,8 +116,69 @@ class PointCloudFrame:
     detections: List[DetectionData] = field(default_factory=list)
     latency_ms: float = 0.0
 
+    @classmethod
+    def preallocated(cls, n: int) -> PointCloudFrame:
+        """
+        Frame with `n` default detections, for drivers to fill in place.
 
-@dataclass
+        Assigning fields on existing detections is cheaper than building each
+        DetectionData with keyword arguments and appending it.
+        """
+        return cls(valid_detections=n, detections=[DetectionData() for _ in range(n)])
+
+
+# Per-detection columns of PointCloudFrameSoA, in DetectionData field order
+SOA_COLUMNS = ("distance", "azimuth", "elevation", "velocity", "rcs", "x", "y", "z")
+_detection_row = attrgetter(*SOA_COLUMNS)
+
+
+def _empty_column() -> "np.ndarray":
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy is required for PointCloudFrameSoA")
+    return np.empty(0, dtype=np.float32)
+
+
+@dataclass(**DATACLASS_SLOTS)
+class PointCloudFrameSoA:
+    """
+    A frame of radar detections stored column-wise (structure of arrays).
+
+    Each detection field is one contiguous float32 array of length
+    `valid_detections`, so analytics run as vectorized NumPy operations.
+    """
+    cycle_count: int = 0
+    timestamp_sec: int = 0
+    timestamp_nsec: int = 0
+    valid_detections: int = 0
+    distance: "np.ndarray" = field(default_factory=_empty_column)
+    azimuth: "np.ndarray" = field(default_factory=_empty_column)
+    elevation: "np.ndarray" = field(default_factory=_empty_column)
+    velocity: "np.ndarray" = field(default_factory=_empty_column)
+    rcs: "np.ndarray" = field(default_factory=_empty_column)
+    x: "np.ndarray" = field(default_factory=_empty_column)
+    y: "np.ndarray" = field(default_factory=_empty_column)
+    z: "np.ndarray" = field(default_factory=_empty_column)
+    latency_ms: float = 0.0
+
+
+def as_soa(frame: PointCloudFrame) -> PointCloudFrameSoA:
+    """Convert a PointCloudFrame (list of detections) to column layout."""
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy is required for PointCloudFrameSoA")
+    rows = list(map(_detection_row, frame.detections))
+    # (n, 8) row table -> (8, n) so that every column is a contiguous row
+    table = np.array(rows, dtype=np.float32).reshape(len(rows), len(SOA_COLUMNS)).T.copy()
+    return PointCloudFrameSoA(
+        cycle_count=frame.cycle_count,
+        timestamp_sec=frame.timestamp_sec,
+        timestamp_nsec=frame.timestamp_nsec,
+        valid_detections=frame.valid_detections,
+        latency_ms=frame.latency_ms,
+        **dict(zip(SOA_COLUMNS, table)),
+    )
+
+
+@dataclass(**DATACLASS_SLOTS)
 class StatisticsData:
     """Runtime statistics from the radar."""
     fps_current: float = 0.0
@@ -98,6 +200,8 @@ class RadarDriverBase(ABC):
     so that tests can run against any radar type transparently.
     """
 
+    __slots__ = ("ip", "radar_type", "is_hrr", "password", "_connected")
+
     def __init__(
         self,
         ip: str,
@@ -110,7 +214,7 @@ class RadarDriverBase(ABC):
         self.is_hrr = is_hrr
         self.password = password
         self._connected = False
-        logger.info(f"RadarDriver [{radar_type}] initialized — IP={ip}")
+        logger.info("RadarDriver [{}] initialized — IP={}", radar_type, ip)
 
     @property
     def is_connected(self) -> bool:
@@ -141,6 +245,18 @@ class RadarDriverBase(ABC):
         """Get a point cloud / SODA frame from the radar."""
         ...
 
+    def get_point_cloud_soa(self, timeout: int = 5) -> Optional[PointCloudFrameSoA]:
+        """
+        Get a point cloud / SODA frame in column (SoA) layout.
+
+        Default implementation converts `get_point_cloud()`; drivers may
+        override to parse straight into arrays.
+        """
+        frame = self.get_point_cloud(timeout=timeout)
+        if frame is None:
+            return None
+        return as_soa(frame)
+
     @abstractmethod
     def get_statistics(self) -> StatisticsData:
         """Get runtime statistics (FPS, latency, drops)."""
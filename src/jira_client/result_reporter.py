@@ -13,16 +13,42 @@ a detailed report (Allure/HTML)."
 from __future__ import annotations
 
 import json
-import xml.etree.ElementTree as ET
+import os
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Set
+from xml.sax.saxutils import escape, quoteattr
 
 from loguru import logger
 
+from src._compat import DATACLASS_SLOTS
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(payload: Any, pretty: bool = False) -> bytes:
+    """Serialize a report payload to UTF-8 JSON (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else None, default=str)
+    if pretty:
+        return json.dumps(payload, indent=2, default=str).encode("utf-8")
+    return json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _write_report(output_path: str, data: bytes) -> Path:
+    """Write an encoded report in one buffered write and return its path."""
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        f.write(data)
+    return Path(output_path)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TestResult:
     """
     Result of a single test execution for Xray reporting.
@@ -38,6 +64,9 @@ class TestResult:
         end_time: When the test finished.
         error_message: Error message if the test failed.
         traceback: Full error traceback if available.
+
+    The Xray JSON is built on first export and cached; change fields after
+    construction through update() so the next export rebuilds it.
     """
 
     test_id: str
@@ -51,47 +80,92 @@ class TestResult:
     error_message: str = ""
     traceback: str = ""
 
+    # Xray JSON for this result, built on first export; None until then
+    _xray_template: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Report this result was last added to, told about status/duration updates
+    _report: Optional["ExecutionReport"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     # Xray-compatible status values
-    VALID_STATUSES = {"PASS", "FAIL", "TODO", "EXECUTING", "ABORTED"}
+    VALID_STATUSES: ClassVar[Set[str]] = {"PASS", "FAIL", "TODO", "EXECUTING", "ABORTED"}
 
     def __post_init__(self) -> None:
         """Validate the status value."""
-        self.status = self.status.upper()
-        if self.status not in self.VALID_STATUSES:
+        self.status = self._canonical_status(self.status)
+
+    def _canonical_status(self, status: str) -> str:
+        status = status.upper()
+        canonical = _STATUS_INTERN.get(status)
+        if canonical is None:
             logger.warning(
-                f"Invalid test result status '{self.status}' for {self.test_id}, "
+                f"Invalid test result status '{status}' for {self.test_id}, "
                 f"defaulting to 'TODO'. Valid: {self.VALID_STATUSES}"
             )
-            self.status = "TODO"
+            canonical = "TODO"
+        return canonical
 
-    def to_xray_dict(self) -> Dict[str, Any]:
-        """Convert to Xray JSON format for a single test."""
-        result: Dict[str, Any] = {
-            "testKey": self.test_id,
-            "status": self.status,
-        }
-        if self.comment:
-            result["comment"] = self.comment
-        if self.start_time:
-            result["start"] = self.start_time.isoformat()
-        if self.end_time:
-            result["finish"] = self.end_time.isoformat()
-        if self.defects:
-            result["defects"] = self.defects
+    def update(self, **changes: Any) -> None:
+        """
+        Change fields after construction (e.g. EXECUTING -> PASS).
+
+        Use this rather than assigning fields directly, so the cached Xray
+        JSON is rebuilt on the next export and the tallies of the report the
+        result was last added to stay correct.
+
+        Args:
+            **changes: Field names and their new values.
+        """
+        if "status" in changes:
+            changes["status"] = self._canonical_status(changes["status"])
+        old_status, old_duration = self.status, self.duration_sec
+        for name, value in changes.items():
+            setattr(self, name, value)
+        self._xray_template = None
+        if self._report is not None and not _TALLIED_FIELDS.isdisjoint(changes):
+            self._report._result_changed(self, old_status, old_duration)
+
+    def _xray_payload(self) -> Dict[str, Any]:
+        """Xray JSON for this result, shared with the cache; callers must not modify it."""
+        if self._xray_template is not None:
+            return self._xray_template
+        template: Dict[str, Any] = {"testKey": self.test_id, "status": self.status}
         if self.error_message:
-            result["comment"] = (
+            template["comment"] = (
                 f"{self.comment}\n\nError: {self.error_message}" if self.comment
                 else f"Error: {self.error_message}"
             )
+        elif self.comment:
+            template["comment"] = self.comment
+        if self.start_time:
+            template["start"] = self.start_time.isoformat()
+        if self.end_time:
+            template["finish"] = self.end_time.isoformat()
+        if self.defects:
+            template["defects"] = list(self.defects)
         if self.evidence:
-            result["evidences"] = [
-                {"filename": Path(e).name, "data": "(attached)"}
+            template["evidences"] = [
+                {"filename": os.path.basename(e), "data": "(attached)"}
                 for e in self.evidence
             ]
-        return result
+        self._xray_template = template
+        return template
 
+    def to_xray_dict(self) -> Dict[str, Any]:
+        """Convert to Xray JSON format for a single test (a copy the caller may modify)."""
+        return dict(self._xray_payload())
 
-@dataclass
+
+# TestResult fields that ExecutionReport tallies
+_TALLIED_FIELDS = frozenset({"status", "duration_sec"})
+
+# Upper-cased status -> the canonical status string (validates and interns in one lookup)
+_STATUS_INTERN: Dict[str, str] = {s: s for s in TestResult.VALID_STATUSES}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ExecutionReport:
     """
     Complete test execution report for Xray.
@@ -121,29 +195,88 @@ class ExecutionReport:
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
 
+    # Running status tallies, kept in step with `results` by add_result and
+    # adjusted by TestResult.update
+    _pass_count: int = field(default=0, init=False, repr=False, compare=False)
+    _fail_count: int = field(default=0, init=False, repr=False, compare=False)
+    _duration_sec: float = field(default=0.0, init=False, repr=False, compare=False)
+    _counted: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Count any results passed in at construction."""
+        self._recount()
+
+    def _recount(self) -> None:
+        self._pass_count = self._fail_count = self._counted = 0
+        self._duration_sec = 0.0
+        for result in self.results:
+            self._count(result)
+
+    def _sync(self) -> None:
+        """Recount if `results` was changed without add_result/extend_results."""
+        if self._counted != len(self.results):
+            self._recount()
+
+    def _count(self, result: TestResult) -> None:
+        self._counted += 1
+        self._tally(result.status, result.duration_sec, 1)
+        result._report = self
+
+    def _tally(self, status: str, duration_sec: float, n: int) -> None:
+        self._duration_sec += n * duration_sec
+        if status == "PASS":
+            self._pass_count += n
+        elif status == "FAIL":
+            self._fail_count += n
+
+    def _result_changed(self, result: TestResult, old_status: str, old_duration: float) -> None:
+        """Move an updated result's contribution from its old values to its new ones."""
+        if self._counted != len(self.results):
+            return  # the next read recounts everything anyway
+        self._tally(old_status, old_duration, -1)
+        self._tally(result.status, result.duration_sec, 1)
+
     def add_result(self, result: TestResult) -> None:
         """Add a test result to the execution report."""
         self.results.append(result)
+        self._count(result)
+
+    def extend_results(self, results: Iterable[TestResult]) -> int:
+        """Add a batch of test results; returns how many were added."""
+        batch = list(results)
+        self.results.extend(batch)
+        for result in batch:
+            self._count(result)
+        return len(batch)
 
     @property
     def total_tests(self) -> int:
         """Total number of test results."""
         return len(self.results)
 
+    @property
+    def total_duration_sec(self) -> float:
+        """Sum of all test durations in seconds."""
+        self._sync()
+        return self._duration_sec
+
     @property
     def passed(self) -> int:
         """Number of passed tests."""
-        return sum(1 for r in self.results if r.status == "PASS")
+        self._sync()
+        return self._pass_count
 
     @property
     def failed(self) -> int:
         """Number of failed tests."""
-        return sum(1 for r in self.results if r.status == "FAIL")
+        self._sync()
+        return self._fail_count
 
     @property
     def other(self) -> int:
         """Number of tests with other statuses."""
-        return self.total_tests - self.passed - self.failed
+        self._sync()
+        return len(self.results) - self._pass_count - self._fail_count
 
     @property
     def pass_rate(self) -> float:
@@ -153,6 +286,59 @@ class ExecutionReport:
         return (self.passed / self.total_tests) * 100
 
 
+# Keep whitespace in attribute values intact through XML attribute normalization
+_ATTR_ENTITIES = {"\n": "&#10;", "\r": "&#13;", "\t": "&#9;"}
+
+
+def _attr(value: str) -> str:
+    """Quote and escape `value` for use as an XML attribute."""
+    return quoteattr(value, _ATTR_ENTITIES)
+
+
+# Pre-indented JUnit fragments; {}-fields are filled with already-escaped text
+_TC_TMPL = (
+    '  <testcase name={name} classname={classname} time="{time}">\n'
+    "{body}"
+    "    <properties>\n"
+    '      <property name="test_key" value={name} />\n'
+    "    </properties>\n"
+    "  </testcase>\n"
+)
+_FAIL_TMPL = "    <failure message={message}>{text}</failure>\n"
+_ERROR_TMPL = "    <error message={message} />\n"
+_SKIP_TMPL = "    <skipped message={message} />\n"
+
+
+def _failure_body(result: TestResult) -> str:
+    return _FAIL_TMPL.format(
+        message=_attr(result.error_message or "Test failed"),
+        text=escape(result.traceback),
+    )
+
+
+def _error_body(result: TestResult) -> str:
+    return _ERROR_TMPL.format(message=_attr(result.error_message or "Test aborted"))
+
+
+def _skip_body(result: TestResult) -> str:
+    return _SKIP_TMPL.format(message=_attr(result.comment or "Not executed"))
+
+
+# Status -> renderer for the testcase's result child element (PASS etc. have none)
+_JUNIT_BODY = {"FAIL": _failure_body, "ABORTED": _error_body, "TODO": _skip_body}
+
+
+def _junit_testcase(result: TestResult, classname: str) -> str:
+    """Render one indented JUnit <testcase> element for `result`."""
+    body = _JUNIT_BODY.get(result.status)
+    return _TC_TMPL.format(
+        name=_attr(result.test_id),
+        classname=_attr(classname),
+        time=result.duration_sec,
+        body=body(result) if body else "",
+    )
+
+
 class ResultReporter:
     """
     Formats and exports test results for Jira Xray.
@@ -195,18 +381,36 @@ class ResultReporter:
         self.project_key = project_key
         self.environment = environment
         self.fix_version = fix_version
+        # Wall-clock anchor; later timestamps are derived from the monotonic clock
+        self._epoch = datetime.now()
+        self._epoch_mono_ns = time.monotonic_ns()
         self._report = ExecutionReport(
             project_key=project_key,
             environment=environment,
             fix_version=fix_version,
-            start_time=datetime.now(),
+            start_time=self._epoch,
         )
         logger.info(f"ResultReporter initialized — project={project_key}")
 
+    def now(self) -> datetime:
+        """
+        Current wall-clock time, derived from the reporter's monotonic clock.
+
+        Cheaper than datetime.now() and never earlier than the execution
+        start, so it is suitable for per-result start/end timestamps.
+        """
+        elapsed_ns = time.monotonic_ns() - self._epoch_mono_ns
+        return self._epoch + timedelta(microseconds=elapsed_ns // 1000)
+
     def add_result(self, result: TestResult) -> None:
         """Add a test result to the report."""
         self._report.add_result(result)
-        logger.debug(f"Result added: {result.test_id} -> {result.status}")
+        logger.debug("Result added: {} -> {}", result.test_id, result.status)
+
+    def extend_results(self, results: Iterable[TestResult]) -> None:
+        """Add a batch of test results (e.g. collected at session end) to the report."""
+        added = self._report.extend_results(results)
+        logger.info(f"{added} results added")
 
     def set_summary(self, summary: str) -> None:
         """Set the execution summary."""
@@ -223,7 +427,7 @@ class ResultReporter:
         Returns:
             The completed ExecutionReport.
         """
-        self._report.end_time = datetime.now()
+        self._report.end_time = self.now()
         logger.info(
             f"Report finalized: {self._report.total_tests} tests, "
             f"{self._report.passed} passed, {self._report.failed} failed, "
@@ -240,7 +444,7 @@ class ResultReporter:
         """
         report = self._report
         payload: Dict[str, Any] = {
-            "tests": [r.to_xray_dict() for r in report.results],
+            "tests": [r._xray_payload() for r in report.results],
         }
 
         # Test Execution info
@@ -263,19 +467,21 @@ class ResultReporter:
 
         return payload
 
-    def export_xray_json(self, output_path: str) -> Path:
+    def export_xray_json(self, output_path: str, pretty: bool = False) -> Path:
         """
         Export the report as Xray JSON format file.
 
+        The default compact output is what should be uploaded to Xray;
+        use `pretty` only for files meant to be read by people.
+
         Args:
             output_path: Path to write the JSON file.
+            pretty: Indent the JSON for human inspection.
 
         Returns:
             Path to the written file.
         """
-        path = Path(output_path)
-        payload = self.to_xray_json()
-        path.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
+        path = _write_report(output_path, _dumps(self.to_xray_json(), pretty))
         logger.info(f"Xray JSON report exported to: {path}")
         return path
 
@@ -293,49 +499,27 @@ class ResultReporter:
             Path to the written file.
         """
         report = self._report
-        path = Path(output_path)
-
-        # Build JUnit XML
-        testsuite = ET.Element("testsuite")
-        testsuite.set("name", report.summary or f"{self.project_key} Test Execution")
-        testsuite.set("tests", str(report.total_tests))
-        testsuite.set("failures", str(report.failed))
-        testsuite.set("errors", "0")
-        testsuite.set("time", str(sum(r.duration_sec for r in report.results)))
-
-        if report.start_time:
-            testsuite.set("timestamp", report.start_time.isoformat())
-
-        for result in report.results:
-            testcase = ET.SubElement(testsuite, "testcase")
-            testcase.set("name", result.test_id)
-            testcase.set("classname", f"{self.project_key}.{result.test_id}")
-            testcase.set("time", str(result.duration_sec))
-
-            if result.status == "FAIL":
-                failure = ET.SubElement(testcase, "failure")
-                failure.set("message", result.error_message or "Test failed")
-                if result.traceback:
-                    failure.text = result.traceback
-
-            elif result.status == "ABORTED":
-                error = ET.SubElement(testcase, "error")
-                error.set("message", result.error_message or "Test aborted")
-
-            elif result.status == "TODO":
-                skipped = ET.SubElement(testcase, "skipped")
-                skipped.set("message", result.comment or "Not executed")
-
-            # Add Xray test ID as a property
-            properties = ET.SubElement(testcase, "properties")
-            prop = ET.SubElement(properties, "property")
-            prop.set("name", "test_key")
-            prop.set("value", result.test_id)
-
-        # Write XML
-        tree = ET.ElementTree(testsuite)
-        ET.indent(tree, space="  ")
-        tree.write(str(path), encoding="unicode", xml_declaration=True)
+        name = report.summary or f"{self.project_key} Test Execution"
+        total_time = report.total_duration_sec
+        timestamp = (
+            f" timestamp={_attr(report.start_time.isoformat())}"
+            if report.start_time else ""
+        )
+
+        # Render the XML (already indented) as text fragments, then write once
+        parts = [
+            '<?xml version="1.0" encoding="utf-8"?>\n',
+            f'<testsuite name={_attr(name)} tests="{report.total_tests}" '
+            f'failures="{report.failed}" errors="0" time="{total_time}"{timestamp}>\n',
+        ]
+        cls_prefix = self.project_key + "."
+        parts.extend(
+            _junit_testcase(result, cls_prefix + result.test_id)
+            for result in report.results
+        )
+        parts.append("</testsuite>\n")
+        path = _write_report(output_path, "".join(parts).encode("utf-8"))
+
         logger.info(f"JUnit XML report exported to: {path}")
         return path
 
@@ -16,17 +16,20 @@ The mapper supports:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set
 
 from loguru import logger
 
+from src._compat import DATACLASS_SLOTS
+
 try:
     import pytest
 except ImportError:
     pytest = None  # type: ignore[assignment]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TestMapping:
     """
     Represents a mapping between a Pytest test and a Jira Xray Test ID.
@@ -73,6 +76,7 @@ class TestMapper:
     def __init__(self) -> None:
         """Initialize an empty test mapper."""
         self._id_to_mapping: Dict[str, TestMapping] = {}
+        self._id_map_view: Mapping[str, TestMapping] = MappingProxyType(self._id_to_mapping)
         self._nodeid_to_mapping: Dict[str, TestMapping] = {}
         self._unmapped_nodeids: Set[str] = set()
 
@@ -91,29 +95,34 @@ class TestMapper:
         self._unmapped_nodeids.clear()
 
         for item in items:
-            xray_markers = list(item.iter_markers(name="xray"))
-
-            if xray_markers:
-                for marker in xray_markers:
-                    test_id = marker.args[0] if marker.args else None
-                    if test_id:
-                        mapping = TestMapping(
-                            test_id=test_id,
-                            nodeid=item.nodeid,
-                            function_name=item.name,
-                            class_name=(
-                                item.cls.__name__ if hasattr(item, "cls") and item.cls else ""
-                            ),
-                            module_path=str(item.fspath) if hasattr(item, "fspath") else "",
-                            markers=[
-                                m.name for m in item.iter_markers()
-                                if m.name != "xray"
-                            ],
-                        )
-                        self._id_to_mapping[test_id] = mapping
-                        self._nodeid_to_mapping[item.nodeid] = mapping
-            else:
+            # One walk of the marker chain, split into xray / other markers
+            xray_markers = []
+            other_names = []
+            for m in item.iter_markers():
+                if m.name == "xray":
+                    xray_markers.append(m)
+                else:
+                    other_names.append(m.name)
+
+            if not xray_markers:
                 self._unmapped_nodeids.add(item.nodeid)
+                continue
+
+            cls_name = item.cls.__name__ if hasattr(item, "cls") and item.cls else ""
+            mod_path = str(item.fspath) if hasattr(item, "fspath") else ""
+            for marker in xray_markers:
+                test_id = marker.args[0] if marker.args else None
+                if test_id:
+                    mapping = TestMapping(
+                        test_id=test_id,
+                        nodeid=item.nodeid,
+                        function_name=item.name,
+                        class_name=cls_name,
+                        module_path=mod_path,
+                        markers=list(other_names),
+                    )
+                    self._id_to_mapping[test_id] = mapping
+                    self._nodeid_to_mapping[item.nodeid] = mapping
 
         logger.info(
             f"TestMapper collected: {len(self._id_to_mapping)} mapped, "
@@ -144,8 +153,15 @@ class TestMapper:
         """
         return self._nodeid_to_mapping.get(nodeid)
 
-    def get_all_mappings(self) -> Dict[str, TestMapping]:
-        """Return all test ID -> mapping entries."""
+    def get_all_mappings(self, view: bool = False) -> Mapping[str, TestMapping]:
+        """
+        Return all test ID -> mapping entries.
+
+        By default this is an independent dict copy; pass `view=True` for a
+        read-only live view that avoids the copy.
+        """
+        if view:
+            return self._id_map_view
         return dict(self._id_to_mapping)
 
     def get_all_test_ids(self) -> List[str]:
@@ -175,22 +191,26 @@ class TestMapper:
             Filtered list of pytest.Item objects.
         """
         test_id_set = set(test_ids)
-        filtered = []
-        skipped = []
-
-        for item in items:
-            mapping = self._nodeid_to_mapping.get(item.nodeid)
-            if mapping and mapping.test_id in test_id_set:
-                filtered.append(item)
-            else:
-                skipped.append(item.nodeid)
+        mapping_get = self._nodeid_to_mapping.get
+        filtered = [
+            item for item in items
+            if (mapping := mapping_get(item.nodeid)) is not None
+            and mapping.test_id in test_id_set
+        ]
+        skipped_count = len(items) - len(filtered)
 
         logger.info(
             f"Test filter: {len(filtered)} selected, "
-            f"{len(skipped)} skipped (not in Test Set)"
+            f"{skipped_count} skipped (not in Test Set)"
         )
-        if skipped:
-            logger.debug(f"Skipped tests: {skipped[:10]}{'...' if len(skipped) > 10 else ''}")
+        if skipped_count:
+            # Only build the skipped list if a sink actually takes DEBUG
+            def skipped_preview() -> str:
+                kept = {id(item) for item in filtered}
+                skipped = [item.nodeid for item in items if id(item) not in kept]
+                return f"{skipped[:10]}{'...' if len(skipped) > 10 else ''}"
+
+            logger.opt(lazy=True).debug("Skipped tests: {}", skipped_preview)
 
         return filtered
 
@@ -14,16 +14,113 @@ to fetch the list of Test IDs from the specified Test Set."
 from __future__ import annotations
 
 import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
+from src._compat import DATACLASS_SLOTS
+
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import make_headers
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None  # type: ignore[assignment]
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+if MSGSPEC_AVAILABLE:
+
+    class _TestRef(msgspec.Struct):
+        """A Test Set entry; every field except the issue key is skipped."""
+
+        # Any type, so a null or numeric key drops the entry, not the response
+        key: Any = None
+
+    class _WrappedTestRefs(msgspec.Struct):
+        """Dict-wrapped Test Set response used by some Xray versions."""
+
+        tests: Optional[List[_TestRef]] = None
+        issues: List[_TestRef] = msgspec.field(default_factory=list)
+
+    _TEST_LIST_DECODER = msgspec.json.Decoder(List[_TestRef])
+    _TEST_WRAPPED_DECODER = msgspec.json.Decoder(_WrappedTestRefs)
+
+
+def _encode_json(payload: Any) -> bytes:
+    """Serialize a request body to JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _decode_json(raw: bytes) -> Any:
+    """Parse a JSON response body straight from bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Constant wrapper of the test-association body: {"add": [...]}
+_ADD_TESTS_PREFIX = b'{"add":'
+_ADD_TESTS_SUFFIX = b"}"
+
+
+def _encode_add_tests(test_ids: List[str]) -> bytes:
+    """Serialize a test-association body, encoding only the key list."""
+    return _ADD_TESTS_PREFIX + _encode_json(test_ids) + _ADD_TESTS_SUFFIX
+
+
+def _extract_test_keys(raw: bytes) -> List[str]:
+    """
+    Pull the Test issue keys out of a raw Test Set response body.
+
+    With msgspec the keys are decoded straight into typed structs, skipping
+    the other fields; otherwise the body is parsed to dicts and walked.
+    Entries without a non-empty string key are skipped.
+
+    Raises:
+        ValueError: If the body is not a list of tests or a dict wrapping one.
+    """
+    if MSGSPEC_AVAILABLE:
+        try:
+            tests = _TEST_LIST_DECODER.decode(raw)
+        except msgspec.ValidationError:
+            try:
+                wrapped = _TEST_WRAPPED_DECODER.decode(raw)
+            except msgspec.ValidationError as e:
+                raise ValueError(f"unexpected Test Set response shape: {e}") from e
+            tests = wrapped.tests if wrapped.tests is not None else wrapped.issues
+        return [test.key for test in tests if isinstance(test.key, str) and test.key]
+
+    response = _decode_json(raw)
+    if isinstance(response, dict):
+        # Some Xray versions wrap in a dict
+        tests = response.get("tests")
+        response = tests if tests is not None else response.get("issues", [])
+    if not isinstance(response, list) or not all(isinstance(t, dict) for t in response):
+        raise ValueError("unexpected Test Set response shape")
+    return [
+        key for key in (test.get("key") for test in response)
+        if isinstance(key, str) and key
+    ]
+
 
 class XrayClientError(Exception):
     """Raised when an Xray API operation fails."""
@@ -33,7 +130,7 @@ class XrayClientError(Exception):
         self.status_code = status_code
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class XrayConfig:
     """Configuration for the Xray API client."""
 
@@ -71,14 +168,33 @@ class XrayClient:
     ENDPOINTS = {
         "test_set_tests": "/rest/raven/1.0/api/testset/{test_set_key}/test",
         "test_execution": "/rest/raven/1.0/api/testexec",
+        "test_execution_tests": "/rest/raven/1.0/api/testexec/{exec_key}/test",
         "import_results_xray": "/rest/raven/1.0/api/import/execution",
         "import_results_junit": "/rest/raven/1.0/api/import/execution/junit",
         # Xray Cloud endpoints
         "cloud_authenticate": "/api/v2/authenticate",
         "cloud_test_set_tests": "/api/v2/testset/{test_set_key}/tests",
         "cloud_import_results": "/api/v2/import/execution",
+        # Jira core endpoints
+        "issue": "/rest/api/2/issue",
+        "search": "/rest/api/2/search",
     }
 
+    # Keep-alive connection pool and retry policy for the Jira host
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 32
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF_FACTOR = 0.3
+    RETRY_STATUS_FORCELIST = (429, 502, 503, 504)
+    # POST is left out: retrying an import or issue-create after a gateway
+    # error could apply it twice
+    RETRY_ALLOWED_METHODS = frozenset({"GET", "PUT"})
+    # Concurrent requests for batch operations (must not exceed POOL_MAXSIZE)
+    MAX_PARALLEL_REQUESTS = 8
+    # In-process Test Set cache (LRU with expiry)
+    TESTSET_CACHE_TTL_SEC = 300.0
+    TESTSET_CACHE_MAX = 128
+
     def __init__(
         self,
         base_url: str = "",
@@ -123,9 +239,27 @@ class XrayClient:
             )
 
         self._session: Optional[Any] = None
+        # Request headers built once per client and reused for every session/call
+        self._auth_header: Dict[str, str] = (
+            {"Authorization": f"Bearer {self._config.api_token}"}
+            if self._config.auth_method == "token" else {}
+        )
+        self._xml_headers: Dict[str, str] = {"Content-Type": "text/xml"}
+        # Full URL (or URL template) per endpoint, joined with the base URL once
+        self._urls: Dict[str, str] = {
+            name: self._config.base_url + path for name, path in self.ENDPOINTS.items()
+        }
+        # (project_key, test_set_key) -> (fetched at, test IDs)
+        self._testset_cache: OrderedDict[Tuple[str, str], Tuple[float, List[str]]] = OrderedDict()
+        # (project_key, test_set_name) -> test_set_key
+        self._testset_name_cache: Dict[Tuple[str, str], str] = {}
+        self._cache_lock = threading.Lock()
+        # Worker pool for batch operations, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
         logger.info(
-            f"XrayClient initialized — project={self._config.project_key}, "
-            f"url={self._config.base_url}"
+            "XrayClient initialized — project={}, url={}",
+            self._config.project_key, self._config.base_url,
         )
 
     @property
@@ -155,13 +289,27 @@ class XrayClient:
             self._session.headers.update({
                 "Content-Type": "application/json",
                 "Accept": "application/json",
+                # gzip/deflate always; br/zstd only when urllib3 can decode them
+                "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+                "Connection": "keep-alive",
             })
+            adapter = HTTPAdapter(
+                pool_connections=self.POOL_CONNECTIONS,
+                pool_maxsize=self.POOL_MAXSIZE,
+                pool_block=False,
+                max_retries=Retry(
+                    total=self.RETRY_TOTAL,
+                    backoff_factor=self.RETRY_BACKOFF_FACTOR,
+                    status_forcelist=self.RETRY_STATUS_FORCELIST,
+                    allowed_methods=self.RETRY_ALLOWED_METHODS,
+                    raise_on_status=False,
+                ),
+            )
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
 
-            if self._config.auth_method == "token":
-                self._session.headers["Authorization"] = (
-                    f"Bearer {self._config.api_token}"
-                )
-            elif self._config.auth_method == "basic":
+            self._session.headers.update(self._auth_header)
+            if self._config.auth_method == "basic":
                 self._session.auth = (
                     self._config.username,
                     self._config.password,
@@ -172,26 +320,30 @@ class XrayClient:
     def _request(
         self,
         method: str,
-        endpoint: str,
+        url: str,
+        raw: bool = False,
         **kwargs: Any,
-    ) -> Dict[str, Any] | List[Any]:
+    ) -> Dict[str, Any] | List[Any] | bytes:
         """
         Make an authenticated API request.
 
         Args:
             method: HTTP method (GET, POST, PUT).
-            endpoint: API endpoint path.
+            url: Full request URL (see `_urls`).
+            raw: Return the undecoded response body instead of parsed JSON.
             **kwargs: Additional arguments for requests (json, data, params, files).
 
         Returns:
-            Parsed JSON response.
+            Parsed JSON response (or the body bytes when ``raw`` is set).
 
         Raises:
             XrayClientError: If the request fails.
         """
         session = self._get_session()
-        url = f"{self._config.base_url}{endpoint}"
-        logger.debug(f"Xray API {method} {url}")
+        logger.debug("Xray API {} {}", method, url)
+        if "json" in kwargs:
+            # Session default Content-Type is already application/json
+            kwargs["data"] = _encode_json(kwargs.pop("json"))
 
         try:
             response = session.request(
@@ -201,7 +353,9 @@ class XrayClient:
                 **kwargs,
             )
             response.raise_for_status()
-            return response.json()
+            if raw:
+                return response.content
+            return _decode_json(response.content)
         except requests.exceptions.HTTPError as e:
             status_code = e.response.status_code if e.response else None
             logger.error(f"Xray API HTTP error: {e} (status={status_code})")
@@ -237,25 +391,90 @@ class XrayClient:
         Raises:
             XrayClientError: If the API call fails.
         """
-        logger.info(f"Fetching tests from Test Set: {test_set_key}")
+        cache_key = (self._config.project_key, test_set_key)
+        with self._cache_lock:
+            cached = self._testset_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self.TESTSET_CACHE_TTL_SEC:
+                self._testset_cache.move_to_end(cache_key)
+                logger.debug("Test Set {} served from cache", test_set_key)
+                return list(cached[1])
+
+        logger.info("Fetching tests from Test Set: {}", test_set_key)
+
+        url = self._urls["test_set_tests"].format_map({"test_set_key": test_set_key})
+        body = self._request("GET", url, raw=True)
+        try:
+            test_ids = _extract_test_keys(body)
+        except Exception as e:
+            raise XrayClientError(f"Invalid Test Set response for {test_set_key}: {e}") from e
 
-        endpoint = self.ENDPOINTS["test_set_tests"].format(
-            test_set_key=test_set_key
+        # Joining a large Test Set's IDs is only worth it when INFO is emitted
+        logger.opt(lazy=True).info(
+            "Fetched {} tests from {}: {}",
+            lambda: len(test_ids), lambda: test_set_key, lambda: test_ids,
         )
-        response = self._request("GET", endpoint)
-
-        if isinstance(response, list):
-            test_ids = [test.get("key", "") for test in response if "key" in test]
-        elif isinstance(response, dict):
-            # Some Xray versions wrap in a dict
-            tests = response.get("tests", response.get("issues", []))
-            test_ids = [test.get("key", "") for test in tests if "key" in test]
-        else:
-            test_ids = []
-
-        logger.info(f"Fetched {len(test_ids)} tests from {test_set_key}: {test_ids}")
+        with self._cache_lock:
+            self._testset_cache[cache_key] = (time.monotonic(), list(test_ids))
+            self._testset_cache.move_to_end(cache_key)
+            while len(self._testset_cache) > self.TESTSET_CACHE_MAX:
+                self._testset_cache.popitem(last=False)
         return test_ids
 
+    def invalidate_test_set(self, test_set_key: Optional[str] = None) -> None:
+        """
+        Drop cached Test Set contents.
+
+        Args:
+            test_set_key: Test Set to forget; None clears the whole cache
+                (including name -> key lookups).
+        """
+        with self._cache_lock:
+            if test_set_key is None:
+                self._testset_cache.clear()
+                self._testset_name_cache.clear()
+            else:
+                self._testset_cache.pop((self._config.project_key, test_set_key), None)
+
+    def fetch_test_sets(self, test_set_keys: List[str]) -> Dict[str, List[str]]:
+        """
+        Fetch several Test Sets concurrently.
+
+        The GETs are independent, so they are issued in parallel over the
+        session's keep-alive pool; wall-clock time is roughly that of the
+        slowest fetch rather than the sum.
+
+        Args:
+            test_set_keys: Jira issue keys of the Test Sets.
+
+        Returns:
+            Mapping of Test Set key -> list of Test ID strings.
+
+        Raises:
+            XrayClientError: If any of the API calls fails.
+        """
+        keys = list(dict.fromkeys(test_set_keys))
+        if len(keys) <= 1:
+            return {key: self.fetch_test_set(key) for key in keys}
+
+        return dict(zip(keys, self._get_executor().map(self.fetch_test_set, keys)))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get or create the worker pool used for batch operations.
+
+        The workers share one ``requests.Session``; that is safe for
+        concurrent requests once the pooled adapter is mounted, so the
+        session is created here before any worker starts.
+        """
+        self._get_session()
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.MAX_PARALLEL_REQUESTS,
+                    thread_name_prefix="xray",
+                )
+            return self._executor
+
     def fetch_test_set_by_name(self, test_set_name: str) -> List[str]:
         """
         Fetch Test IDs by searching for a Test Set by its summary/name.
@@ -272,15 +491,22 @@ class XrayClient:
         Raises:
             XrayClientError: If the Test Set is not found or API call fails.
         """
-        logger.info(f"Searching for Test Set by name: '{test_set_name}'")
+        name_key = (self._config.project_key, test_set_name)
+        with self._cache_lock:
+            test_set_key = self._testset_name_cache.get(name_key)
+        if test_set_key:
+            return self.fetch_test_set(test_set_key)
+
+        logger.info("Searching for Test Set by name: '{}'", test_set_name)
 
         jql = (
             f'project = "{self._config.project_key}" '
             f'AND issuetype = "Test Set" '
             f'AND summary ~ "{test_set_name}"'
         )
-        endpoint = "/rest/api/2/search"
-        response = self._request("GET", endpoint, params={"jql": jql, "maxResults": 1})
+        response = self._request(
+            "GET", self._urls["search"], params={"jql": jql, "maxResults": 1}
+        )
 
         issues = response.get("issues", []) if isinstance(response, dict) else []
         if not issues:
@@ -290,7 +516,9 @@ class XrayClient:
             )
 
         test_set_key = issues[0]["key"]
-        logger.info(f"Found Test Set: {test_set_name} -> {test_set_key}")
+        logger.info("Found Test Set: {} -> {}", test_set_name, test_set_key)
+        with self._cache_lock:
+            self._testset_name_cache[name_key] = test_set_key
         return self.fetch_test_set(test_set_key)
 
     # ------------------------------------------------------------------
@@ -304,16 +532,22 @@ class XrayClient:
         description: str = "",
         environment: str = "",
         fix_version: str = "",
+        legacy_two_step: bool = False,
     ) -> str:
         """
         Create a new Test Execution issue in Jira.
 
+        The execution and its tests are created in one request through the
+        Xray execution import endpoint (tests start in TODO status).
+
         Args:
             summary: Summary/title of the Test Execution.
             test_ids: List of Test issue keys to include.
             description: Optional description.
             environment: Optional environment label.
             fix_version: Optional fix version.
+            legacy_two_step: Create the Jira issue first and then associate
+                the tests (two requests), for servers without the import API.
 
         Returns:
             Key of the created Test Execution issue.
@@ -321,8 +555,67 @@ class XrayClient:
         Raises:
             XrayClientError: If creation fails.
         """
-        logger.info(f"Creating Test Execution: '{summary}' with {len(test_ids)} tests")
+        logger.info("Creating Test Execution: '{}' with {} tests", summary, len(test_ids))
+        if legacy_two_step:
+            return self._create_test_execution_two_step(
+                summary, test_ids, description, environment
+            )
+
+        info: Dict[str, Any] = {
+            "summary": summary,
+            "project": self._config.project_key,
+        }
+        if description:
+            info["description"] = description
+        if environment:
+            info["testEnvironments"] = [environment]
+        if fix_version:
+            info["version"] = fix_version
+        payload = {
+            "info": info,
+            "tests": [{"testKey": test_id, "status": "TODO"} for test_id in test_ids],
+        }
+        response = self._request("POST", self._urls["import_results_xray"], json=payload)
+
+        exec_key = (
+            response.get("testExecIssue", {}).get("key", "")
+            if isinstance(response, dict) else ""
+        )
+        logger.info("Test Execution created: {} ({} tests)", exec_key, len(test_ids))
+        return exec_key
+
+    def create_test_executions_bulk(self, specs: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create several Test Executions concurrently.
+
+        Each spec holds the keyword arguments of :meth:`create_test_execution`
+        (``summary`` and ``test_ids`` at least). The POSTs are independent,
+        so they share the session's keep-alive pool in parallel.
+
+        Args:
+            specs: One argument dict per Test Execution.
 
+        Returns:
+            Keys of the created Test Executions, in the order of ``specs``.
+
+        Raises:
+            XrayClientError: If any of the creations fails.
+        """
+        if len(specs) <= 1:
+            return [self.create_test_execution(**spec) for spec in specs]
+
+        executor = self._get_executor()
+        futures = [executor.submit(self.create_test_execution, **spec) for spec in specs]
+        return [future.result() for future in futures]
+
+    def _create_test_execution_two_step(
+        self,
+        summary: str,
+        test_ids: List[str],
+        description: str,
+        environment: str,
+    ) -> str:
+        """Create the Test Execution issue, then associate its tests."""
         payload: Dict[str, Any] = {
             "fields": {
                 "project": {"key": self._config.project_key},
@@ -335,17 +628,16 @@ class XrayClient:
         if environment:
             payload["fields"]["environment"] = environment
 
-        endpoint = "/rest/api/2/issue"
-        response = self._request("POST", endpoint, json=payload)
+        response = self._request("POST", self._urls["issue"], json=payload)
 
         exec_key = response.get("key", "") if isinstance(response, dict) else ""
-        logger.info(f"Test Execution created: {exec_key}")
+        logger.info("Test Execution created: {}", exec_key)
 
         # Associate tests with the execution
         if exec_key and test_ids:
-            assoc_endpoint = f"/rest/raven/1.0/api/testexec/{exec_key}/test"
-            self._request("POST", assoc_endpoint, json={"add": test_ids})
-            logger.info(f"Associated {len(test_ids)} tests with {exec_key}")
+            assoc_url = self._urls["test_execution_tests"].format_map({"exec_key": exec_key})
+            self._request("POST", assoc_url, data=_encode_add_tests(test_ids))
+            logger.info("Associated {} tests with {}", len(test_ids), exec_key)
 
         return exec_key
 
@@ -366,10 +658,9 @@ class XrayClient:
             XrayClientError: If import fails.
         """
         logger.info("Importing execution results to Xray")
-        endpoint = self.ENDPOINTS["import_results_xray"]
-        response = self._request("POST", endpoint, json=results_json)
+        response = self._request("POST", self._urls["import_results_xray"], json=results_json)
         result = response if isinstance(response, dict) else {"response": response}
-        logger.info(f"Results imported: {result.get('testExecIssue', {}).get('key', 'N/A')}")
+        logger.info("Results imported: {}", result.get("testExecIssue", {}).get("key", "N/A"))
         return result
 
     def import_junit_results(
@@ -392,7 +683,7 @@ class XrayClient:
         Raises:
             XrayClientError: If import fails.
         """
-        logger.info(f"Importing JUnit results from: {junit_xml_path}")
+        logger.info("Importing JUnit results from: {}", junit_xml_path)
 
         params: Dict[str, str] = {}
         if project_key or self._config.project_key:
@@ -401,27 +692,31 @@ class XrayClient:
             params["testExecKey"] = test_exec_key
 
         with open(junit_xml_path, "rb") as f:
-            endpoint = self.ENDPOINTS["import_results_junit"]
             session = self._get_session()
-            url = f"{self._config.base_url}{endpoint}"
+            url = self._urls["import_results_junit"]
 
-            # Override content-type for XML upload
-            headers = {"Content-Type": "text/xml"}
+            # Override content-type for XML upload; passing the open file lets
+            # requests stream it (with a Content-Length from fstat) instead
+            # of holding the whole document in memory
             response = session.post(
                 url,
-                data=f.read(),
+                data=f,
                 params=params,
-                headers=headers,
+                headers=self._xml_headers,
                 timeout=self._config.timeout_sec,
             )
             response.raise_for_status()
-            result = response.json()
+            result = _decode_json(response.content)
 
-        logger.info(f"JUnit results imported successfully")
+        logger.info("JUnit results imported successfully")
         return result
 
     def close(self) -> None:
-        """Close the HTTP session."""
+        """Close the HTTP session and stop the batch worker pool."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
         if self._session is not None:
             self._session.close()
             self._session = None
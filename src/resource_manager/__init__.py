@@ -12,9 +12,14 @@ from src.resource_manager.manager import (
     ResourceManager,
     ResourceMetadata,
 )
-from src.resource_manager.health_check import HealthChecker, HealthCheckResult
+from src.resource_manager.health_check import (
+    BenchConnection,
+    HealthChecker,
+    HealthCheckResult,
+)
 
 __all__ = [
+    "BenchConnection",
     "BenchState",
     "HealthChecker",
     "HealthCheckResult",
@@ -11,15 +11,55 @@ a basic health check (e.g., ping the UUT, verify PSU communication)."
 
 from __future__ import annotations
 
+import asyncio
+import random
 import subprocess
 import sys
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
 
 from loguru import logger
 
+from src._compat import DATACLASS_SLOTS
 
-@dataclass
+try:
+    from icmplib import ICMPLibError
+    from icmplib import async_ping as icmp_async_ping
+    from icmplib import ping as icmp_ping
+    ICMPLIB_AVAILABLE = True
+except ImportError:
+    ICMPLIB_AVAILABLE = False
+
+
+class BenchConnection(NamedTuple):
+    """
+    Addresses the health checks need, unpacked once from a bench's
+    ``connection`` mapping.
+
+    Attributes:
+        uut_ip: Radar (UUT) IP address.
+        psu_ip: Power supply IP address.
+        ptp_ip: PTP time server IP address.
+    """
+
+    uut_ip: str = ""
+    psu_ip: str = ""
+    ptp_ip: str = ""
+
+    @classmethod
+    def from_dict(cls, connection: Dict[str, Any]) -> "BenchConnection":
+        """Build from a bench config ``connection`` dict (missing keys -> "")."""
+        return cls(
+            uut_ip=connection.get("uut_ip", ""),
+            psu_ip=connection.get("psu_ip", ""),
+            ptp_ip=connection.get("ptp_ip", ""),
+        )
+
+
+@dataclass(**DATACLASS_SLOTS)
 class HealthCheckResult:
     """
     Result of a health check on a test bench.
@@ -27,7 +67,7 @@ class HealthCheckResult:
     Attributes:
         bench_id: The bench that was checked.
         healthy: Whether the bench passed all checks.
-        checks: Individual check results.
+        checks: Individual check results (record new ones via set_check).
         message: Summary message.
     """
 
@@ -36,11 +76,27 @@ class HealthCheckResult:
     checks: Dict[str, bool] = field(default_factory=dict)
     message: str = "All checks passed."
     details: Dict[str, Any] = field(default_factory=dict)
+    # Failed check names in check order (dict as an ordered set)
+    _failed: Dict[str, None] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._failed = {name: None for name, passed in self.checks.items() if not passed}
+
+    def set_check(self, name: str, passed: bool) -> None:
+        """Record the outcome of one check, marking the bench unhealthy on failure."""
+        self.checks[name] = passed
+        if passed:
+            self._failed.pop(name, None)
+        else:
+            self._failed[name] = None
+            self.healthy = False
 
     @property
     def failed_checks(self) -> List[str]:
         """Return list of check names that failed."""
-        return [name for name, passed in self.checks.items() if not passed]
+        return list(self._failed)
 
 
 class HealthChecker:
@@ -63,12 +119,26 @@ class HealthChecker:
             ...
     """
 
+    # Pause between retries: exponential from BASE, capped at MAX, plus jitter
+    RETRY_BACKOFF_BASE_SEC = 0.01
+    RETRY_BACKOFF_MAX_SEC = 0.2
+    RETRY_JITTER_SEC = 0.05
+
+    # Fast-fail a bench for COOLDOWN seconds after THRESHOLD failed checks in a row
+    BREAKER_THRESHOLD = 3
+    BREAKER_COOLDOWN_SEC = 30.0
+
+    # How long a batch_ping() result may stand in for a ping_uut check
+    BATCH_PING_MAX_AGE_SEC = 10.0
+
     def __init__(
         self,
         ping_timeout_sec: int = 5,
         psu_verify_timeout_sec: int = 10,
         retry_count: int = 2,
         mock_mode: bool = True,
+        parallel_checks: bool = True,
+        result_ttl_sec: float = 0.0,
     ) -> None:
         """
         Initialize the health checker.
@@ -78,40 +148,270 @@ class HealthChecker:
             psu_verify_timeout_sec: Timeout for PSU verification.
             retry_count: Number of retries for failed checks.
             mock_mode: If True, simulate all checks (for PoC/testing).
+            parallel_checks: If True, run the independent checks of a bench
+                concurrently; False runs them one after another.
+            result_ttl_sec: How long a healthy result is reused for the same
+                bench and connection (0, the default, disables the cache).
         """
         self.ping_timeout_sec = ping_timeout_sec
         self.psu_verify_timeout_sec = psu_verify_timeout_sec
         self.retry_count = retry_count
         self.mock_mode = mock_mode
+        self.parallel_checks = parallel_checks
+        self.result_ttl_sec = result_ttl_sec
+
+        # Guards the result cache, circuit-breaker state and ping results;
+        # checks of different benches run on several threads at once
+        self._state_lock = threading.Lock()
 
-        # Mock overrides — set specific bench IDs to fail for testing
-        self._mock_failures: Dict[str, List[str]] = {}
+        # Healthy results by (bench_id, connection items) -> (monotonic time, result)
+        self._result_cache: Dict[Tuple[Any, ...], Tuple[float, HealthCheckResult]] = {}
+
+        # Circuit breaker: consecutive unhealthy results and when a bench tripped
+        self._failure_streak: Dict[str, int] = {}
+        self._broken: Dict[str, float] = {}
+
+        # batch_ping()/prefetch_pings() results by IP -> (monotonic time, alive),
+        # used once
+        self._ping_results: Dict[str, Tuple[float, bool]] = {}
+
+        # Mock overrides — (bench_id, check_name) pairs that fail, for testing
+        self._mock_failures: Set[Tuple[str, str]] = set()
 
         logger.info(
-            f"HealthChecker initialized — mock_mode={mock_mode}, "
-            f"ping_timeout={ping_timeout_sec}s, retries={retry_count}"
+            "HealthChecker initialized — mock_mode={}, ping_timeout={}s, retries={}",
+            mock_mode, ping_timeout_sec, retry_count,
         )
 
     def set_mock_failure(self, bench_id: str, failing_checks: List[str]) -> None:
         """
         Configure a bench to fail specific checks (mock mode only).
 
+        Replaces any failures previously configured for the bench.
+
         Args:
             bench_id: Bench ID to configure.
             failing_checks: List of check names to fail (e.g., ["ping_uut", "verify_psu"]).
         """
-        self._mock_failures[bench_id] = failing_checks
-        logger.debug(f"Mock failure set for {bench_id}: {failing_checks}")
+        self._mock_failures = {pair for pair in self._mock_failures if pair[0] != bench_id}
+        self._mock_failures.update((bench_id, check) for check in failing_checks)
+        self.invalidate(bench_id)
+        logger.debug("Mock failure set for {}: {}", bench_id, failing_checks)
 
     def clear_mock_failures(self) -> None:
         """Clear all mock failure configurations."""
         self._mock_failures.clear()
+        with self._state_lock:
+            self._result_cache.clear()
+            self._failure_streak.clear()
+            self._broken.clear()
+
+    def invalidate(self, bench_id: Optional[str] = None) -> None:
+        """
+        Drop cached health results and reset the circuit breaker so the
+        next check runs for real.
+
+        Args:
+            bench_id: Bench whose results to drop; None drops all of them.
+        """
+        with self._state_lock:
+            if bench_id is None:
+                self._result_cache.clear()
+                self._failure_streak.clear()
+                self._broken.clear()
+                self._ping_results.clear()
+                return
+            for key in [k for k in self._result_cache if k[0] == bench_id]:
+                del self._result_cache[key]
+            self._failure_streak.pop(bench_id, None)
+            self._broken.pop(bench_id, None)
+
+    def _cached_result(self, key: Tuple[Any, ...]) -> Optional[HealthCheckResult]:
+        """Return a copy of a fresh cached healthy result, if any."""
+        with self._state_lock:
+            entry = self._result_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.result_ttl_sec:
+            return None
+        cached = entry[1]
+        logger.debug("Health check for {} served from cache", cached.bench_id)
+        return replace(cached, checks=dict(cached.checks), details=dict(cached.details))
+
+    def _record_result(self, key: Tuple[Any, ...], result: HealthCheckResult) -> None:
+        """
+        Cache a healthy result and update the circuit breaker.
+
+        Failures are never cached, so the bench is re-checked next time —
+        unless it has now failed BREAKER_THRESHOLD times in a row.
+        """
+        bench_id = result.bench_id
+        if result.healthy:
+            with self._state_lock:
+                self._failure_streak.pop(bench_id, None)
+                self._broken.pop(bench_id, None)
+                if self.result_ttl_sec > 0:
+                    self._result_cache[key] = (time.monotonic(), result)
+            return
+        with self._state_lock:
+            streak = self._failure_streak.get(bench_id, 0) + 1
+            self._failure_streak[bench_id] = streak
+            if streak >= self.BREAKER_THRESHOLD:
+                self._broken[bench_id] = time.monotonic()
+        if streak >= self.BREAKER_THRESHOLD:
+            logger.warning(
+                f"Bench {bench_id}: {streak} consecutive failed health checks — "
+                f"fast-failing for {self.BREAKER_COOLDOWN_SEC:.0f}s"
+            )
+
+    def _open_circuit_result(self, bench_id: str) -> Optional[HealthCheckResult]:
+        """Return an unhealthy result if the bench's circuit breaker is open."""
+        with self._state_lock:
+            tripped_at = self._broken.get(bench_id)
+            if tripped_at is None:
+                return None
+            remaining = self.BREAKER_COOLDOWN_SEC - (time.monotonic() - tripped_at)
+            if remaining <= 0:
+                # Cool-down over: let the next check through (half-open)
+                self._broken.pop(bench_id, None)
+                return None
+        message = (
+            f"Bench {bench_id}: health checks suspended after repeated failures "
+            f"({remaining:.0f}s remaining)"
+        )
+        logger.debug(message)
+        return HealthCheckResult(
+            bench_id=bench_id,
+            healthy=False,
+            message=message,
+            details={"bench_id": bench_id, "circuit_open": True},
+        )
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Seconds to wait after a failed attempt (1-based)."""
+        delay = min(
+            self.RETRY_BACKOFF_MAX_SEC,
+            self.RETRY_BACKOFF_BASE_SEC * (2 ** (attempt - 1)),
+        )
+        return delay + random.uniform(0, self.RETRY_JITTER_SEC)
+
+    @staticmethod
+    def _cache_key(bench_id: str, connection: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Key results by bench and its connection details."""
+        return (bench_id, tuple(sorted(connection.items())))
+
+    def batch_ping(self, ips: List[str]) -> Dict[str, bool]:
+        """
+        Ping many UUTs with a single ``fping`` run.
+
+        Each result is remembered for BATCH_PING_MAX_AGE_SEC and consumed by
+        the next ``ping_uut`` check of that address, so a bench check right
+        after a batch does not ping again. Without fping the addresses are
+        pinged one by one. In mock mode nothing is sent.
+
+        Args:
+            ips: Addresses to ping (duplicates and empty entries are ignored).
+
+        Returns:
+            Mapping of IP -> reachable.
+        """
+        targets = list(dict.fromkeys(ip for ip in ips if ip))
+        if not targets:
+            return {}
+        if self.mock_mode:
+            return dict.fromkeys(targets, True)
+
+        results = self._fping(targets)
+        if results is None:
+            results = {ip: self._ping(ip) for ip in targets}
+        self._remember_pings(results)
+        return results
+
+    def prefetch_pings(self, bench_configs: List[Dict[str, Any]]) -> None:
+        """
+        Ping, in one ``fping`` run, the UUTs the next checks of these benches will ping.
+
+        Benches answered from the result cache or suspended by their circuit
+        breaker are left out. Without fping nothing is sent and each bench
+        check pings its own UUT as usual. In mock mode this does nothing.
+
+        Args:
+            bench_configs: Bench configuration dictionaries about to be checked.
+        """
+        if self.mock_mode:
+            return
+        targets = list(dict.fromkeys(
+            cfg.get("connection", {}).get("uut_ip", "")
+            for cfg in bench_configs
+            if self._needs_check(cfg)
+        ))
+        targets = [ip for ip in targets if ip]
+        if not targets:
+            return
+        results = self._fping(targets)
+        if results is not None:
+            self._remember_pings(results)
+
+    def _needs_check(self, bench_config: Dict[str, Any]) -> bool:
+        """Whether checking this bench would run the checks (no fresh cache, breaker closed)."""
+        bench_id = bench_config.get("bench_id", "UNKNOWN")
+        key = self._cache_key(bench_id, bench_config.get("connection", {}))
+        now = time.monotonic()
+        with self._state_lock:
+            entry = self._result_cache.get(key)
+            if entry is not None and now - entry[0] < self.result_ttl_sec:
+                return False
+            tripped_at = self._broken.get(bench_id)
+        return tripped_at is None or now - tripped_at >= self.BREAKER_COOLDOWN_SEC
+
+    def _fping(self, targets: List[str]) -> Optional[Dict[str, bool]]:
+        """Ping ``targets`` with one fping run; None if fping could not run."""
+        try:
+            proc = subprocess.run(
+                ["fping", "-a", "-q", "-t", str(self.ping_timeout_sec * 1000), *targets],
+                capture_output=True,
+                text=True,
+                timeout=self.ping_timeout_sec + 5,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.debug("fping unavailable ({}) for {} hosts", e, len(targets))
+            return None
+
+        # fping exits 0 (all alive), 1 (some unreachable) or 2 (unknown host);
+        # anything else means it could not run
+        if proc.returncode > 2:
+            return None
+        alive = set(proc.stdout.split())
+        return {ip: ip in alive for ip in targets}
+
+    def _remember_pings(self, results: Dict[str, bool]) -> None:
+        """Store ping results for the next ping checks, dropping expired ones."""
+        now = time.monotonic()
+        with self._state_lock:
+            expired = [
+                ip for ip, (at, _) in self._ping_results.items()
+                if now - at >= self.BATCH_PING_MAX_AGE_SEC
+            ]
+            for ip in expired:
+                del self._ping_results[ip]
+            self._ping_results.update((ip, (now, ok)) for ip, ok in results.items())
+
+    def _take_batch_ping(self, ip: str) -> Optional[bool]:
+        """Consume a recent batch_ping() result for ``ip``, if there is one."""
+        with self._state_lock:
+            entry = self._ping_results.pop(ip, None)
+        if entry is None or time.monotonic() - entry[0] >= self.BATCH_PING_MAX_AGE_SEC:
+            return None
+        return entry[1]
 
     def check_bench(self, bench_config: Dict[str, Any]) -> HealthCheckResult:
         """
         Perform a full health check on a test bench.
 
-        Runs all checks: UUT ping, PSU verify, PTP connectivity.
+        Runs all checks: UUT ping, PSU verify, PTP connectivity. The checks
+        are independent, so with ``parallel_checks`` they run on a small
+        thread pool and the bench costs the slowest check, not their sum.
+        A healthy result is reused for ``result_ttl_sec`` seconds if set; a bench
+        that keeps failing is reported unhealthy without running any check
+        until its circuit breaker cools down.
 
         Args:
             bench_config: Bench configuration dictionary with connection details.
@@ -121,23 +421,114 @@ class HealthChecker:
         """
         bench_id = bench_config.get("bench_id", "UNKNOWN")
         connection = bench_config.get("connection", {})
+        cache_key = self._cache_key(bench_id, connection)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            return cached
+        suspended = self._open_circuit_result(bench_id)
+        if suspended is not None:
+            return suspended
 
-        logger.info(f"Starting health check for bench: {bench_id}")
+        logger.info("Starting health check for bench: {}", bench_id)
 
         result = HealthCheckResult(bench_id=bench_id)
+        conn = BenchConnection.from_dict(connection)
         checks_to_run = [
-            ("ping_uut", self._check_ping_uut, connection),
-            ("verify_psu", self._check_verify_psu, connection),
-            ("ptp_connectivity", self._check_ptp_connectivity, connection),
+            ("ping_uut", self._check_ping_uut, conn),
+            ("verify_psu", self._check_verify_psu, conn),
+            ("ptp_connectivity", self._check_ptp_connectivity, conn),
         ]
 
-        for check_name, check_fn, conn_data in checks_to_run:
-            passed = self._run_check_with_retry(
-                check_name, check_fn, conn_data, bench_id
-            )
-            result.checks[check_name] = passed
-            if not passed:
-                result.healthy = False
+        if self.parallel_checks:
+            with ThreadPoolExecutor(max_workers=len(checks_to_run)) as executor:
+                futures = [
+                    (check_name, executor.submit(
+                        self._run_check_with_retry, check_name, check_fn, conn_data, bench_id
+                    ))
+                    for check_name, check_fn, conn_data in checks_to_run
+                ]
+                # Collect in submission order so results stay deterministic
+                outcomes = [(check_name, fut.result()) for check_name, fut in futures]
+        else:
+            outcomes = [
+                (check_name, self._run_check_with_retry(
+                    check_name, check_fn, conn_data, bench_id
+                ))
+                for check_name, check_fn, conn_data in checks_to_run
+            ]
+
+        self._summarize(result, outcomes, connection)
+        self._record_result(cache_key, result)
+        return result
+
+    def check_benches(self, bench_configs: List[Dict[str, Any]]) -> List[HealthCheckResult]:
+        """
+        Health-check several benches at once.
+
+        Benches are checked concurrently on an event loop, so a fleet costs
+        roughly one ping timeout of wall-clock instead of one per bench.
+        Must not be called from inside a running event loop.
+
+        Args:
+            bench_configs: Bench configuration dictionaries.
+
+        Returns:
+            One HealthCheckResult per bench, in input order.
+        """
+        async def _run_all() -> List[HealthCheckResult]:
+            return list(await asyncio.gather(
+                *(self.acheck_bench(cfg) for cfg in bench_configs)
+            ))
+
+        return asyncio.run(_run_all())
+
+    async def acheck_bench(self, bench_config: Dict[str, Any]) -> HealthCheckResult:
+        """
+        Async variant of :meth:`check_bench`.
+
+        The UUT ping runs as an asynchronous subprocess; the remaining checks
+        run in the default executor. All three are awaited together.
+        """
+        bench_id = bench_config.get("bench_id", "UNKNOWN")
+        connection = bench_config.get("connection", {})
+        cache_key = self._cache_key(bench_id, connection)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            return cached
+        suspended = self._open_circuit_result(bench_id)
+        if suspended is not None:
+            return suspended
+
+        logger.info("Starting health check for bench: {}", bench_id)
+
+        result = HealthCheckResult(bench_id=bench_id)
+        conn = BenchConnection.from_dict(connection)
+        passed = await asyncio.gather(
+            self._arun_ping_with_retry(conn, bench_id),
+            asyncio.to_thread(
+                self._run_check_with_retry,
+                "verify_psu", self._check_verify_psu, conn, bench_id,
+            ),
+            asyncio.to_thread(
+                self._run_check_with_retry,
+                "ptp_connectivity", self._check_ptp_connectivity, conn, bench_id,
+            ),
+        )
+        outcomes = list(zip(("ping_uut", "verify_psu", "ptp_connectivity"), passed))
+        self._summarize(result, outcomes, connection)
+        self._record_result(cache_key, result)
+        return result
+
+    def _summarize(
+        self,
+        result: HealthCheckResult,
+        outcomes: List[Tuple[str, bool]],
+        connection: Dict[str, Any],
+    ) -> None:
+        """Record check outcomes on the result and build its summary."""
+        bench_id = result.bench_id
+        for check_name, passed in outcomes:
+            result.set_check(check_name, passed)
 
         # Build summary message
         if result.healthy:
@@ -154,16 +545,14 @@ class HealthChecker:
             "bench_id": bench_id,
             "connection": connection,
             "checks_run": len(result.checks),
-            "checks_passed": sum(1 for v in result.checks.values() if v),
+            "checks_passed": len(result.checks) - len(result.failed_checks),
         }
 
-        return result
-
     def _run_check_with_retry(
         self,
         check_name: str,
         check_fn: Any,
-        connection: Dict[str, Any],
+        connection: BenchConnection,
         bench_id: str,
     ) -> bool:
         """Run a single check with retries."""
@@ -173,50 +562,126 @@ class HealthChecker:
                 if passed:
                     return True
                 logger.debug(
-                    f"Check '{check_name}' failed for {bench_id} "
-                    f"(attempt {attempt}/{self.retry_count})"
+                    "Check '{}' failed for {} (attempt {}/{})",
+                    check_name, bench_id, attempt, self.retry_count,
                 )
             except Exception as e:
                 logger.error(
                     f"Check '{check_name}' raised exception for {bench_id}: {e} "
                     f"(attempt {attempt}/{self.retry_count})"
                 )
+            if attempt < self.retry_count:
+                time.sleep(self._backoff_delay(attempt))
+        return False
+
+    async def _arun_ping_with_retry(
+        self, connection: BenchConnection, bench_id: str
+    ) -> bool:
+        """Run the UUT ping check with retries without blocking the loop."""
+        if self.mock_mode:
+            return self._run_check_with_retry(
+                "ping_uut", self._check_ping_uut, connection, bench_id
+            )
+        uut_ip = connection.uut_ip
+        for attempt in range(1, self.retry_count + 1):
+            alive = self._take_batch_ping(uut_ip) if attempt == 1 else None
+            if alive is None:
+                alive = await self._aping(uut_ip)
+            if alive:
+                return True
+            logger.debug(
+                "Check 'ping_uut' failed for {} (attempt {}/{})",
+                bench_id, attempt, self.retry_count,
+            )
+            if attempt < self.retry_count:
+                await asyncio.sleep(self._backoff_delay(attempt))
         return False
 
+    async def _aping(self, ip: str) -> bool:
+        """Send a single ICMP echo without blocking the event loop."""
+        if ICMPLIB_AVAILABLE:
+            try:
+                host = await icmp_async_ping(
+                    ip, count=1, timeout=self.ping_timeout_sec, privileged=False
+                )
+                return host.is_alive
+            except ICMPLibError as e:
+                logger.debug("icmplib ping to {} unavailable ({}), using ping subprocess", ip, e)
+
+        param = "-n" if sys.platform == "win32" else "-c"
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "ping", param, "1", "-w", str(self.ping_timeout_sec * 1000), ip,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except Exception as e:
+            logger.error(f"Ping to {ip} failed: {e}")
+            return False
+        try:
+            await asyncio.wait_for(proc.wait(), self.ping_timeout_sec + 5)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            logger.error(f"Ping to {ip} timed out")
+            return False
+        return proc.returncode == 0
+
     def _check_ping_uut(
-        self, connection: Dict[str, Any], bench_id: str
+        self, connection: BenchConnection, bench_id: str
     ) -> bool:
         """
         Check UUT reachability via ping.
 
         In mock mode: returns True unless bench is configured to fail.
-        In production: performs actual ICMP ping.
+        In production: uses a fresh batch_ping() result when there is one,
+        otherwise pings the UUT (see ``_ping``).
         """
-        uut_ip = connection.get("uut_ip", "")
+        uut_ip = connection.uut_ip
 
         if self.mock_mode:
-            mock_fails = self._mock_failures.get(bench_id, [])
-            if "ping_uut" in mock_fails:
-                logger.debug(f"[MOCK] Ping to {uut_ip} FAILED (configured mock failure)")
+            if (bench_id, "ping_uut") in self._mock_failures:
+                logger.debug("[MOCK] Ping to {} FAILED (configured mock failure)", uut_ip)
                 return False
-            logger.debug(f"[MOCK] Ping to {uut_ip} OK")
+            logger.debug("[MOCK] Ping to {} OK", uut_ip)
             return True
 
         # Production implementation (not used in PoC)
+        batched = self._take_batch_ping(uut_ip)
+        if batched is not None:
+            return batched
+        return self._ping(uut_ip)
+
+    def _ping(self, ip: str) -> bool:
+        """
+        Send a single ICMP echo to ``ip``.
+
+        Uses icmplib (unprivileged datagram socket) when installed, falling
+        back to the ``ping`` command.
+        """
+        if ICMPLIB_AVAILABLE:
+            # Echo straight from this process — no fork/exec of ping per check
+            try:
+                return icmp_ping(
+                    ip, count=1, timeout=self.ping_timeout_sec, privileged=False
+                ).is_alive
+            except ICMPLibError as e:
+                logger.debug("icmplib ping to {} unavailable ({}), using ping subprocess", ip, e)
+
         try:
             param = "-n" if sys.platform == "win32" else "-c"
             result = subprocess.run(
-                ["ping", param, "1", "-w", str(self.ping_timeout_sec * 1000), uut_ip],
+                ["ping", param, "1", "-w", str(self.ping_timeout_sec * 1000), ip],
                 capture_output=True,
                 timeout=self.ping_timeout_sec + 5,
             )
             return result.returncode == 0
         except Exception as e:
-            logger.error(f"Ping to {uut_ip} failed: {e}")
+            logger.error(f"Ping to {ip} failed: {e}")
             return False
 
     def _check_verify_psu(
-        self, connection: Dict[str, Any], bench_id: str
+        self, connection: BenchConnection, bench_id: str
     ) -> bool:
         """
         Verify PSU communication.
@@ -224,14 +689,13 @@ class HealthChecker:
         In mock mode: returns True unless bench is configured to fail.
         In production: opens a connection to the PSU and queries status.
         """
-        psu_ip = connection.get("psu_ip", "")
+        psu_ip = connection.psu_ip
 
         if self.mock_mode:
-            mock_fails = self._mock_failures.get(bench_id, [])
-            if "verify_psu" in mock_fails:
-                logger.debug(f"[MOCK] PSU verify at {psu_ip} FAILED")
+            if (bench_id, "verify_psu") in self._mock_failures:
+                logger.debug("[MOCK] PSU verify at {} FAILED", psu_ip)
                 return False
-            logger.debug(f"[MOCK] PSU at {psu_ip} verified OK")
+            logger.debug("[MOCK] PSU at {} verified OK", psu_ip)
             return True
 
         # Production: would connect to PSU and query identity/status
@@ -239,7 +703,7 @@ class HealthChecker:
         return True
 
     def _check_ptp_connectivity(
-        self, connection: Dict[str, Any], bench_id: str
+        self, connection: BenchConnection, bench_id: str
     ) -> bool:
         """
         Check PTP time server connectivity.
@@ -247,14 +711,13 @@ class HealthChecker:
         In mock mode: returns True unless bench is configured to fail.
         In production: verifies PTP service is reachable and responding.
         """
-        ptp_ip = connection.get("ptp_ip", "")
+        ptp_ip = connection.ptp_ip
 
         if self.mock_mode:
-            mock_fails = self._mock_failures.get(bench_id, [])
-            if "ptp_connectivity" in mock_fails:
-                logger.debug(f"[MOCK] PTP at {ptp_ip} FAILED")
+            if (bench_id, "ptp_connectivity") in self._mock_failures:
+                logger.debug("[MOCK] PTP at {} FAILED", ptp_ip)
                 return False
-            logger.debug(f"[MOCK] PTP at {ptp_ip} OK")
+            logger.debug("[MOCK] PTP at {} OK", ptp_ip)
             return True
 
         # Production: would verify PTP service
@@ -13,15 +13,21 @@ Design Reference: Section 6 — "Resource Manager & CI/CD Orchestration"
 
 from __future__ import annotations
 
+import asyncio
+import sys
 import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from loguru import logger
 
+from src._compat import DATACLASS_SLOTS
 from src.resource_manager.health_check import HealthChecker, HealthCheckResult
+from src.resource_manager.rwlock import ShardedRWLock
 
 
 class BenchState(Enum):
@@ -31,13 +37,23 @@ class BenchState(Enum):
     BUSY = "busy"
     MAINTENANCE = "maintenance"
     OFFLINE = "offline"
+    # Held by a request while its health checks run (never set from config)
+    RESERVED = "reserved"
 
 
-@dataclass
+def _public_state(state: BenchState) -> BenchState:
+    """State shown by status queries: a RESERVED bench is still AVAILABLE to callers."""
+    return BenchState.AVAILABLE if state is BenchState.RESERVED else state
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ResourceMetadata:
     """
     Metadata about an allocated resource, attached to test reports.
 
+    Instances are treated as immutable once handed out by the manager, so
+    ``to_dict`` builds its dictionary once and serves copies afterwards.
+
     Attributes:
         bench_id: Unique identifier of the allocated bench.
         hardware_type: Type of hardware (e.g., "radar_x_band").
@@ -45,8 +61,10 @@ class ResourceMetadata:
         psu_ip: PSU IP address.
         ptp_ip: PTP IP address.
         location: Physical location of the bench.
-        allocated_at: Timestamp of allocation.
+        allocated_at: Allocation time, ``time.monotonic_ns()`` nanoseconds.
         health_check_result: Result of the pre-flight health check.
+        epoch_offset_ns: Added to ``allocated_at`` to get epoch nanoseconds
+            for reports (0 when ``allocated_at`` is already epoch-based).
     """
 
     bench_id: str = ""
@@ -57,11 +75,20 @@ class ResourceMetadata:
     psu_port: int = 0
     uut_port: int = 0
     location: str = ""
-    allocated_at: float = 0.0
+    allocated_at: int = 0
     health_check_result: Optional[HealthCheckResult] = None
+    epoch_offset_ns: int = field(default=0, repr=False)
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to a dictionary for report attachment."""
+        if self._cached_dict is None:
+            self._cached_dict = self._build_dict()
+        return dict(self._cached_dict)
+
+    def _build_dict(self) -> Dict[str, Any]:
         return {
             "bench_id": self.bench_id,
             "hardware_type": self.hardware_type,
@@ -71,7 +98,8 @@ class ResourceMetadata:
             "psu_port": self.psu_port,
             "uut_port": self.uut_port,
             "location": self.location,
-            "allocated_at": self.allocated_at,
+            # Reports carry wall-clock seconds, as before
+            "allocated_at": (self.allocated_at + self.epoch_offset_ns) / 1e9,
             "health_check_passed": (
                 self.health_check_result.healthy
                 if self.health_check_result
@@ -80,6 +108,63 @@ class ResourceMetadata:
         }
 
 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class BenchRecord:
+    """
+    One bench from test_benches.yaml, parsed once at load time.
+
+    Attributes:
+        bench_id: Unique identifier of the bench.
+        hardware_type: Type of hardware ("" when not configured).
+        location: Physical location of the bench.
+        uut_ip: UUT IP address.
+        psu_ip: PSU IP address.
+        ptp_ip: PTP IP address.
+        psu_port: PSU output port.
+        uut_port: UUT control port.
+        connection: The raw ``connection`` mapping, reported in bench status.
+        config: The raw bench entry, passed to the health checker.
+    """
+
+    bench_id: str
+    hardware_type: str = ""
+    location: str = ""
+    uut_ip: str = ""
+    psu_ip: str = ""
+    ptp_ip: str = ""
+    psu_port: int = 0
+    uut_port: int = 0
+    connection: Dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
+    config: Dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
+
+    @classmethod
+    def from_config(cls, bench: Dict[str, Any]) -> "BenchRecord":
+        """Build from a bench config entry, interning the indexed strings."""
+        connection = bench.get("connection", {})
+        return cls(
+            bench_id=bench.get("bench_id", ""),
+            # Interned so index lookups keyed by these values compare by identity
+            hardware_type=sys.intern(bench.get("hardware_type") or ""),
+            location=sys.intern(bench.get("location") or ""),
+            uut_ip=connection.get("uut_ip", ""),
+            psu_ip=connection.get("psu_ip", ""),
+            ptp_ip=connection.get("ptp_ip", ""),
+            psu_port=connection.get("psu_port", 0),
+            uut_port=connection.get("uut_port", 0),
+            connection=connection,
+            config=bench,
+        )
+
+
+def _in_event_loop() -> bool:
+    """True when called from inside a running asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 class ResourceAllocationError(Exception):
     """Raised when a resource cannot be allocated."""
 
@@ -107,10 +192,19 @@ class ResourceManager:
         # Release the bench
         rm.release_resource(metadata.bench_id)
 
+    Healthy results are reused by the health checker for
+    ``health_check.result_ttl_sec`` seconds, so back-to-back requests do not
+    probe the same bench twice in a row.
+
     Thread Safety:
-        All allocation/release operations are thread-safe via a threading lock.
+        Allocation, release and state changes take a sharded reader-writer
+        lock exclusively; status queries share it, so dashboards polling
+        bench status do not serialize behind each other.
     """
 
+    # Longest a request waits for other requests' health checks to settle
+    RESERVATION_WAIT_SEC = 60.0
+
     def __init__(
         self,
         benches_config: Optional[Dict[str, Any]] = None,
@@ -125,13 +219,29 @@ class ResourceManager:
             max_concurrent_jobs: Maximum number of concurrent allocations.
             health_checker: HealthChecker instance (created if not provided).
         """
-        self._lock = threading.Lock()
+        self._rwlock = ShardedRWLock()
+        # Converts monotonic allocation stamps to wall-clock time for reports
+        self._epoch_offset_ns = time.time_ns() - time.monotonic_ns()
         self._max_concurrent_jobs = max_concurrent_jobs
 
         # Parse bench inventory
-        self._benches: Dict[str, Dict[str, Any]] = {}
+        self._benches: Dict[str, BenchRecord] = {}
         self._bench_states: Dict[str, BenchState] = {}
+        # hardware_type -> bench IDs in config (priority) order, fixed after load
+        self._by_type: Dict[str, Tuple[str, ...]] = {}
+        # hardware_type -> bench IDs currently AVAILABLE (kept by _transition)
+        self._available_by_type: Dict[str, Set[str]] = {}
+        # hardware_type -> number of benches currently RESERVED (kept by _transition)
+        self._reserved_by_type: Counter[str] = Counter()
+        # Benches per state, kept by _transition so counts never rescan
+        self._state_counts: Counter[BenchState] = Counter()
         self._allocations: Dict[str, str] = {}  # bench_id -> job_id
+        # Requests that reserved benches and are still health-checking them
+        self._pending_requests = 0
+        # Notified each time a request settles its reservations; the counter
+        # lets a waiter notice settlements that happened before it waited
+        self._settled = threading.Condition()
+        self._settle_count = 0
 
         if benches_config:
             self._load_benches(benches_config)
@@ -142,18 +252,20 @@ class ResourceManager:
             ping_timeout_sec=health_config.get("ping_timeout_sec", 5),
             psu_verify_timeout_sec=health_config.get("psu_verify_timeout_sec", 10),
             retry_count=health_config.get("retry_count", 2),
+            result_ttl_sec=health_config.get("result_ttl_sec", 15.0),
             mock_mode=True,  # PoC always uses mock mode
         )
         self._mark_offline_on_failure = health_config.get("mark_offline_on_failure", True)
 
         logger.info(
-            f"ResourceManager initialized — {len(self._benches)} benches, "
-            f"max_concurrent={self._max_concurrent_jobs}"
+            "ResourceManager initialized — {} benches, max_concurrent={}",
+            len(self._benches), self._max_concurrent_jobs,
         )
 
     def _load_benches(self, config: Dict[str, Any]) -> None:
         """Load bench definitions from configuration."""
         benches_list = config.get("benches", [])
+        by_type: Dict[str, List[str]] = {}
 
         for bench in benches_list:
             bench_id = bench.get("bench_id", "")
@@ -161,28 +273,60 @@ class ResourceManager:
                 logger.warning("Skipping bench with no bench_id")
                 continue
 
-            self._benches[bench_id] = bench
+            record = BenchRecord.from_config(bench)
+            self._benches[bench_id] = record
+            hardware_type = record.hardware_type
+            by_type.setdefault(hardware_type, []).append(bench_id)
+            self._available_by_type.setdefault(hardware_type, set())
 
             state_str = bench.get("state", "available").lower()
             try:
                 self._bench_states[bench_id] = BenchState(state_str)
             except ValueError:
                 logger.warning(
-                    f"Unknown state '{state_str}' for bench {bench_id}, "
-                    f"defaulting to OFFLINE"
+                    "Unknown state '{}' for bench {}, defaulting to OFFLINE",
+                    state_str, bench_id,
                 )
                 self._bench_states[bench_id] = BenchState.OFFLINE
-
-        logger.info(
-            f"Loaded {len(self._benches)} benches: "
-            f"{self._count_by_state()}"
+            if self._bench_states[bench_id] is BenchState.AVAILABLE:
+                self._available_by_type[hardware_type].add(bench_id)
+            elif self._bench_states[bench_id] is BenchState.RESERVED:
+                self._reserved_by_type[hardware_type] += 1
+
+        # The inventory does not change after load, so the per-type priority
+        # order is computed once here rather than on every request
+        self._by_type = {hw: tuple(ids) for hw, ids in by_type.items()}
+        self._state_counts = Counter(self._bench_states.values())
+
+        logger.opt(lazy=True).info(
+            "Loaded {} benches: {}",
+            lambda: len(self._benches), self._count_by_state,
         )
 
+    def _transition(self, bench_id: str, state: BenchState) -> None:
+        """Set a bench's state, keeping the availability index and counts in step."""
+        old_state = self._bench_states[bench_id]
+        self._bench_states[bench_id] = state
+        self._state_counts[old_state] -= 1
+        self._state_counts[state] += 1
+        hardware_type = self._benches[bench_id].hardware_type
+        if old_state is BenchState.RESERVED:
+            self._reserved_by_type[hardware_type] -= 1
+        if state is BenchState.RESERVED:
+            self._reserved_by_type[hardware_type] += 1
+        available = self._available_by_type[hardware_type]
+        if state is BenchState.AVAILABLE:
+            available.add(bench_id)
+        else:
+            available.discard(bench_id)
+
     def _count_by_state(self) -> Dict[str, int]:
-        """Count benches by state."""
+        """Count benches by public state (RESERVED counts as available)."""
         counts: Dict[str, int] = {}
-        for state in self._bench_states.values():
-            counts[state.value] = counts.get(state.value, 0) + 1
+        for state, n in self._state_counts.items():
+            if n:
+                key = _public_state(state).value
+                counts[key] = counts.get(key, 0) + n
         return counts
 
     # ------------------------------------------------------------------
@@ -194,6 +338,7 @@ class ResourceManager:
         hardware_type: str,
         job_id: str = "",
         skip_health_check: bool = False,
+        force_refresh: bool = False,
     ) -> ResourceMetadata:
         """
         Request a test bench of the specified hardware type.
@@ -201,10 +346,18 @@ class ResourceManager:
         Finds an available bench matching the hardware type, performs
         a health check, and locks it for exclusive use.
 
+        The candidates are RESERVED while their health checks run, so the
+        manager lock is not held across the network I/O: other requests,
+        releases and status queries proceed in the meantime. A request that
+        finds every matching bench reserved waits (up to
+        ``RESERVATION_WAIT_SEC``) for those checks to settle and tries again.
+
         Args:
             hardware_type: Required hardware type (e.g., "radar_x_band").
             job_id: Optional job identifier for tracking.
             skip_health_check: Skip the pre-flight health check.
+            force_refresh: Ignore cached health results and probe every
+                candidate again.
 
         Returns:
             ResourceMetadata with bench details for test reports.
@@ -212,78 +365,157 @@ class ResourceManager:
         Raises:
             ResourceAllocationError: If no bench is available or all fail health checks.
         """
-        with self._lock:
-            logger.info(
-                f"Resource request: hardware_type={hardware_type}, job_id={job_id}"
-            )
-
-            # Check concurrent job limit
-            current_allocations = len(self._allocations)
-            if current_allocations >= self._max_concurrent_jobs:
-                raise ResourceAllocationError(
-                    f"Maximum concurrent jobs reached ({self._max_concurrent_jobs}). "
-                    f"Currently {current_allocations} benches allocated."
-                )
-
-            # Find matching available benches
-            candidates = self._find_candidates(hardware_type)
-
-            if not candidates:
-                available_types = self._get_available_types()
+        hardware_type = sys.intern(hardware_type)
+        logger.info(
+            "Resource request: hardware_type={}, job_id={}", hardware_type, job_id
+        )
+        deadline = time.monotonic() + self.RESERVATION_WAIT_SEC
+        while True:
+            with self._rwlock.write():
+                # Check concurrent job limit (requests still health-checking count)
+                current_allocations = len(self._allocations) + self._pending_requests
+                if current_allocations >= self._max_concurrent_jobs:
+                    raise ResourceAllocationError(
+                        f"Maximum concurrent jobs reached ({self._max_concurrent_jobs}). "
+                        f"Currently {current_allocations} benches allocated."
+                    )
+
+                # Find matching available benches
+                candidates = self._find_candidates(hardware_type)
+
+                if candidates:
+                    if skip_health_check:
+                        return self._allocate(candidates[0], hardware_type, job_id, None)
+
+                    # Reserve the candidates so no other request can take them while
+                    # this one health-checks them without holding the lock
+                    for bench_id in candidates:
+                        self._transition(bench_id, BenchState.RESERVED)
+                    self._pending_requests += 1
+                    break
+
+                if not self._has_reserved(hardware_type):
+                    available_types = self._get_available_types()
+                    raise ResourceAllocationError(
+                        f"No available bench for hardware_type='{hardware_type}'. "
+                        f"Available types: {available_types}"
+                    )
+                seen = self._settle_count
+
+            # Every free bench of the type is being checked by another request;
+            # one of them may come back AVAILABLE once that request settles
+            logger.debug("Waiting for reserved '{}' benches to settle", hardware_type)
+            if not self._wait_for_settlement(seen, deadline):
                 raise ResourceAllocationError(
-                    f"No available bench for hardware_type='{hardware_type}'. "
-                    f"Available types: {available_types}"
-                )
-
-            # Try to allocate, running health checks
-            for bench_id in candidates:
-                bench_config = self._benches[bench_id]
-
-                if not skip_health_check:
-                    health_result = self._health_checker.check_bench(bench_config)
-
-                    if not health_result.healthy:
-                        logger.warning(
-                            f"Bench {bench_id} failed health check: "
-                            f"{health_result.message}"
-                        )
-                        if self._mark_offline_on_failure:
-                            self._bench_states[bench_id] = BenchState.OFFLINE
-                            logger.info(f"Bench {bench_id} marked OFFLINE")
-                        continue
-                else:
-                    health_result = None
-
-                # Allocate the bench
-                self._bench_states[bench_id] = BenchState.BUSY
-                effective_job_id = job_id or f"auto-{bench_id}-{int(time.time())}"
-                self._allocations[bench_id] = effective_job_id
-
-                connection = bench_config.get("connection", {})
-                metadata = ResourceMetadata(
-                    bench_id=bench_id,
-                    hardware_type=hardware_type,
-                    uut_ip=connection.get("uut_ip", ""),
-                    psu_ip=connection.get("psu_ip", ""),
-                    ptp_ip=connection.get("ptp_ip", ""),
-                    psu_port=connection.get("psu_port", 0),
-                    uut_port=connection.get("uut_port", 0),
-                    location=bench_config.get("location", ""),
-                    allocated_at=time.time(),
-                    health_check_result=health_result,
+                    f"No available bench for hardware_type='{hardware_type}': "
+                    f"all matching benches stayed reserved for "
+                    f"{self.RESERVATION_WAIT_SEC:.0f}s."
                 )
 
-                logger.info(
-                    f"Bench {bench_id} allocated to job '{effective_job_id}' "
-                    f"(UUT: {metadata.uut_ip})"
+        health_results: Dict[str, HealthCheckResult] = {}
+        try:
+            health_results = self._run_health_checks(candidates, force_refresh)
+        finally:
+            with self._rwlock.write():
+                self._pending_requests -= 1
+                metadata = self._settle_reservations(
+                    candidates, health_results, hardware_type, job_id
                 )
-                return metadata
+            with self._settled:
+                self._settle_count += 1
+                self._settled.notify_all()
 
+        if metadata is None:
             # All candidates failed health checks
             raise ResourceAllocationError(
                 f"All {len(candidates)} candidate bench(es) for "
                 f"hardware_type='{hardware_type}' failed health checks."
             )
+        return metadata
+
+    def _has_reserved(self, hardware_type: str) -> bool:
+        """Whether any bench of the type is RESERVED (write lock held)."""
+        return self._reserved_by_type[hardware_type] > 0
+
+    def _wait_for_settlement(self, seen: int, deadline: float) -> bool:
+        """Wait until a request settles after ``seen``; False once ``deadline`` passes."""
+        with self._settled:
+            return self._settled.wait_for(
+                lambda: self._settle_count != seen,
+                timeout=max(0.0, deadline - time.monotonic()),
+            )
+
+    def _settle_reservations(
+        self,
+        candidates: List[str],
+        health_results: Dict[str, HealthCheckResult],
+        hardware_type: str,
+        job_id: str,
+    ) -> Optional[ResourceMetadata]:
+        """
+        Resolve reserved candidates once their health checks are done.
+
+        Walks the candidates in priority order: the first healthy one is
+        allocated, failures ahead of it are taken OFFLINE (if configured)
+        and every other reservation goes back to AVAILABLE. A bench whose
+        state was changed by someone else meanwhile is left alone. Must be
+        called with the write lock held.
+        """
+        metadata: Optional[ResourceMetadata] = None
+        for bench_id in candidates:
+            if self._bench_states.get(bench_id) is not BenchState.RESERVED:
+                continue
+            health_result = health_results.get(bench_id)
+            if metadata is not None or health_result is None:
+                self._transition(bench_id, BenchState.AVAILABLE)
+            elif health_result.healthy:
+                metadata = self._allocate(bench_id, hardware_type, job_id, health_result)
+            else:
+                logger.warning(
+                    "Bench {} failed health check: {}", bench_id, health_result.message
+                )
+                if self._mark_offline_on_failure:
+                    self._transition(bench_id, BenchState.OFFLINE)
+                    logger.info("Bench {} marked OFFLINE", bench_id)
+                else:
+                    self._transition(bench_id, BenchState.AVAILABLE)
+        return metadata
+
+    def _allocate(
+        self,
+        bench_id: str,
+        hardware_type: str,
+        job_id: str,
+        health_result: Optional[HealthCheckResult],
+    ) -> ResourceMetadata:
+        """Mark a bench BUSY for a job and build its metadata (write lock held)."""
+        bench = self._benches[bench_id]
+        self._transition(bench_id, BenchState.BUSY)
+        allocated_at = time.monotonic_ns()
+        effective_job_id = job_id or (
+            f"auto-{bench_id}-{(allocated_at + self._epoch_offset_ns) // 1_000_000_000}"
+        )
+        self._allocations[bench_id] = effective_job_id
+
+        metadata = ResourceMetadata(
+            bench_id=bench_id,
+            hardware_type=hardware_type,
+            uut_ip=bench.uut_ip,
+            psu_ip=bench.psu_ip,
+            ptp_ip=bench.ptp_ip,
+            psu_port=bench.psu_port,
+            uut_port=bench.uut_port,
+            location=bench.location,
+            allocated_at=allocated_at,
+            health_check_result=health_result,
+            epoch_offset_ns=self._epoch_offset_ns,
+        )
+
+        logger.info(
+            "Bench {} allocated to job '{}' (UUT: {})",
+            bench_id, effective_job_id, metadata.uut_ip,
+        )
+        return metadata
 
     def release_resource(self, bench_id: str) -> bool:
         """
@@ -297,16 +529,18 @@ class ResourceManager:
         Returns:
             True if the bench was released, False if it wasn't allocated.
         """
-        with self._lock:
+        with self._rwlock.write():
             if bench_id not in self._allocations:
-                logger.warning(f"Bench {bench_id} is not currently allocated")
+                logger.warning("Bench {} is not currently allocated", bench_id)
                 return False
 
             job_id = self._allocations.pop(bench_id)
-            self._bench_states[bench_id] = BenchState.AVAILABLE
+            self._transition(bench_id, BenchState.AVAILABLE)
+            # The job may have left the bench in a different state
+            self._health_checker.invalidate(bench_id)
 
             logger.info(
-                f"Bench {bench_id} released from job '{job_id}' — now AVAILABLE"
+                "Bench {} released from job '{}' — now AVAILABLE", bench_id, job_id
             )
             return True
 
@@ -320,51 +554,65 @@ class ResourceManager:
         Returns:
             Dictionary with bench status details, or None if not found.
         """
-        if bench_id not in self._benches:
-            return None
+        with self._rwlock.read():
+            bench = self._benches.get(bench_id)
+            if bench is None:
+                return None
 
-        bench = self._benches[bench_id]
-        state = self._bench_states.get(bench_id, BenchState.OFFLINE)
-        job_id = self._allocations.get(bench_id)
+            state = self._bench_states.get(bench_id, BenchState.OFFLINE)
+            job_id = self._allocations.get(bench_id)
 
         return {
             "bench_id": bench_id,
-            "hardware_type": bench.get("hardware_type", ""),
-            "state": state.value,
+            "hardware_type": bench.hardware_type,
+            "state": _public_state(state).value,
             "allocated_to": job_id,
-            "location": bench.get("location", ""),
-            "connection": bench.get("connection", {}),
+            "location": bench.location,
+            "connection": bench.connection,
         }
 
     def get_all_bench_statuses(self) -> List[Dict[str, Any]]:
         """Get status of all benches."""
-        statuses = []
-        for bench_id in self._benches:
-            status = self.get_bench_status(bench_id)
-            if status:
-                statuses.append(status)
-        return statuses
+        with self._rwlock.read():
+            # Every loaded bench has a state; one pass gives a consistent snapshot
+            states = self._bench_states
+            allocations = self._allocations
+            return [
+                {
+                    "bench_id": bench_id,
+                    "hardware_type": bench.hardware_type,
+                    "state": _public_state(states[bench_id]).value,
+                    "allocated_to": allocations.get(bench_id),
+                    "location": bench.location,
+                    "connection": bench.connection,
+                }
+                for bench_id, bench in self._benches.items()
+            ]
 
     def get_available_count(self, hardware_type: Optional[str] = None) -> int:
         """
         Get the number of available benches, optionally filtered by type.
 
+        Benches reserved for an in-flight health check count as available,
+        matching the state reported by the status queries.
+
         Args:
             hardware_type: Filter by hardware type (None for all types).
 
         Returns:
             Count of available benches.
         """
-        count = 0
-        for bench_id, state in self._bench_states.items():
-            if state != BenchState.AVAILABLE:
-                continue
+        with self._rwlock.read():
             if hardware_type:
-                bench = self._benches.get(bench_id, {})
-                if bench.get("hardware_type") != hardware_type:
-                    continue
-            count += 1
-        return count
+                hardware_type = sys.intern(hardware_type)
+                return (
+                    len(self._available_by_type.get(hardware_type, ()))
+                    + self._reserved_by_type[hardware_type]
+                )
+            return (
+                sum(len(ids) for ids in self._available_by_type.values())
+                + sum(self._reserved_by_type.values())
+            )
 
     def set_bench_state(self, bench_id: str, state: BenchState) -> bool:
         """
@@ -377,21 +625,22 @@ class ResourceManager:
         Returns:
             True if the state was set, False if bench not found.
         """
-        with self._lock:
-            if bench_id not in self._benches:
-                logger.warning(f"Bench {bench_id} not found")
+        with self._rwlock.write():
+            # Every loaded bench has a state, so one lookup doubles as the check
+            old_state = self._bench_states.get(bench_id)
+            if old_state is None:
+                logger.warning("Bench {} not found", bench_id)
                 return False
 
-            old_state = self._bench_states.get(bench_id, BenchState.OFFLINE)
-            self._bench_states[bench_id] = state
+            self._transition(bench_id, state)
 
             # Clean up allocation if moving away from BUSY
-            if old_state == BenchState.BUSY and state != BenchState.BUSY:
+            if old_state is BenchState.BUSY and state is not BenchState.BUSY:
                 self._allocations.pop(bench_id, None)
 
             logger.info(
-                f"Bench {bench_id} state changed: "
-                f"{old_state.value} -> {state.value}"
+                "Bench {} state changed: {} -> {}",
+                bench_id, old_state.value, state.value,
             )
             return True
 
@@ -403,7 +652,8 @@ class ResourceManager:
     @property
     def current_allocations(self) -> int:
         """Return the number of currently allocated benches."""
-        return len(self._allocations)
+        with self._rwlock.read():
+            return len(self._allocations)
 
     @property
     def health_checker(self) -> HealthChecker:
@@ -414,27 +664,65 @@ class ResourceManager:
     # Private Helpers
     # ------------------------------------------------------------------
 
+    def _run_health_checks(
+        self, candidates: List[str], force_refresh: bool
+    ) -> Dict[str, HealthCheckResult]:
+        """
+        Health-check all candidates at once.
+
+        Candidates are probed together on one event loop
+        (``HealthChecker.check_benches``), so the phase costs the slowest
+        bench rather than the sum and no thread is spawned per bench; the
+        checker answers recently healthy benches from its result cache.
+        Callers consume the results in candidate order, so only benches
+        ahead of the winner are ever acted on.
+        """
+        if force_refresh:
+            for bench_id in candidates:
+                self._health_checker.invalidate(bench_id)
+
+        configs = [self._benches[bench_id].config for bench_id in candidates]
+        if len(configs) > 1:
+            # One fping run for the UUTs that will really be pinged; the
+            # per-bench ping checks below use its results
+            self._health_checker.prefetch_pings(configs)
+
+        if len(configs) == 1:
+            probed = [self._health_checker.check_bench(configs[0])]
+        elif _in_event_loop():
+            # asyncio.run cannot nest inside a running loop; fall back to threads
+            with ThreadPoolExecutor(
+                max_workers=len(configs), thread_name_prefix="bench-health"
+            ) as executor:
+                probed = list(executor.map(self._health_checker.check_bench, configs))
+        else:
+            probed = self._health_checker.check_benches(configs)
+        return dict(zip(candidates, probed))
+
     def _find_candidates(self, hardware_type: str) -> List[str]:
-        """Find available benches matching the given hardware type."""
-        candidates = []
-        for bench_id, bench in self._benches.items():
-            if bench.get("hardware_type") != hardware_type:
-                continue
-            if self._bench_states.get(bench_id) != BenchState.AVAILABLE:
-                continue
-            candidates.append(bench_id)
+        """Find available benches matching the given hardware type, in config order."""
+        available = self._available_by_type.get(hardware_type)
+        if not available:
+            candidates: List[str] = []
+        else:
+            ordered = self._by_type[hardware_type]
+            if len(available) == len(ordered):
+                # Every bench of the type is free: no filtering needed
+                candidates = list(ordered)
+            else:
+                candidates = [b for b in ordered if b in available]
 
         logger.debug(
-            f"Found {len(candidates)} candidate(s) for "
-            f"hardware_type='{hardware_type}': {candidates}"
+            "Found {} candidate(s) for hardware_type='{}': {}",
+            len(candidates), hardware_type, candidates,
         )
         return candidates
 
     def _get_available_types(self) -> List[str]:
         """Get list of hardware types that have available benches."""
-        types = set()
-        for bench_id, bench in self._benches.items():
-            if self._bench_states.get(bench_id) == BenchState.AVAILABLE:
-                types.add(bench.get("hardware_type", "unknown"))
-        return sorted(types)
+        return sorted(
+            hardware_type or "unknown"
+            for hardware_type, available in self._available_by_type.items()
+            if available
+        )
 
@@ -0,0 +1,90 @@
+"""
+Sharded Reader-Writer Lock.
+
+A "big-reader" lock for read-mostly state: the lock is split into one
+re-entrant shard per CPU. A reader takes only the shard picked by its
+thread ID, so concurrent readers rarely contend; a writer takes every
+shard (always in the same order), which excludes all readers and writers.
+
+Usage::
+
+    lock = ShardedRWLock()
+    with lock.read():
+        ...  # shared access
+    with lock.write():
+        ...  # exclusive access
+
+Both modes are re-entrant for the owning thread, including a read inside a
+write; upgrading a read to a write is not supported (it would deadlock).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Optional, Tuple
+
+
+class _ReadGuard:
+    """Context manager holding the calling thread's shard."""
+
+    __slots__ = ("_shards",)
+
+    def __init__(self, shards: Tuple[Any, ...]) -> None:
+        self._shards = shards
+
+    def __enter__(self) -> None:
+        shards = self._shards
+        shards[threading.get_native_id() % len(shards)].acquire()
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        shards = self._shards
+        shards[threading.get_native_id() % len(shards)].release()
+
+
+class _WriteGuard:
+    """Context manager holding every shard."""
+
+    __slots__ = ("_shards",)
+
+    def __init__(self, shards: Tuple[Any, ...]) -> None:
+        self._shards = shards
+
+    def __enter__(self) -> None:
+        for shard in self._shards:
+            shard.acquire()
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        for shard in reversed(self._shards):
+            shard.release()
+
+
+class ShardedRWLock:
+    """
+    Reader-writer lock with per-CPU reader shards.
+
+    Args:
+        shards: Number of shards (defaults to the CPU count).
+    """
+
+    __slots__ = ("_shards", "_read_guard", "_write_guard")
+
+    def __init__(self, shards: Optional[int] = None) -> None:
+        count = max(1, shards or os.cpu_count() or 1)
+        self._shards = tuple(threading.RLock() for _ in range(count))
+        # Guards are stateless, so one instance of each is shared by all threads
+        self._read_guard = _ReadGuard(self._shards)
+        self._write_guard = _WriteGuard(self._shards)
+
+    @property
+    def shard_count(self) -> int:
+        """Number of reader shards."""
+        return len(self._shards)
+
+    def read(self) -> _ReadGuard:
+        """Return a context manager for shared (read) access."""
+        return self._read_guard
+
+    def write(self) -> _WriteGuard:
+        """Return a context manager for exclusive (write) access."""
+        return self._write_guard
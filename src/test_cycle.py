@@ -15,10 +15,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
+from src._compat import DATACLASS_SLOTS
+
 
 class CycleType(Enum):
     """Test cycle types."""
@@ -33,7 +35,7 @@ class EnvironmentType(Enum):
     OVEN = "oven"       # 1 radar, thermal tests
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TestCycleConfig:
     """Configuration for a test cycle execution."""
     cycle_type: CycleType
@@ -59,13 +61,22 @@ TEST_SET_REGISTRY: Dict[str, Dict[str, str]] = {
     },
 }
 
-# Mapping: cycle_type -> pytest markers to select
-CYCLE_MARKERS: Dict[str, List[str]] = {
-    "nightly": ["functional", "smoke"],
-    "regression": ["functional", "regression", "smoke"],
-    "milestone": ["functional", "regression", "durability", "smoke"],
+# Flattened (project, cycle_type) -> test set name, for a single lookup
+_FLAT_SETS: Dict[Tuple[str, str], str] = {
+    (project, cycle): name
+    for project, sets in TEST_SET_REGISTRY.items()
+    for cycle, name in sets.items()
+}
+
+# Mapping: cycle_type -> pytest markers to select (tuples, safe to share)
+CYCLE_MARKERS: Dict[str, Tuple[str, ...]] = {
+    "nightly": ("functional", "smoke"),
+    "regression": ("functional", "regression", "smoke"),
+    "milestone": ("functional", "regression", "durability", "smoke"),
 }
 
+_DEFAULT_MARKERS: Tuple[str, ...] = ("functional",)
+
 
 def get_test_set_name(project: str, cycle_type: str) -> str:
     """
@@ -78,11 +89,10 @@ def get_test_set_name(project: str, cycle_type: str) -> str:
     Returns:
         Test Set name string.
     """
-    project_sets = TEST_SET_REGISTRY.get(project, {})
-    return project_sets.get(cycle_type, f"{project} {cycle_type.capitalize()} Set")
+    return _FLAT_SETS.get((project, cycle_type)) or f"{project} {cycle_type.capitalize()} Set"
 
 
-def get_markers_for_cycle(cycle_type: str) -> List[str]:
+def get_markers_for_cycle(cycle_type: str) -> Tuple[str, ...]:
     """
     Get the pytest markers to include for a given cycle type.
 
@@ -90,9 +100,9 @@ def get_markers_for_cycle(cycle_type: str) -> List[str]:
         cycle_type: Cycle type ("nightly", "regression", "milestone").
 
     Returns:
-        List of marker names.
+        Tuple of marker names.
     """
-    return CYCLE_MARKERS.get(cycle_type, ["functional"])
+    return CYCLE_MARKERS.get(cycle_type, _DEFAULT_MARKERS)
 
 
 def build_cycle_config(
@@ -129,17 +139,27 @@ def build_cycle_config(
         environment=env,
         fw_version=fw_version,
         test_set_key=test_set,
-        markers=markers,
+        markers=list(markers),
     )
 
     logger.info(
-        f"Test cycle configured: {ct.value} | {project} | {radar_type} | "
-        f"env={env.value} | fw={fw_version or 'latest'} | markers={markers}"
+        "Test cycle configured: {} | {} | {} | env={} | fw={} | markers={}",
+        ct.value, project, radar_type, env.value, fw_version or "latest", markers,
     )
     return config
 
 
-@dataclass
+# Frequency slots are keyed by integer channel at this resolution, so
+# 76.1 and 76.10000000001 GHz from different callers are the same slot
+_FREQ_QUANTUM_HZ = 1000
+
+
+def _freq_key(frequency_ghz: float) -> int:
+    """Quantize a GHz frequency to an integer slot key."""
+    return round(frequency_ghz * 1_000_000_000 / _FREQ_QUANTUM_HZ)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class FrequencyAllocation:
     """Tracks frequency allocation in a coffin environment."""
     bench_id: str
@@ -154,11 +174,16 @@ class CoffinInterferenceManager:
     A coffin can hold up to 4 radars. If two radars need to transmit
     on the same frequency, the second must wait until the first finishes
     or find an alternative bench.
+
+    Thread Safety:
+        A frequency is claimed with a single ``dict.setdefault`` and freed
+        with ``dict.pop``; both are atomic under the GIL, so concurrent
+        requests for one frequency have exactly one winner without a lock.
     """
 
     def __init__(self) -> None:
         self._allocations: Dict[str, FrequencyAllocation] = {}
-        self._lock_holders: Dict[float, str] = {}  # freq -> bench_id
+        self._lock_holders: Dict[int, str] = {}  # freq key -> bench_id
         logger.info("CoffinInterferenceManager initialized")
 
     def request_frequency(
@@ -174,40 +199,38 @@ class CoffinInterferenceManager:
         Returns:
             True if frequency is available and granted.
         """
-        if frequency_ghz in self._lock_holders:
-            holder = self._lock_holders[frequency_ghz]
-            if holder != bench_id:
-                logger.warning(
-                    f"Frequency {frequency_ghz} GHz is in use by {holder}. "
-                    f"Bench {bench_id} must wait."
-                )
-                return False
-
-        self._lock_holders[frequency_ghz] = bench_id
+        holder = self._lock_holders.setdefault(_freq_key(frequency_ghz), bench_id)
+        if holder != bench_id:
+            logger.warning(
+                "Frequency {} GHz is in use by {}. Bench {} must wait.",
+                frequency_ghz, holder, bench_id,
+            )
+            return False
+
         self._allocations[bench_id] = FrequencyAllocation(
             bench_id=bench_id,
             frequency_ghz=frequency_ghz,
             in_use=True,
         )
         logger.info(
-            f"Frequency {frequency_ghz} GHz allocated to bench {bench_id}"
+            "Frequency {} GHz allocated to bench {}", frequency_ghz, bench_id
         )
         return True
 
     def release_frequency(self, bench_id: str) -> None:
         """Release frequency allocation for a bench."""
-        if bench_id in self._allocations:
-            freq = self._allocations[bench_id].frequency_ghz
-            if freq in self._lock_holders and self._lock_holders[freq] == bench_id:
-                del self._lock_holders[freq]
-            del self._allocations[bench_id]
-            logger.info(
-                f"Frequency released from bench {bench_id}"
-            )
+        allocation = self._allocations.pop(bench_id, None)
+        if allocation is None:
+            return
+        # Only the holder releases its slot, so the check cannot race a claim
+        key = _freq_key(allocation.frequency_ghz)
+        if self._lock_holders.get(key) == bench_id:
+            self._lock_holders.pop(key, None)
+        logger.info("Frequency released from bench {}", bench_id)
 
     def is_frequency_available(self, frequency_ghz: float) -> bool:
         """Check if a frequency is currently available."""
-        return frequency_ghz not in self._lock_holders
+        return _freq_key(frequency_ghz) not in self._lock_holders
 
     def get_active_allocations(self) -> Dict[str, float]:
         """Get all active frequency allocations."""
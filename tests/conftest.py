@@ -16,8 +16,9 @@ hardware interactions are mocked transparently.
 from __future__ import annotations
 
 import os
+import time
 from pathlib import Path
-from typing import Any, Dict, Generator, Optional
+from typing import Any, Callable, Dict, Generator, Optional
 
 import pytest
 from loguru import logger
@@ -78,6 +79,93 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     )
 
 
+# ---------------------------------------------------------------------------
+# Lazy Hardware Proxy
+# ---------------------------------------------------------------------------
+
+
+class _LazyProxy:
+    """
+    Stand-in for a hardware driver that is only built on first attribute use.
+
+    ``factory(**kwargs)`` creates the driver and ``setup(driver)`` brings it
+    up (connect, start sync, ...). Sessions whose selected tests never touch
+    the driver skip both. A setup failure (including ``pytest.skip``) is
+    remembered and re-raised instead of retrying the handshake per test.
+
+    ``isinstance``, ``with``, ``bool()``, ``==`` and ``hash()`` are forwarded
+    to the driver, so the proxy can be passed wherever the driver is expected.
+    Teardown code uses ``initialized`` and ``unwrap()`` to reach the driver
+    without building it.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[..., Any],
+        setup: Optional[Callable[[Any], None]] = None,
+        **kwargs: Any,
+    ) -> None:
+        self._factory = factory
+        self._setup = setup
+        self._kwargs = kwargs
+        self._real: Any = None
+        self._failure: Optional[BaseException] = None
+
+    @property
+    def initialized(self) -> bool:
+        """Whether the driver has been built and set up."""
+        return self._real is not None
+
+    def unwrap(self) -> Any:
+        """Return the driver itself, building it first if needed."""
+        return self._resolve()
+
+    def _resolve(self) -> Any:
+        if self._real is None:
+            if self._failure is not None:
+                raise self._failure
+            real = self._factory(**self._kwargs)
+            try:
+                if self._setup is not None:
+                    self._setup(real)
+            except BaseException as exc:
+                self._failure = exc
+                raise
+            self._real = real
+        return self._real
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    # Special methods are looked up on the type, so __getattr__ misses them
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type:
+        return type(self._resolve())
+
+    def __enter__(self) -> Any:
+        return self._resolve().__enter__()
+
+    def __exit__(self, *exc_info: Any) -> Any:
+        return self._resolve().__exit__(*exc_info)
+
+    def __bool__(self) -> bool:
+        return bool(self._resolve())
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is _LazyProxy:
+            other = other.unwrap()
+        return self._resolve() == other
+
+    def __hash__(self) -> int:
+        return hash(self._resolve())
+
+    def __repr__(self) -> str:
+        if self._real is None:
+            return f"<lazy {getattr(self._factory, '__name__', 'driver')} (not built)>"
+        return repr(self._real)
+
+
 # ---------------------------------------------------------------------------
 # Configuration Fixtures
 # ---------------------------------------------------------------------------
@@ -122,14 +210,16 @@ def test_config(request: pytest.FixtureRequest, hardware_config: Dict[str, Any])
     Consolidated test configuration from CLI options and config files.
     Provides a single dict with all runtime parameters.
     """
+    # Read the parsed namespace directly; the options are all registered above
+    opts = request.config.option
     return {
-        "simulate": request.config.getoption("--simulate"),
-        "radar_type": request.config.getoption("--radar-type"),
-        "radar_ip": request.config.getoption("--radar-ip"),
-        "project": request.config.getoption("--project"),
-        "cycle": request.config.getoption("--cycle"),
-        "environment": request.config.getoption("--environment"),
-        "fw_version": request.config.getoption("--fw-version"),
+        "simulate": opts.simulate,
+        "radar_type": opts.radar_type,
+        "radar_ip": opts.radar_ip,
+        "project": opts.project,
+        "cycle": opts.cycle,
+        "environment": opts.environment,
+        "fw_version": opts.fw_version,
         "hardware_config": hardware_config,
     }
 
@@ -148,32 +238,35 @@ def radar_uut(
 
     Uses the driver factory to create the appropriate driver (BSR/HRR/Mock)
     based on CLI options. In simulation mode, always uses MockRadarDriver.
+    The driver is created and connected on first use.
     """
     simulate = test_config["simulate"]
     radar_type = test_config["radar_type"]
     radar_ip = test_config["radar_ip"]
 
-    driver = create_radar_driver(
+    def connect(driver: RadarDriverBase) -> None:
+        response = driver.connect()
+        if response.status.value != "OK":
+            logger.error(f"Failed to connect to radar: {response.message}")
+            pytest.skip(f"Radar connection failed: {response.message}")
+        logger.info(
+            f"Radar UUT fixture ready — type={radar_type}, ip={radar_ip}, "
+            f"fw={driver.fw_version}, simulate={simulate}"
+        )
+
+    driver = _LazyProxy(
+        create_radar_driver,
+        connect,
         ip=radar_ip,
         radar_type=radar_type,
         simulate=simulate,
     )
-
-    # Connect to radar
-    response = driver.connect()
-    if response.status.value != "OK":
-        logger.error(f"Failed to connect to radar: {response.message}")
-        pytest.skip(f"Radar connection failed: {response.message}")
-
-    logger.info(
-        f"Radar UUT fixture ready — type={radar_type}, ip={radar_ip}, "
-        f"fw={driver.fw_version}, simulate={simulate}"
-    )
     yield driver
 
     # Teardown
-    driver.disconnect()
-    logger.info("Radar UUT fixture torn down")
+    if driver.initialized:
+        driver.unwrap().disconnect()
+        logger.info("Radar UUT fixture torn down")
 
 
 # ---------------------------------------------------------------------------
@@ -196,31 +289,41 @@ def psu_control(
     simulate = test_config["simulate"]
     psu_cfg = hardware_config.get("psu", {})
 
-    if simulate:
-        psu_instance = MockPSUDriver(PSUConfig(
-            ip=psu_cfg.get("ip_address", "192.168.10.3"),
-            port=psu_cfg.get("port", 1),
-            voltage_v=psu_cfg.get("voltage_v", 12.0),
-            current_limit_a=psu_cfg.get("current_limit_a", 10.0),
-        ))
-    else:
-        psu_instance = PSUDriver(PSUConfig(
-            ip=psu_cfg.get("ip_address", "192.168.10.3"),
-            port=psu_cfg.get("port", 1),
-            voltage_v=psu_cfg.get("voltage_v", 12.0),
-            current_limit_a=psu_cfg.get("current_limit_a", 10.0),
-            scpi_port=psu_cfg.get("scpi_port", 5025),
-        ))
-
-    logger.info(f"PSU fixture initialized — simulate={simulate}")
+    def build() -> PSUDriver:
+        if simulate:
+            driver: PSUDriver = MockPSUDriver(PSUConfig(
+                ip=psu_cfg.get("ip_address", "192.168.10.3"),
+                port=psu_cfg.get("port", 1),
+                voltage_v=psu_cfg.get("voltage_v", 12.0),
+                current_limit_a=psu_cfg.get("current_limit_a", 10.0),
+            ))
+        else:
+            driver = PSUDriver(PSUConfig(
+                ip=psu_cfg.get("ip_address", "192.168.10.3"),
+                port=psu_cfg.get("port", 1),
+                voltage_v=psu_cfg.get("voltage_v", 12.0),
+                current_limit_a=psu_cfg.get("current_limit_a", 10.0),
+                scpi_port=psu_cfg.get("scpi_port", 5025),
+            ))
+        logger.info(f"PSU fixture initialized — simulate={simulate}")
+        return driver
+
+    psu_instance = _LazyProxy(build)
     yield psu_instance
 
-    # Teardown: ensure PSU is in a safe state
-    try:
-        psu_instance.power_off()
-    except Exception as e:
-        logger.warning(f"PSU teardown error (ignored): {e}")
-    logger.info("PSU fixture torn down")
+    # Teardown: ensure a real PSU is left in a safe state (the mock holds
+    # no output or socket, so there is nothing to undo in simulation)
+    if simulate:
+        return
+    if psu_instance.initialized:
+        psu = psu_instance.unwrap()
+        try:
+            psu.power_off()
+        except Exception as e:
+            logger.warning(f"PSU teardown error (ignored): {e}")
+        psu.close()
+        logger.info("PSU fixture torn down")
+    PSUDriver.close_all_pooled()
 
 
 # ---------------------------------------------------------------------------
@@ -236,13 +339,21 @@ def ptp_sync(
     """
     Session-scoped fixture providing a PTP driver instance.
 
-    Starts PTP synchronization at the beginning of the session
-    and stops it at the end.
+    Starts PTP synchronization when a test first uses the driver
+    and stops it at the end of the session.
     """
     simulate = test_config["simulate"]
     ptp_cfg = hardware_config.get("ptp", {})
 
-    ptp_instance = PTPDriver(PTPConfig(
+    def start(driver: PTPDriver) -> None:
+        if ptp_cfg.get("enabled", True):
+            success = driver.start()
+            if not success and not simulate:
+                logger.error("PTP synchronization failed to start")
+                pytest.skip("PTP sync failed — skipping tests")
+        logger.info(f"PTP fixture initialized — simulate={simulate}")
+
+    ptp_instance = _LazyProxy(PTPDriver, start, config=PTPConfig(
         interface=ptp_cfg.get("ptp_interface", "eth0"),
         domain=ptp_cfg.get("domain", 1),
         network_transport=ptp_cfg.get("network_transport", "L2"),
@@ -254,19 +365,30 @@ def ptp_sync(
         sync_timeout_sec=ptp_cfg.get("sync_timeout_sec", 30),
         simulate=simulate,
     ))
+    yield ptp_instance
 
-    if ptp_cfg.get("enabled", True):
-        success = ptp_instance.start()
-        if not success and not simulate:
-            logger.error("PTP synchronization failed to start")
-            pytest.skip("PTP sync failed — skipping tests")
+    # Teardown (a simulated ptp4l has no process to stop)
+    if ptp_instance.initialized and not simulate:
+        ptp_instance.unwrap().stop()
+        logger.info("PTP fixture torn down")
 
-    logger.info(f"PTP fixture initialized — simulate={simulate}")
-    yield ptp_instance
 
-    # Teardown
-    ptp_instance.stop()
-    logger.info("PTP fixture torn down")
+# ---------------------------------------------------------------------------
+# Simulation Timing
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def _fast_sleep(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Make fixed hardware waits instant for functional tests in simulation.
+
+    Boot, power-cycle and LLDP settle delays only matter on real hardware.
+    Unit tests keep the real ``time.sleep``; several rely on it to overlap
+    threads.
+    """
+    if request.config.option.simulate and request.node.get_closest_marker("functional"):
+        monkeypatch.setattr(time, "sleep", lambda _seconds: None)
 
 
 # ---------------------------------------------------------------------------
@@ -280,6 +402,17 @@ def thresholds(thresholds_config: Dict[str, Any]) -> Dict[str, Any]:
     return thresholds_config.get("thresholds", {})
 
 
+@pytest.fixture(scope="session")
+def lldp_ip_map() -> Dict[str, str]:
+    """Expected radar IP per LLDP physical location, resolved once per session."""
+    from src.actions import lldp_actions
+
+    return {
+        location: lldp_actions.get_expected_ip_for_location(location)
+        for location in lldp_actions.VALID_LOCATIONS
+    }
+
+
 # ---------------------------------------------------------------------------
 # Xray Marker Processing
 # ---------------------------------------------------------------------------
@@ -326,14 +459,17 @@ def pytest_collection_modifyitems(
     This hook logs the mapping between Pytest functions and Jira Test IDs,
     which will be used by the Jira Xray integration layer for reporting.
     """
+    # Xray markers sit on test classes as well as functions, so the closest
+    # one is looked up through the node chain (stopping at the first match)
     xray_map: Dict[str, str] = {}
     for item in items:
-        for marker in item.iter_markers(name="xray"):
-            test_id = marker.args[0] if marker.args else None
-            if test_id:
-                xray_map[item.nodeid] = test_id
+        marker = item.get_closest_marker("xray")
+        if marker is not None and marker.args and marker.args[0]:
+            xray_map[item.nodeid] = marker.args[0]
 
     if xray_map:
-        logger.info(f"Xray test mappings found: {len(xray_map)}")
-        for nodeid, test_id in xray_map.items():
-            logger.debug(f"  {nodeid} -> {test_id}")
+        logger.info("Xray test mappings found: {}", len(xray_map))
+        logger.opt(lazy=True).debug(
+            "{}",
+            lambda: "\n".join(f"  {nodeid} -> {test_id}" for nodeid, test_id in xray_map.items()),
+        )
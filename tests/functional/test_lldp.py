@@ -30,6 +30,7 @@ def test_basic_lldp_location_change(radar_uut, test_config):
     2. Read current physical location
     3. Change location to target if different
     4. Verify the new location matches target
+    5. Move to scanning mode (DR64 only)
 
     Jira: RADAR-12989
     """
@@ -55,7 +56,7 @@ def test_basic_lldp_location_change(radar_uut, test_config):
     else:
         radar_uut.set_statistics_window_size(fps=10, latency=1)
 
-    # 4. If DR64 project, move to scanning mode
+    # 5. If DR64 project, move to scanning mode
     if test_config.get("project") == "DR64":
         lldp_actions.move_to_scanning_mode(radar_uut)
 
@@ -106,7 +107,7 @@ def test_lldp_timeout_and_recovery(radar_uut, psu_control, test_config):
 
 @pytest.mark.functional
 @pytest.mark.xray("RADAR-13524")
-def test_lldp_ip_mapping_after_location_change(radar_uut, test_config):
+def test_lldp_ip_mapping_after_location_change(radar_uut, lldp_ip_map):
     """
     Test that IP address changes correctly after LLDP location change.
 
@@ -116,7 +117,7 @@ def test_lldp_ip_mapping_after_location_change(radar_uut, test_config):
     Jira: RADAR-13524
     """
     target_location = "FRONT_RIGHT_BOTTOM"
-    expected_ip = lldp_actions.get_expected_ip_for_location(target_location)
+    expected_ip = lldp_ip_map[target_location]
 
     # 1. Enable LLDP
     lldp_actions.enable_lldp(radar_uut)
@@ -133,7 +134,7 @@ def test_lldp_ip_mapping_after_location_change(radar_uut, test_config):
 
     # 4. Verify expected IP mapping
     # In simulation, we verify the mapping is consistent
-    actual_expected_ip = lldp_actions.get_expected_ip_for_location(
+    actual_expected_ip = lldp_ip_map.get(
         lldp_actions.get_current_physical_location(radar_uut)
     )
     assert actual_expected_ip == expected_ip, (
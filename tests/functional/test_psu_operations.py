@@ -18,6 +18,13 @@ import pytest
 from src.drivers.psu_driver import PSUMeasurement
 
 
+@pytest.fixture(scope="class")
+def psu_powered_on(psu_control):
+    """Power the PSU output on once for a whole test class."""
+    psu_control.power_on()
+    yield psu_control
+
+
 @pytest.mark.functional
 @pytest.mark.xray("RADAR-201")
 class TestPSUPowerControl:
@@ -55,12 +62,12 @@ class TestPSUPowerControl:
 
 @pytest.mark.functional
 @pytest.mark.xray("RADAR-202")
+@pytest.mark.usefixtures("psu_powered_on")
 class TestPSUMeasurements:
     """Tests for PSU measurement readback."""
 
     def test_psu_measure_returns_values(self, psu_control) -> None:
         """Verify PSU measurement returns voltage, current, and power."""
-        psu_control.power_on()
         meas = psu_control.measure()
         assert isinstance(meas, PSUMeasurement)
         assert meas.voltage_v >= 0
@@ -69,14 +76,12 @@ class TestPSUMeasurements:
 
     def test_psu_measure_when_on(self, psu_control) -> None:
         """Verify PSU reports non-zero voltage when output is on."""
-        psu_control.power_on()
         meas = psu_control.measure()
         assert meas.output_enabled is True
         assert meas.voltage_v > 0
 
     def test_psu_power_within_threshold(self, psu_control, thresholds) -> None:
         """Verify PSU power consumption is within configured thresholds."""
-        psu_control.power_on()
         meas = psu_control.measure()
         power_threshold = thresholds.get("power_consumption", {})
         max_watts = power_threshold.get("max_watts", 120.0)
@@ -92,10 +97,10 @@ class TestPSUMeasurements:
 
 @pytest.mark.functional
 @pytest.mark.xray("RADAR-203")
+@pytest.mark.usefixtures("psu_powered_on")
 class TestPSUPowerCycle:
     """Tests for PSU power cycling."""
 
     def test_power_cycle(self, psu_control) -> None:
         """Verify PSU can perform a power cycle."""
-        psu_control.power_on()
         assert psu_control.power_cycle(off_duration_sec=0.01) is True
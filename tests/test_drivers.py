@@ -13,6 +13,11 @@ Covers:
 from __future__ import annotations
 
 import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
 import time
 
 import pytest
@@ -27,8 +32,15 @@ from src.drivers.radar_driver_base import (
     PointCloudFrame,
     RadarDriverBase,
     StatisticsData,
+    as_soa,
+)
+from src.drivers.psu_driver import (
+    MockPSUDriver,
+    PSUConfig,
+    PSUDriver,
+    PSUFileLock,
+    PSUMeasurement,
 )
-from src.drivers.psu_driver import MockPSUDriver, PSUConfig, PSUMeasurement
 from src.drivers.ptp_driver import PTPConfig, PTPDriver, PTPStatus
 from src.drivers.fw_manager import FirmwareManager, FWVersion
 
@@ -111,6 +123,62 @@ class TestMockRadarDriver:
         driver = MockRadarDriver()
         assert driver.get_point_cloud() is None
 
+    def test_point_cloud_fixed_size(self):
+        driver = MockRadarDriver(num_detections=5000)
+        driver.connect()
+        pc = driver.get_point_cloud()
+        assert pc.valid_detections == 5000
+        assert len(pc.detections) == 5000
+
+    def test_point_cloud_empty_frame(self):
+        driver = MockRadarDriver(num_detections=0)
+        driver.connect()
+        pc = driver.get_point_cloud()
+        assert pc.valid_detections == 0
+        assert pc.detections == []
+
+    def test_preallocated_frame(self):
+        frame = PointCloudFrame.preallocated(3)
+        assert frame.valid_detections == 3
+        assert len(frame.detections) == 3
+        assert frame.detections[0] is not frame.detections[1]
+        assert frame.detections[2].distance == 0.0
+
+    def test_point_cloud_soa(self):
+        np = pytest.importorskip("numpy")
+        driver = MockRadarDriver(num_detections=100)
+        driver.connect()
+        soa = driver.get_point_cloud_soa()
+        assert soa.valid_detections == 100
+        assert soa.distance.dtype == np.float32
+        assert soa.distance.shape == (100,)
+        assert soa.distance.flags["C_CONTIGUOUS"]
+        assert np.all((soa.distance >= 1.0) & (soa.distance <= 200.0))
+
+    def test_as_soa_preserves_values(self):
+        np = pytest.importorskip("numpy")
+        frame = PointCloudFrame(cycle_count=7, valid_detections=2, detections=[
+            DetectionData(distance=10.0, rcs=1.5),
+            DetectionData(distance=20.0, z=-2.0),
+        ])
+        soa = as_soa(frame)
+        assert soa.cycle_count == 7
+        assert np.array_equal(soa.distance, np.array([10.0, 20.0], dtype=np.float32))
+        assert np.array_equal(soa.z, np.array([0.0, -2.0], dtype=np.float32))
+        assert as_soa(PointCloudFrame()).x.shape == (0,)
+
+    def test_point_cloud_soa_when_disconnected(self):
+        driver = MockRadarDriver()
+        assert driver.get_point_cloud_soa() is None
+
+    def test_detection_display_dict_rounds(self):
+        det = DetectionData(distance=12.345678, azimuth=0.123456, rcs=3.14159, x=1.005)
+        d = det.to_display_dict()
+        assert d["distance"] == 12.346
+        assert d["azimuth"] == 0.1235
+        assert d["rcs"] == 3.1
+        assert set(d) == {"distance", "azimuth", "elevation", "velocity", "rcs", "x", "y", "z"}
+
     def test_statistics(self):
         driver = MockRadarDriver()
         stats = driver.get_statistics()
@@ -156,6 +224,16 @@ class TestMockRadarDriver:
         driver = MockRadarDriver()
         assert driver.enable_lldp() is True
 
+    def test_seeded_drivers_reproducible(self):
+        drivers = [MockRadarDriver(), MockRadarDriver()]
+        for d in drivers:
+            d._rng.seed(1234)
+            d.connect()
+        a, b = (d.get_point_cloud() for d in drivers)
+        assert a.latency_ms == b.latency_ms
+        assert [x.distance for x in a.detections] == [x.distance for x in b.detections]
+        assert drivers[0].get_statistics().fps_current == drivers[1].get_statistics().fps_current
+
     def test_rloc_timeout(self):
         driver = MockRadarDriver()
         assert driver.set_rloc_timeout(60) is True
@@ -281,6 +359,60 @@ class TestMockPSUDriver:
         psu.power_on()
         assert psu.power_cycle(off_duration_sec=0.01) is True
 
+    def test_file_lock_exclusive(self, tmp_path):
+        holder = PSUFileLock(str(tmp_path), "192.168.10.3")
+        waiter = PSUFileLock(str(tmp_path), "192.168.10.3", timeout_sec=0)
+        assert holder.acquire() is True
+        assert waiter.acquire() is False
+        holder.release()
+        assert waiter.acquire() is True
+        waiter.release()
+
+    def test_file_lock_excludes_threads_sharing_it(self, tmp_path):
+        lock = PSUFileLock(str(tmp_path), "192.168.10.3", timeout_sec=5)
+        holders = []
+        peak = []
+        errors = []
+
+        def worker():
+            for _ in range(20):
+                if not lock.acquire():
+                    errors.append("timeout")
+                    return
+                holders.append(1)
+                peak.append(len(holders))
+                time.sleep(0.001)
+                holders.pop()
+                lock.release()
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+        assert max(peak) == 1
+
+    def test_port_locks_independent(self, tmp_path):
+        port1 = PSUFileLock(str(tmp_path), "192.168.10.3", timeout_sec=0, port=1)
+        port2 = PSUFileLock(str(tmp_path), "192.168.10.3", timeout_sec=0, port=2)
+        assert port1.acquire() is True
+        assert port2.acquire() is True
+        port1.release()
+        port2.release()
+
+    def test_global_lock_shared_vs_exclusive(self, tmp_path):
+        host_a = PSUFileLock(str(tmp_path), "192.168.10.3", timeout_sec=0)
+        host_b = PSUFileLock(str(tmp_path), "192.168.10.3", timeout_sec=0)
+        global_cmd = PSUFileLock(str(tmp_path), "192.168.10.3", timeout_sec=0)
+        assert host_a.acquire(shared=True) is True
+        assert host_b.acquire(shared=True) is True
+        assert global_cmd.acquire() is False
+        host_a.release()
+        host_b.release()
+        assert global_cmd.acquire() is True
+        global_cmd.release()
+
     def test_custom_config(self):
         config = PSUConfig(
             ip="192.168.10.3",
@@ -295,6 +427,215 @@ class TestMockPSUDriver:
         assert meas.port == 2
 
 
+# ===========================================================================
+# PSUDriver Tests (SCPI over a local fake instrument)
+# ===========================================================================
+
+
+class _FakePSUHandler(socketserver.StreamRequestHandler):
+    """Minimal newline-framed SCPI responder emulating one E36233A output."""
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        for raw in self.rfile:
+            line = raw.decode().strip()
+            server.commands.append(line)
+            replies = []
+            for part in line.split(";"):
+                part = part.strip().lstrip(":")
+                if part.startswith("OUTP ON"):
+                    server.output_on = True
+                elif part.startswith("OUTP OFF"):
+                    server.output_on = False
+                if "?" in part:
+                    replies.append(self._reply(part))
+            if replies:
+                self.wfile.write((";".join(replies) + "\n").encode())
+
+    def _reply(self, query):
+        if query.startswith("*IDN?"):
+            return "Keysight Technologies,E36233A,FAKE0001,1.0.0"
+        if query.startswith("MEAS:VOLT?"):
+            return "12.000" if self.server.output_on else "0.000"
+        if query.startswith("MEAS:CURR?"):
+            return "1.500" if self.server.output_on else "0.000"
+        if query.startswith("OUTP?"):
+            return "1" if self.server.output_on else "0"
+        if query.startswith("*OPC?"):
+            return "1"
+        if query.startswith("SYST:ERR?"):
+            return '+0,"No error"'
+        return ""
+
+
+@pytest.fixture
+def fake_psu(tmp_path):
+    """Run a fake PSU on localhost and yield a PSUDriver connected to it."""
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _FakePSUHandler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.commands = []
+    server.output_on = False
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    psu = PSUDriver(PSUConfig(
+        ip="127.0.0.1",
+        scpi_port=server.server_address[1],
+        lock_file_dir=str(tmp_path),
+    ))
+    yield psu, server
+    psu.close()
+    PSUDriver.close_all_pooled()
+    server.shutdown()
+    server.server_close()
+
+
+class TestPSUDriverSCPI:
+    """Tests for PSUDriver against a fake SCPI instrument."""
+
+    def test_identify(self, fake_psu):
+        psu, _ = fake_psu
+        assert "E36233A" in psu.identify()
+
+    def test_power_on_measure_off(self, fake_psu):
+        psu, _ = fake_psu
+        assert psu.power_on() is True
+        meas = psu.measure()
+        assert meas.output_enabled is True
+        assert meas.voltage_v == 12.0
+        assert meas.power_w == 18.0
+        assert psu.power_off() is True
+        assert psu.measure().output_enabled is False
+
+    def test_power_on_setup_is_one_write(self, fake_psu):
+        psu, server = fake_psu
+        psu.power_on()
+        assert server.commands[0] == "VOLT 12.0,(@1);:CURR 10.0,(@1);:OUTP ON,(@1);*OPC?"
+
+    def test_reply_framing_by_newline(self):
+        psu = PSUDriver(PSUConfig(pool_socket=False))
+        psu._socket, peer = socket.socketpair()
+        try:
+            peer.sendall(b"12.0")
+            peer.sendall(b"00\n1\n")
+            assert psu._read_line() == "12.000"
+            assert psu._read_line() == "1"
+        finally:
+            psu.close()
+            peer.close()
+
+    def test_observation_queries_skip_lock_when_connected(self, fake_psu, tmp_path):
+        psu, _ = fake_psu
+        psu.identify()  # opens the socket under the lock
+        other_host = PSUFileLock(str(tmp_path), "127.0.0.1")
+        assert other_host.acquire() is True
+        try:
+            start = time.monotonic()
+            assert "E36233A" in psu.identify()
+            assert "No error" in psu.check_errors()
+            assert time.monotonic() - start < 1
+        finally:
+            other_host.release()
+
+    def test_measure_is_one_compound_query(self, fake_psu):
+        psu, server = fake_psu
+        psu.measure()
+        assert server.commands == ["MEAS:VOLT? (@1);:MEAS:CURR? (@1);:OUTP? (@1)"]
+
+    def test_simulated_scpi_compound_measure(self):
+        psu = PSUDriver(PSUConfig(simulate=True))
+        meas = psu.measure()
+        assert meas.voltage_v == 12.01
+        assert meas.current_a == 2.35
+        assert meas.output_enabled is True
+
+    def test_simulated_scpi_replies_by_header(self):
+        psu = PSUDriver(PSUConfig(simulate=True))
+        assert psu._send_scpi("*IDN?").startswith("Keysight")
+        assert psu._send_scpi("VOLT? (@1);:CURR? (@1)") == "12.000;10.000"
+        assert psu._send_scpi("syst:err?") == '0,"No error"'
+        assert psu._send_scpi("VOLT 12.0,(@1)") == ""
+
+    def test_measure_reply_in_scientific_notation(self):
+        psu = PSUDriver(PSUConfig(simulate=True))
+        psu._mock_scpi_response = lambda command: "+1.20000000E+01;+1.5E+00;0"
+        meas = psu.measure()
+        assert meas.voltage_v == 12.0
+        assert meas.current_a == 1.5
+        assert meas.output_enabled is False
+
+    def test_socket_reused_across_commands(self, fake_psu):
+        psu, server = fake_psu
+        psu.identify()
+        psu.check_errors()
+        psu.measure()
+        assert server.connections == 1
+
+    def test_close_reconnects_on_next_command(self, fake_psu):
+        psu, server = fake_psu
+        psu._reuse = False
+        psu.identify()
+        psu.close()
+        psu.identify()
+        assert server.connections == 2
+
+    def test_query_retried_after_socket_error(self, fake_psu, monkeypatch):
+        psu, server = fake_psu
+        original = PSUDriver._transact
+        failures = [ConnectionError("dropped")]
+
+        def flaky_transact(self, command):
+            if failures:
+                raise failures.pop()
+            return original(self, command)
+
+        monkeypatch.setattr(PSUDriver, "_transact", flaky_transact)
+        with psu._scpi_session():
+            assert psu._send_scpi("OUTP? (@1)") == "0"
+        assert server.commands == ["OUTP? (@1)"]
+
+    def test_set_command_not_resent_after_socket_error(self, fake_psu, monkeypatch):
+        psu, server = fake_psu
+        original = PSUDriver._transact
+        failures = [socket.timeout("no reply")]
+
+        def flaky_transact(self, command):
+            if failures:
+                original(self, command)  # reaches the instrument, then times out
+                raise failures.pop()
+            return original(self, command)
+
+        monkeypatch.setattr(PSUDriver, "_transact", flaky_transact)
+        with psu._scpi_session():
+            with pytest.raises(socket.timeout):
+                psu._send_scpi("VOLT 12.0,(@1)")
+        assert psu._socket is None
+        # The next session reconnects
+        assert "E36233A" in psu.identify()
+        assert server.commands == ["VOLT 12.0,(@1)", "*IDN?"]
+
+    def test_socket_keepalive_enabled(self, fake_psu):
+        psu, _ = fake_psu
+        psu.identify()
+        assert psu._socket.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE) == 1
+        assert psu._socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) == 1
+
+    def test_pooled_socket_shared_between_ports(self, fake_psu, tmp_path):
+        psu, server = fake_psu
+        psu.identify()
+        psu.close()
+        port2 = PSUDriver(PSUConfig(
+            ip="127.0.0.1",
+            scpi_port=server.server_address[1],
+            port=2,
+            lock_file_dir=str(tmp_path),
+        ))
+        assert "E36233A" in port2.identify()
+        port2.close()
+        assert server.connections == 1
+
+
 # ===========================================================================
 # PTPDriver Tests (Simulation)
 # ===========================================================================
@@ -345,6 +686,75 @@ class TestPTPDriverSimulation:
         assert ptp.start() is True  # Should not fail
 
 
+def _fake_ptp4l(*lines: str, linger_sec: float = 5.0) -> subprocess.Popen:
+    """Spawn a process that prints ptp4l-style lines then keeps running."""
+    script = "".join(f"print({line!r}, flush=True)\n" for line in lines)
+    script += f"import time\ntime.sleep({linger_sec})\n"
+    return subprocess.Popen(
+        [sys.executable, "-c", script],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+    )
+
+
+class TestPTPDriverOutputParsing:
+    """Tests for ptp4l output parsing (no ptp4l / sudo required)."""
+
+    def test_port_state_and_offset(self):
+        ptp = PTPDriver(PTPConfig())
+        ptp._handle_output_line("ptp4l[812.301]: port 1: LISTENING to UNCALIBRATED on RS_SLAVE")
+        assert not ptp.is_synced
+        ptp._handle_output_line("ptp4l[812.901]: port 1: UNCALIBRATED to SLAVE on MASTER_CLOCK_SELECTED")
+        ptp._handle_output_line("ptp4l[813.302]: master offset         -5 s2 freq   -1234 path delay       250")
+        assert ptp.is_synced
+        assert ptp._offset_ns == -5.0
+        assert ptp._delay_ns == 250.0
+
+    def test_rms_summary(self):
+        ptp = PTPDriver(PTPConfig())
+        ptp._handle_output_line("ptp4l[814.303]: rms   12 max   25 freq -1234 +/-   5 delay   260 +/-   1")
+        assert ptp._offset_ns == 12.0
+        assert ptp._delay_ns == 260.0
+
+    def test_config_file_rewritten_only_on_change(self, tmp_path):
+        config_file = str(tmp_path / "ptp.txt")
+        ptp = PTPDriver(PTPConfig(config_file=config_file))
+        path = ptp._generate_config_file()
+        assert "domainNumber 1" in open(path).read()
+        os.utime(path, (0, 0))
+        ptp._generate_config_file()
+        assert os.stat(path).st_mtime == 0
+
+        ptp.config.domain = 2
+        ptp._generate_config_file()
+        assert "domainNumber 2" in open(path).read()
+        assert not os.path.exists(path + ".tmp")
+
+    def test_wait_for_sync_returns_on_slave(self):
+        ptp = PTPDriver(PTPConfig(sync_timeout_sec=10))
+        ptp._process = _fake_ptp4l(
+            "ptp4l[1.0]: port 1: INITIALIZING to LISTENING on INIT_COMPLETE",
+            "ptp4l[2.0]: port 1: UNCALIBRATED to SLAVE on MASTER_CLOCK_SELECTED",
+        )
+        ptp._running = True
+        ptp._start_output_reader()
+        start = time.monotonic()
+        assert ptp._wait_for_sync() is True
+        assert time.monotonic() - start < 5
+        assert ptp.get_status().state == "SLAVE"
+        ptp.stop()
+
+    def test_wait_for_sync_fails_when_process_exits(self):
+        ptp = PTPDriver(PTPConfig(sync_timeout_sec=10))
+        ptp._process = _fake_ptp4l("ptp4l[1.0]: failed to open /dev/ptp0", linger_sec=0)
+        ptp._running = True
+        ptp._start_output_reader()
+        assert ptp._wait_for_sync() is False
+        ptp.stop()
+
+
 # ===========================================================================
 # FirmwareManager Tests (Simulation)
 # ===========================================================================
@@ -431,6 +841,18 @@ class TestTestCycle:
         from src.test_cycle import get_test_set_name
         assert get_test_set_name("DR64", "nightly") == "VW Nightly Set"
         assert get_test_set_name("MBAG", "regression") == "MBAG Regression Set"
+        assert get_test_set_name("XYZ", "nightly") == "XYZ Nightly Set"
+
+    def test_cycle_markers_not_shared_with_config(self):
+        from src.test_cycle import build_cycle_config, get_markers_for_cycle
+        config = build_cycle_config(
+            cycle_type="nightly",
+            project="DR64",
+            radar_type="BSR32",
+        )
+        config.markers.append("extra")
+        assert get_markers_for_cycle("nightly") == ("functional", "smoke")
+        assert get_markers_for_cycle("unknown") == ("functional",)
 
     def test_coffin_interference_manager(self):
         from src.test_cycle import CoffinInterferenceManager
@@ -451,6 +873,40 @@ class TestTestCycle:
         assert mgr.is_frequency_available(76.1) is True
         assert mgr.request_frequency("BENCH-002", 76.1) is True
 
+    def test_coffin_frequency_tolerates_float_noise(self):
+        from src.test_cycle import CoffinInterferenceManager
+        mgr = CoffinInterferenceManager()
+
+        assert mgr.request_frequency("BENCH-001", 0.1 + 0.2) is True
+        assert mgr.is_frequency_available(0.3) is False
+        assert mgr.request_frequency("BENCH-002", 0.3) is False
+
+        mgr.release_frequency("BENCH-001")
+        assert mgr.is_frequency_available(0.3) is True
+
+    def test_coffin_concurrent_requests_single_winner(self):
+        import threading
+        from src.test_cycle import CoffinInterferenceManager
+        mgr = CoffinInterferenceManager()
+        barrier = threading.Barrier(8)
+        granted = []
+
+        def claim(bench_id):
+            barrier.wait()
+            if mgr.request_frequency(bench_id, 76.1):
+                granted.append(bench_id)
+
+        threads = [
+            threading.Thread(target=claim, args=(f"BENCH-{i:03d}",)) for i in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(granted) == 1
+        assert mgr.get_active_allocations() == {granted[0]: 76.1}
+
 
 # ===========================================================================
 # LLDP Actions Tests
@@ -538,3 +994,42 @@ class TestPowerActions:
         result = ensure_power_on(psu, expected_voltage=12.0)
         assert result is True
 
+
+# ===========================================================================
+# Lazy Driver Fixture Tests
+# ===========================================================================
+
+
+class TestLazyDriverFixtures:
+    """Tests that the lazily built hardware fixtures act like their drivers."""
+
+    def test_fixtures_pass_as_drivers(self, radar_uut, psu_control, ptp_sync):
+        assert isinstance(radar_uut, RadarDriverBase)
+        assert isinstance(psu_control, PSUDriver)
+        assert isinstance(ptp_sync, PTPDriver)
+        for fixture in (radar_uut, psu_control, ptp_sync):
+            assert fixture.initialized
+            assert fixture == fixture.unwrap()
+            assert hash(fixture) == hash(fixture.unwrap())
+            assert bool(fixture)
+
+    def test_proxy_builds_on_first_use(self):
+        from tests.conftest import _LazyProxy
+        built = []
+        proxy = _LazyProxy(MockRadarDriver, built.append, ip="127.0.0.1")
+        assert not proxy.initialized
+        assert "not built" in repr(proxy)
+        assert built == []
+
+        assert proxy.ip == "127.0.0.1"
+        assert proxy.initialized
+        assert built == [proxy.unwrap()]
+
+    def test_proxy_context_manager_reaches_driver(self):
+        from tests.conftest import _LazyProxy
+        proxy = _LazyProxy(MockRadarDriver, lambda driver: driver.connect())
+        with proxy as driver:
+            assert driver is proxy.unwrap()
+            assert driver.is_connected
+        assert not proxy.is_connected
+
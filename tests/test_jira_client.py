@@ -10,6 +10,7 @@ Covers:
 from __future__ import annotations
 
 import json
+import sys
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +19,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from src.jira_client import result_reporter, xray_client
 from src.jira_client.xray_client import XrayClient, XrayClientError, XrayConfig
 from src.jira_client.test_mapper import TestMapper, TestMapping
 from src.jira_client.result_reporter import (
@@ -82,6 +84,231 @@ class TestXrayClient:
         # Session not created yet
         client.close()  # Should not raise
 
+    def test_session_uses_pooled_retrying_adapter(self) -> None:
+        """Test that the session mounts a sized, retrying connection pool."""
+        client = XrayClient(
+            base_url="https://jira.example.com",
+            project_key="RADAR",
+        )
+        adapter = client._get_session().get_adapter("https://jira.example.com/rest")
+        assert adapter._pool_maxsize == XrayClient.POOL_MAXSIZE
+        assert adapter.max_retries.total == XrayClient.RETRY_TOTAL
+        assert "POST" not in adapter.max_retries.allowed_methods
+        client.close()
+
+    def test_session_token_auth_header(self) -> None:
+        """Test that token auth sets a Bearer header and no basic auth."""
+        client = XrayClient(
+            base_url="https://jira.example.com",
+            project_key="RADAR",
+            auth_method="token",
+            api_token="secret",
+        )
+        session = client._get_session()
+        assert session.headers["Authorization"] == "Bearer secret"
+        assert session.auth is None
+        client.close()
+
+    def test_session_accepts_compressed_responses(self) -> None:
+        """Test that the session asks Jira for compressed response bodies."""
+        client = XrayClient(
+            base_url="https://jira.example.com",
+            project_key="RADAR",
+        )
+        encodings = client._get_session().headers["Accept-Encoding"].split(",")
+        assert {"gzip", "deflate"} <= set(encodings)
+        client.close()
+
+    def test_fetch_test_sets_concurrently(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test fetching several Test Sets returns each set's tests by key."""
+        client = XrayClient(
+            base_url="https://jira.example.com",
+            project_key="RADAR",
+        )
+
+        def fake_request(method: str, url: str, **kwargs: Any) -> bytes:
+            set_key = url.split("/")[-2]
+            return json.dumps([{"key": f"{set_key}-T1"}, {"key": f"{set_key}-T2"}]).encode()
+
+        monkeypatch.setattr(client, "_request", fake_request)
+        result = client.fetch_test_sets(["SET-1", "SET-2", "SET-1", "SET-3"])
+
+        assert list(result) == ["SET-1", "SET-2", "SET-3"]
+        assert result["SET-2"] == ["SET-2-T1", "SET-2-T2"]
+        client.close()
+
+    def test_fetch_test_set_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that repeated Test Set fetches are served from the cache."""
+        client = XrayClient(
+            base_url="https://jira.example.com",
+            project_key="RADAR",
+        )
+        calls: List[str] = []
+
+        def fake_request(method: str, url: str, **kwargs: Any) -> Any:
+            calls.append(url)
+            if url.endswith("/rest/api/2/search"):
+                return {"issues": [{"key": "SET-1"}]}
+            return b'[{"key": "RADAR-101"}]'
+
+        monkeypatch.setattr(client, "_request", fake_request)
+        assert client.fetch_test_set_by_name("Sanity") == ["RADAR-101"]
+        assert client.fetch_test_set_by_name("Sanity") == ["RADAR-101"]
+        assert client.fetch_test_set("SET-1") == ["RADAR-101"]
+        assert len(calls) == 2
+
+        client.invalidate_test_set("SET-1")
+        client.fetch_test_set("SET-1")
+        assert len(calls) == 3
+
+    @pytest.mark.parametrize("use_msgspec", [True, False])
+    @pytest.mark.parametrize("body", [
+        b'[{"id": "1", "key": "RADAR-101"}, {"id": "2"}, {"key": "RADAR-102", "rank": 2}]',
+        b'{"total": 2, "tests": [{"key": "RADAR-101"}, {"key": "RADAR-102"}]}',
+        b'{"issues": [{"key": "RADAR-101"}, {"key": "RADAR-102"}]}',
+    ])
+    def test_extract_test_keys(
+        self, monkeypatch: pytest.MonkeyPatch, use_msgspec: bool, body: bytes
+    ) -> None:
+        """Test that Test Set keys are extracted from list and wrapped bodies."""
+        if use_msgspec and not xray_client.MSGSPEC_AVAILABLE:
+            pytest.skip("msgspec not installed")
+        monkeypatch.setattr(xray_client, "MSGSPEC_AVAILABLE", use_msgspec)
+        assert xray_client._extract_test_keys(body) == ["RADAR-101", "RADAR-102"]
+
+    @pytest.mark.parametrize("use_msgspec", [True, False])
+    def test_extract_test_keys_skips_malformed_entries(
+        self, monkeypatch: pytest.MonkeyPatch, use_msgspec: bool
+    ) -> None:
+        """Test that entries with a null or non-string key are skipped, not the whole set."""
+        if use_msgspec and not xray_client.MSGSPEC_AVAILABLE:
+            pytest.skip("msgspec not installed")
+        monkeypatch.setattr(xray_client, "MSGSPEC_AVAILABLE", use_msgspec)
+        body = b'[{"key": "RADAR-101"}, {"key": null}, {"key": 7}, {"key": "RADAR-102"}]'
+        assert xray_client._extract_test_keys(body) == ["RADAR-101", "RADAR-102"]
+
+    @pytest.mark.parametrize("use_msgspec", [True, False])
+    def test_fetch_test_set_rejects_malformed_response(
+        self, monkeypatch: pytest.MonkeyPatch, use_msgspec: bool
+    ) -> None:
+        """Test that an unparseable Test Set response raises and is not cached as empty."""
+        if use_msgspec and not xray_client.MSGSPEC_AVAILABLE:
+            pytest.skip("msgspec not installed")
+        monkeypatch.setattr(xray_client, "MSGSPEC_AVAILABLE", use_msgspec)
+        client = XrayClient(
+            base_url="https://jira.example.com",
+            project_key="RADAR",
+        )
+        bodies = [b'["RADAR-101"]', b'[{"key": "RADAR-101"}]']
+        monkeypatch.setattr(client, "_request", lambda method, url, **kwargs: bodies.pop(0))
+
+        with pytest.raises(XrayClientError, match="Invalid Test Set response"):
+            client.fetch_test_set("SET-1")
+        assert client.fetch_test_set("SET-1") == ["RADAR-101"]
+        client.close()
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_encode_add_tests(self, monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+        """Test that the pre-serialized association body is valid JSON."""
+        if use_orjson and not xray_client.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(xray_client, "ORJSON_AVAILABLE", use_orjson)
+        body = xray_client._encode_add_tests(["RADAR-101", 'RADAR-"2"'])
+        assert json.loads(body) == {"add": ["RADAR-101", 'RADAR-"2"']}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_request_json_round_trip(
+        self, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ) -> None:
+        """Test that JSON bodies are sent as bytes and responses parsed from bytes."""
+        if use_orjson and not xray_client.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(xray_client, "ORJSON_AVAILABLE", use_orjson)
+        client = XrayClient(
+            base_url="https://jira.example.com",
+            project_key="RADAR",
+        )
+        session = MagicMock()
+        session.request.return_value.content = b'{"testExecIssue":{"key":"RADAR-900"}}'
+        client._session = session
+
+        result = client.import_execution_results({"tests": [{"testKey": "RADAR-101"}]})
+
+        assert result["testExecIssue"]["key"] == "RADAR-900"
+        sent = session.request.call_args.kwargs
+        assert "json" not in sent
+        assert json.loads(sent["data"]) == {"tests": [{"testKey": "RADAR-101"}]}
+
+    def test_create_test_execution_single_request(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the execution and its tests are created in one POST."""
+        client = XrayClient(
+            base_url="https://jira.example.com",
+            project_key="RADAR",
+        )
+        calls: List[Any] = []
+
+        def fake_request(method: str, url: str, **kwargs: Any) -> Dict[str, Any]:
+            calls.append((method, url, kwargs["json"]))
+            return {"testExecIssue": {"key": "RADAR-900"}}
+
+        monkeypatch.setattr(client, "_request", fake_request)
+        key = client.create_test_execution(
+            "Nightly", ["RADAR-101", "RADAR-102"], environment="Lab-A"
+        )
+
+        assert key == "RADAR-900"
+        assert len(calls) == 1
+        method, url, payload = calls[0]
+        assert method == "POST" and url.endswith("/import/execution")
+        assert payload["info"]["testEnvironments"] == ["Lab-A"]
+        assert [t["testKey"] for t in payload["tests"]] == ["RADAR-101", "RADAR-102"]
+
+    def test_create_test_executions_bulk(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that bulk creation returns keys in spec order and closes its pool."""
+        client = XrayClient(
+            base_url="https://jira.example.com",
+            project_key="RADAR",
+        )
+
+        def fake_request(method: str, url: str, **kwargs: Any) -> Dict[str, Any]:
+            summary = kwargs["json"]["info"]["summary"]
+            return {"testExecIssue": {"key": f"EXEC-{summary}"}}
+
+        monkeypatch.setattr(client, "_request", fake_request)
+        keys = client.create_test_executions_bulk([
+            {"summary": str(i), "test_ids": ["RADAR-101"]} for i in range(10)
+        ])
+
+        assert keys == [f"EXEC-{i}" for i in range(10)]
+        assert client._executor is not None
+        client.close()
+        assert client._executor is None
+
+    def test_create_test_execution_legacy_two_step(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the legacy path creates the issue, then associates tests."""
+        client = XrayClient(
+            base_url="https://jira.example.com",
+            project_key="RADAR",
+        )
+        urls: List[str] = []
+
+        def fake_request(method: str, url: str, **kwargs: Any) -> Dict[str, Any]:
+            urls.append(url)
+            return {"key": "RADAR-901"}
+
+        monkeypatch.setattr(client, "_request", fake_request)
+        key = client.create_test_execution(
+            "Nightly", ["RADAR-101"], legacy_two_step=True
+        )
+
+        assert key == "RADAR-901"
+        assert len(urls) == 2
+        assert urls[1].endswith("/testexec/RADAR-901/test")
+
     def test_endpoints_defined(self) -> None:
         """Test that all required API endpoints are defined."""
         assert "test_set_tests" in XrayClient.ENDPOINTS
@@ -188,6 +415,24 @@ class TestTestMapper:
         assert mapping is not None
         assert mapping.test_id == "RADAR-101"
         assert mapping.function_name == "test_init"
+        assert mapping.markers == ["functional"]
+
+    def test_multi_id_item_markers_not_shared(self) -> None:
+        """Test that mappings from one item get their own marker lists."""
+        mapper = TestMapper()
+        mapper.collect_from_items([
+            _MockItem(
+                nodeid="tests/test_radar.py::test_both",
+                name="test_both",
+                xray_ids=["RADAR-301", "RADAR-302"],
+                other_markers=["functional"],
+            ),
+        ])
+
+        first = mapper.get_by_test_id("RADAR-301")
+        second = mapper.get_by_test_id("RADAR-302")
+        first.markers.append("smoke")
+        assert second.markers == ["functional"]
 
     def test_get_by_test_id_not_found(self) -> None:
         """Test lookup returns None for unknown Test ID."""
@@ -221,6 +466,26 @@ class TestTestMapper:
         ids = mapper.get_all_test_ids()
         assert set(ids) == {"RADAR-101", "RADAR-102", "RADAR-201"}
 
+    def test_get_all_mappings_returns_copy(self) -> None:
+        """Test that all mappings are returned as an independent copy."""
+        mapper = TestMapper()
+        mapper.collect_from_items(self._create_items())
+
+        mappings = mapper.get_all_mappings()
+        assert set(mappings) == {"RADAR-101", "RADAR-102", "RADAR-201"}
+        del mappings["RADAR-101"]
+        assert "RADAR-101" in mapper
+
+    def test_get_all_mappings_view_is_read_only(self) -> None:
+        """Test that the opt-in view is read-only and tracks the mapper."""
+        mapper = TestMapper()
+        mappings = mapper.get_all_mappings(view=True)
+        mapper.collect_from_items(self._create_items())
+
+        assert set(mappings) == {"RADAR-101", "RADAR-102", "RADAR-201"}
+        with pytest.raises(TypeError):
+            mappings["RADAR-999"] = mappings["RADAR-101"]  # type: ignore[index]
+
     def test_filter_items_by_test_ids(self) -> None:
         """Test filtering items to a subset of test IDs."""
         mapper = TestMapper()
@@ -319,6 +584,39 @@ class TestTestResult:
         assert "start" in d
         assert "finish" in d
 
+    def test_to_xray_dict_with_evidence(self) -> None:
+        """Test serialization lists evidence by file name."""
+        result = TestResult(
+            test_id="RADAR-101",
+            status="PASS",
+            evidence=["/tmp/logs/radar.log", "capture.pcap"],
+        )
+        d = result.to_xray_dict()
+        assert [e["filename"] for e in d["evidences"]] == ["radar.log", "capture.pcap"]
+
+    def test_xray_dict_cached(self) -> None:
+        """Test that the Xray dict is built once and copied on export."""
+        result = TestResult(test_id="RADAR-101", status="PASS")
+        assert result._xray_payload() is result._xray_payload()
+        assert result.to_xray_dict() == result._xray_payload()
+        assert result.to_xray_dict() is not result._xray_payload()
+
+    def test_xray_dict_follows_field_changes(self) -> None:
+        """Test that fields updated after an export reach the next export."""
+        result = TestResult(test_id="RADAR-101", status="PASS")
+        assert "comment" not in result.to_xray_dict()
+        result.update(status="fail", error_message="Timeout exceeded")
+        d = result.to_xray_dict()
+        assert d["status"] == "FAIL"
+        assert d["comment"] == "Error: Timeout exceeded"
+
+    def test_result_has_no_instance_dict(self) -> None:
+        """Test that results are slotted where the interpreter supports it."""
+        if sys.version_info < (3, 10):
+            pytest.skip("dataclass slots need Python 3.10+")
+        result = TestResult(test_id="RADAR-101", status="PASS")
+        assert not hasattr(result, "__dict__")
+
     def test_to_xray_dict_with_defects(self) -> None:
         """Test serialization includes defect links."""
         result = TestResult(
@@ -359,6 +657,72 @@ class TestExecutionReport:
         assert report.other == 1
         assert report.pass_rate == 50.0
 
+    def test_statistics_for_initial_results(self) -> None:
+        """Test that results given at construction are counted."""
+        report = ExecutionReport(results=[
+            TestResult(test_id="T-1", status="PASS"),
+            TestResult(test_id="T-2", status="FAIL"),
+        ])
+        report.add_result(TestResult(test_id="T-3", status="PASS"))
+
+        assert report.passed == 2
+        assert report.failed == 1
+        assert report.other == 0
+
+    def test_total_duration(self) -> None:
+        """Test that durations are totalled as results are added."""
+        report = ExecutionReport(results=[TestResult(test_id="T-1", duration_sec=1.5)])
+        report.add_result(TestResult(test_id="T-2", duration_sec=2.25))
+        assert report.total_duration_sec == 3.75
+
+    def test_statistics_after_direct_list_changes(self) -> None:
+        """Test that tallies follow results appended or removed directly."""
+        report = ExecutionReport()
+        report.add_result(TestResult(test_id="T-1", status="PASS", duration_sec=1.0))
+        report.results.append(TestResult(test_id="T-2", status="FAIL", duration_sec=2.0))
+        assert report.failed == 1
+        assert report.total_duration_sec == 3.0
+
+        report.results.pop(0)
+        report.add_result(TestResult(test_id="T-3", status="TODO"))
+        assert report.passed == 0
+        assert report.failed == 1
+        assert report.other == 1
+
+    def test_statistics_after_result_fields_change(self) -> None:
+        """Test that tallies follow a result updated after it was added."""
+        report = ExecutionReport()
+        result = TestResult(test_id="T-1", status="EXECUTING")
+        report.add_result(result)
+        assert report.other == 1
+
+        result.update(status="PASS", duration_sec=5.0)
+        assert report.passed == 1
+        assert report.other == 0
+        assert report.pass_rate == 100.0
+        assert report.total_duration_sec == 5.0
+
+    def test_statistics_read_without_recount(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that adding and updating results keeps the tallies without rescanning."""
+        report = ExecutionReport(results=[TestResult(test_id="T-0", status="FAIL")])
+        recounts: List[int] = []
+        original = ExecutionReport._recount
+
+        def counting_recount(self: ExecutionReport) -> None:
+            recounts.append(len(self.results))
+            original(self)
+
+        monkeypatch.setattr(ExecutionReport, "_recount", counting_recount)
+        result = TestResult(test_id="T-1", status="EXECUTING")
+        report.add_result(result)
+        report.extend_results([TestResult(test_id="T-2", status="PASS", duration_sec=2.0)])
+        assert (report.passed, report.failed, report.other) == (1, 1, 1)
+
+        result.update(status="PASS", duration_sec=3.0)
+        assert report.passed == 2
+        assert report.total_duration_sec == 5.0
+        assert recounts == []
+
     def test_pass_rate_empty(self) -> None:
         """Test pass rate with no results."""
         report = ExecutionReport()
@@ -384,6 +748,20 @@ class TestResultReporter:
         assert summary["passed"] == 1
         assert summary["failed"] == 1
 
+    def test_extend_results(self) -> None:
+        """Test adding a batch of results at once."""
+        reporter = ResultReporter(project_key="RADAR")
+        reporter.add_result(TestResult(test_id="RADAR-100", status="PASS"))
+        reporter.extend_results(
+            TestResult(test_id=f"RADAR-{i}", status="FAIL" if i % 2 else "PASS")
+            for i in range(101, 105)
+        )
+
+        summary = reporter.get_summary()
+        assert summary["total_tests"] == 5
+        assert summary["passed"] == 3
+        assert summary["failed"] == 2
+
     def test_to_xray_json(self) -> None:
         """Test Xray JSON format generation."""
         reporter = ResultReporter(project_key="RADAR")
@@ -415,6 +793,38 @@ class TestResultReporter:
         assert len(data["tests"]) == 1
         assert data["tests"][0]["testKey"] == "RADAR-101"
 
+    def test_export_xray_json_stdlib_fallback(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that export works without orjson installed."""
+        monkeypatch.setattr(result_reporter, "ORJSON_AVAILABLE", False)
+        reporter = ResultReporter(project_key="RADAR")
+        reporter.add_result(TestResult(test_id="RADAR-101", status="PASS"))
+
+        output = tmp_path / "results.json"
+        reporter.export_xray_json(str(output))
+
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data["tests"][0]["testKey"] == "RADAR-101"
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_export_xray_json_compact_by_default(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ) -> None:
+        """Test that exports are compact unless pretty output is requested."""
+        if use_orjson and not result_reporter.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(result_reporter, "ORJSON_AVAILABLE", use_orjson)
+        reporter = ResultReporter(project_key="RADAR")
+        reporter.add_result(TestResult(test_id="RADAR-101", status="PASS"))
+
+        compact = reporter.export_xray_json(str(tmp_path / "compact.json"))
+        pretty = reporter.export_xray_json(str(tmp_path / "pretty.json"), pretty=True)
+
+        assert b"\n" not in compact.read_bytes()
+        assert b'\n  "tests"' in pretty.read_bytes()
+        assert json.loads(compact.read_bytes()) == json.loads(pretty.read_bytes())
+
     def test_export_junit_xml(self, tmp_path: Path) -> None:
         """Test exporting JUnit XML to file."""
         reporter = ResultReporter(project_key="RADAR")
@@ -458,6 +868,22 @@ class TestResultReporter:
         assert testcases[2].get("name") == "RADAR-103"
         assert testcases[2].find("skipped") is not None
 
+    def test_export_junit_xml_escapes_text(self, tmp_path: Path) -> None:
+        """Test that messages and tracebacks survive XML escaping."""
+        reporter = ResultReporter(project_key="RADAR")
+        reporter.add_result(TestResult(
+            test_id="RADAR-101", status="FAIL",
+            error_message='expected <5 & "ok"\nsecond line',
+            traceback="assert a < b\n  where a = 1 & b = 0",
+        ))
+
+        output = tmp_path / "results.xml"
+        reporter.export_junit_xml(str(output))
+
+        failure = ET.parse(str(output)).getroot().find("testcase/failure")
+        assert failure.get("message") == 'expected <5 & "ok"\nsecond line'
+        assert failure.text == "assert a < b\n  where a = 1 & b = 0"
+
     def test_finalize_sets_end_time(self) -> None:
         """Test that finalize sets the end time."""
         reporter = ResultReporter(project_key="RADAR")
@@ -468,6 +894,13 @@ class TestResultReporter:
         assert report.start_time is not None
         assert report.end_time >= report.start_time
 
+    def test_now_follows_monotonic_clock(self) -> None:
+        """Test that reporter timestamps never precede the execution start."""
+        reporter = ResultReporter(project_key="RADAR")
+        first = reporter.now()
+        second = reporter.now()
+        assert reporter.finalize().start_time <= first <= second
+
     def test_get_summary(self) -> None:
         """Test summary generation."""
         reporter = ResultReporter(project_key="RADAR", environment="staging")
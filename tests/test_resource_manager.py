@@ -6,19 +6,33 @@ Covers:
 - ResourceManager: allocation, release, concurrency, health check integration.
 - ResourceMetadata: serialization.
 - BenchState: state transitions.
+- ShardedRWLock: shared/exclusive access.
 """
 
 from __future__ import annotations
 
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+
 import pytest
 
-from src.resource_manager.health_check import HealthChecker, HealthCheckResult
+from src.resource_manager import health_check
+from src.resource_manager.health_check import (
+    BenchConnection,
+    HealthChecker,
+    HealthCheckResult,
+)
 from src.resource_manager.manager import (
+    BenchRecord,
     BenchState,
     ResourceAllocationError,
     ResourceManager,
     ResourceMetadata,
 )
+from src.resource_manager.rwlock import ShardedRWLock
 
 
 # ---------------------------------------------------------------------------
@@ -175,6 +189,17 @@ class TestHealthChecker:
         assert result.healthy is False
         assert len(result.failed_checks) == 2
 
+    def test_set_mock_failure_replaces_previous(self, health_checker):
+        """Test that configuring a bench again replaces its earlier failures."""
+        bench = {"bench_id": "BENCH-001", "connection": {}}
+        health_checker.set_mock_failure("BENCH-001", ["ping_uut", "verify_psu"])
+        health_checker.set_mock_failure("BENCH-002", ["ping_uut"])
+        health_checker.set_mock_failure("BENCH-001", ["ptp_connectivity"])
+
+        assert health_checker.check_bench(bench).failed_checks == ["ptp_connectivity"]
+        other = health_checker.check_bench({"bench_id": "BENCH-002", "connection": {}})
+        assert other.failed_checks == ["ping_uut"]
+
     def test_different_benches_different_results(self, health_checker):
         """Test that failures are bench-specific."""
         health_checker.set_mock_failure("BENCH-001", ["ping_uut"])
@@ -207,6 +232,255 @@ class TestHealthChecker:
         assert result.details["checks_run"] == 3
         assert result.details["checks_passed"] == 3
 
+    def test_checks_run_concurrently(self, monkeypatch):
+        """Test that the three checks of a bench run at the same time."""
+        checker = HealthChecker(mock_mode=True, retry_count=1)
+        barrier = threading.Barrier(3, timeout=5)
+
+        def rendezvous(connection, bench_id):
+            barrier.wait()
+            return True
+
+        for name in ("_check_ping_uut", "_check_verify_psu", "_check_ptp_connectivity"):
+            monkeypatch.setattr(checker, name, rendezvous)
+
+        result = checker.check_bench({"bench_id": "BENCH-001", "connection": {}})
+        assert result.healthy is True
+        assert list(result.checks) == ["ping_uut", "verify_psu", "ptp_connectivity"]
+
+    def test_sequential_checks(self):
+        """Test that parallel_checks=False still runs every check."""
+        checker = HealthChecker(mock_mode=True, retry_count=1, parallel_checks=False)
+        checker.set_mock_failure("BENCH-001", ["verify_psu"])
+        result = checker.check_bench({"bench_id": "BENCH-001", "connection": {}})
+
+        assert result.healthy is False
+        assert result.failed_checks == ["verify_psu"]
+
+    def test_check_benches(self, health_checker):
+        """Test checking several benches at once keeps input order."""
+        health_checker.set_mock_failure("BENCH-002", ["ptp_connectivity"])
+        results = health_checker.check_benches([
+            {"bench_id": "BENCH-001", "connection": {}},
+            {"bench_id": "BENCH-002", "connection": {}},
+        ])
+
+        assert [r.bench_id for r in results] == ["BENCH-001", "BENCH-002"]
+        assert [r.healthy for r in results] == [True, False]
+        assert results[1].failed_checks == ["ptp_connectivity"]
+
+    def test_check_benches_async_ping(self, monkeypatch):
+        """Test that production pings go through the async ping path."""
+        checker = HealthChecker(mock_mode=False, retry_count=2)
+        pinged = []
+
+        async def fake_aping(ip):
+            pinged.append(ip)
+            return ip != "10.0.0.2"
+
+        monkeypatch.setattr(checker, "_aping", fake_aping)
+        results = checker.check_benches([
+            {"bench_id": "BENCH-001", "connection": {"uut_ip": "10.0.0.1"}},
+            {"bench_id": "BENCH-002", "connection": {"uut_ip": "10.0.0.2"}},
+        ])
+
+        assert results[0].healthy is True
+        assert results[1].failed_checks == ["ping_uut"]
+        assert sorted(pinged) == ["10.0.0.1", "10.0.0.2", "10.0.0.2"]
+
+    def test_healthy_result_cached(self, monkeypatch):
+        """Test that a healthy result is reused until invalidated."""
+        checker = HealthChecker(mock_mode=True, retry_count=1, result_ttl_sec=60)
+        calls = []
+        original = checker._check_ping_uut
+
+        def counting_ping(connection, bench_id):
+            calls.append(bench_id)
+            return original(connection, bench_id)
+
+        monkeypatch.setattr(checker, "_check_ping_uut", counting_ping)
+        bench = {"bench_id": "BENCH-001", "connection": {"uut_ip": "1.2.3.4"}}
+
+        first = checker.check_bench(bench)
+        second = checker.check_bench(bench)
+        assert second.healthy is True and second is not first
+        assert len(calls) == 1
+
+        checker.invalidate("BENCH-001")
+        checker.check_bench(bench)
+        assert len(calls) == 2
+
+    def test_result_cache_off_by_default(self, health_checker):
+        """Test that results are only reused when a TTL is configured."""
+        assert health_checker.result_ttl_sec == 0
+        bench = {"bench_id": "BENCH-001", "connection": {}}
+        assert health_checker.check_bench(bench) is not health_checker.check_bench(bench)
+        assert health_checker._result_cache == {}
+
+    def test_failed_result_not_cached(self, health_checker):
+        """Test that failures are re-checked so a bench can recover."""
+        bench = {"bench_id": "BENCH-001", "connection": {}}
+        health_checker.set_mock_failure("BENCH-001", ["ping_uut"])
+        assert health_checker.check_bench(bench).healthy is False
+
+        health_checker._mock_failures.clear()
+        assert health_checker.check_bench(bench).healthy is True
+
+    def test_circuit_breaker_fast_fails(self, monkeypatch):
+        """Test that a repeatedly failing bench is fast-failed until reset."""
+        checker = HealthChecker(mock_mode=True, retry_count=1)
+        checker.set_mock_failure("BENCH-001", ["ping_uut"])
+        bench = {"bench_id": "BENCH-001", "connection": {}}
+        for _ in range(HealthChecker.BREAKER_THRESHOLD):
+            assert checker.check_bench(bench).checks["ping_uut"] is False
+
+        monkeypatch.setattr(
+            checker, "_check_ping_uut", lambda *a: pytest.fail("check ran while open")
+        )
+        result = checker.check_bench(bench)
+        assert result.healthy is False
+        assert result.details["circuit_open"] is True
+        assert result.checks == {}
+
+        monkeypatch.undo()
+        checker.clear_mock_failures()
+        assert checker.check_bench(bench).healthy is True
+
+    def test_retry_backoff_is_bounded(self, health_checker):
+        """Test that retry delays grow exponentially up to the cap plus jitter."""
+        cap = HealthChecker.RETRY_BACKOFF_MAX_SEC + HealthChecker.RETRY_JITTER_SEC
+        assert HealthChecker.RETRY_BACKOFF_BASE_SEC <= health_checker._backoff_delay(1) <= 0.06
+        assert all(0 < health_checker._backoff_delay(a) <= cap for a in range(1, 20))
+
+    def test_set_check_tracks_failures(self):
+        """Test that failed checks are tracked as outcomes are recorded."""
+        result = HealthCheckResult(bench_id="BENCH-001", checks={"ping_uut": False})
+        assert result.failed_checks == ["ping_uut"]
+
+        result.set_check("verify_psu", False)
+        result.set_check("ping_uut", True)
+
+        assert result.failed_checks == ["verify_psu"]
+        assert result.healthy is False
+        assert result.checks == {"ping_uut": True, "verify_psu": False}
+
+    def test_checks_receive_unpacked_connection(self, monkeypatch):
+        """Test that checks get the bench addresses as a BenchConnection."""
+        checker = HealthChecker(mock_mode=True, retry_count=1)
+        seen = []
+
+        def record(connection, bench_id):
+            seen.append(connection)
+            return True
+
+        monkeypatch.setattr(checker, "_check_ping_uut", record)
+        checker.check_bench({
+            "bench_id": "BENCH-001",
+            "connection": {"uut_ip": "10.0.0.1", "psu_ip": "10.0.0.2", "psu_channel": 1},
+        })
+
+        assert seen == [BenchConnection(uut_ip="10.0.0.1", psu_ip="10.0.0.2")]
+
+    def test_batch_ping_with_fping(self, monkeypatch):
+        """Test that one fping run answers the following ping checks."""
+        checker = HealthChecker(mock_mode=False, retry_count=1)
+        commands = []
+
+        def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            return subprocess.CompletedProcess(cmd, 1, stdout="10.0.0.1\n", stderr="")
+
+        monkeypatch.setattr(health_check.subprocess, "run", fake_run)
+        monkeypatch.setattr(checker, "_ping", lambda ip: pytest.fail("single ping"))
+
+        results = checker.batch_ping(["10.0.0.1", "10.0.0.2", "10.0.0.1", ""])
+        assert results == {"10.0.0.1": True, "10.0.0.2": False}
+        assert len(commands) == 1 and commands[0][0] == "fping"
+
+        assert checker._check_ping_uut(BenchConnection(uut_ip="10.0.0.1"), "B1") is True
+        assert checker._check_ping_uut(BenchConnection(uut_ip="10.0.0.2"), "B2") is False
+
+    def test_batch_ping_without_fping(self, monkeypatch):
+        """Test that batch_ping falls back to single pings when fping is missing."""
+        checker = HealthChecker(mock_mode=False, retry_count=1)
+
+        def missing_fping(cmd, **kwargs):
+            raise FileNotFoundError("fping")
+
+        monkeypatch.setattr(health_check.subprocess, "run", missing_fping)
+        monkeypatch.setattr(checker, "_ping", lambda ip: ip.endswith(".1"))
+
+        assert checker.batch_ping(["10.0.0.1", "10.0.0.2"]) == {
+            "10.0.0.1": True,
+            "10.0.0.2": False,
+        }
+
+    def test_prefetch_pings_only_benches_to_check(self, monkeypatch):
+        """Test that cached and breaker-open benches are left out of the fping run."""
+        checker = HealthChecker(mock_mode=False, retry_count=1, result_ttl_sec=60)
+        configs = [
+            {"bench_id": f"B{n}", "connection": {"uut_ip": f"10.0.0.{n}"}}
+            for n in (1, 2, 3)
+        ]
+        checker._record_result(
+            checker._cache_key("B1", configs[0]["connection"]), HealthCheckResult(bench_id="B1")
+        )
+        for _ in range(HealthChecker.BREAKER_THRESHOLD):
+            checker._record_result(
+                checker._cache_key("B2", configs[1]["connection"]),
+                HealthCheckResult(bench_id="B2", healthy=False),
+            )
+        commands = []
+
+        def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout="10.0.0.3\n", stderr="")
+
+        monkeypatch.setattr(health_check.subprocess, "run", fake_run)
+        checker.prefetch_pings(configs)
+
+        assert [cmd[-1:] for cmd in commands] == [["10.0.0.3"]]
+        assert checker._take_batch_ping("10.0.0.3") is True
+
+    def test_prefetch_pings_skipped_without_fping(self, monkeypatch):
+        """Test that without fping nothing is pinged ahead of the bench checks."""
+        checker = HealthChecker(mock_mode=False, retry_count=1)
+
+        def missing_fping(cmd, **kwargs):
+            raise FileNotFoundError("fping")
+
+        monkeypatch.setattr(health_check.subprocess, "run", missing_fping)
+        monkeypatch.setattr(checker, "_ping", lambda ip: pytest.fail("serial ping"))
+        checker.prefetch_pings([
+            {"bench_id": "B1", "connection": {"uut_ip": "10.0.0.1"}},
+            {"bench_id": "B2", "connection": {"uut_ip": "10.0.0.2"}},
+        ])
+        assert checker._take_batch_ping("10.0.0.1") is None
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_result_has_no_instance_dict(self):
+        """Test that health check results are slotted."""
+        assert not hasattr(HealthCheckResult(bench_id="BENCH-001"), "__dict__")
+
+    def test_production_ping_uses_icmplib(self, monkeypatch):
+        """Test that production pings are sent in-process when icmplib exists."""
+        calls = []
+
+        def fake_icmp_ping(address, count, timeout, privileged):
+            calls.append((address, privileged))
+            return type("Host", (), {"is_alive": True})()
+
+        monkeypatch.setattr(health_check, "ICMPLIB_AVAILABLE", True)
+        monkeypatch.setattr(health_check, "icmp_ping", fake_icmp_ping, raising=False)
+        monkeypatch.setattr(
+            health_check.subprocess, "run",
+            lambda *a, **k: pytest.fail("ping subprocess spawned"),
+        )
+        checker = HealthChecker(mock_mode=False, retry_count=1)
+
+        assert checker._check_ping_uut(BenchConnection(uut_ip="10.0.0.1"), "BENCH-001") is True
+        assert calls == [("10.0.0.1", False)]
+
 
 # ---------------------------------------------------------------------------
 # ResourceManager Tests
@@ -229,6 +503,8 @@ class TestResourceManager:
         assert metadata.hardware_type == "radar_x_band"
         assert metadata.uut_ip in ("192.168.1.10", "192.168.1.11")
         assert metadata.allocated_at > 0
+        assert isinstance(metadata.allocated_at, int)
+        assert abs(metadata.to_dict()["allocated_at"] - time.time()) < 60
 
     def test_request_resource_returns_metadata(self, resource_manager):
         """Test that metadata contains all connection details."""
@@ -349,6 +625,134 @@ class TestResourceManager:
         with pytest.raises(ResourceAllocationError, match="failed health checks"):
             rm.request_resource("radar_x_band")
 
+    def test_result_cache_enabled_from_config(self, sample_benches_config):
+        """Test that the manager turns on the checker's result cache from config."""
+        rm = ResourceManager(benches_config=sample_benches_config)
+        assert rm.health_checker.result_ttl_sec == 15.0
+
+        sample_benches_config["health_check"]["result_ttl_sec"] = 0
+        rm = ResourceManager(benches_config=sample_benches_config)
+        assert rm.health_checker.result_ttl_sec == 0
+
+    def test_health_results_cached_between_requests(
+        self, sample_benches_config, monkeypatch
+    ):
+        """Test that a recent healthy result is reused unless a refresh is forced."""
+        checker = HealthChecker(mock_mode=True, retry_count=1, result_ttl_sec=60)
+        probed = []
+        original = checker._check_verify_psu
+
+        def counting_verify(connection, bench_id):
+            probed.append(bench_id)
+            return original(connection, bench_id)
+
+        monkeypatch.setattr(checker, "_check_verify_psu", counting_verify)
+        rm = ResourceManager(
+            benches_config=sample_benches_config,
+            max_concurrent_jobs=4,
+            health_checker=checker,
+        )
+
+        assert rm.request_resource("radar_x_band").bench_id == "BENCH-001"
+        assert sorted(probed) == ["BENCH-001", "BENCH-002"]
+
+        # Releasing re-probes the released bench; BENCH-002 comes from the cache
+        rm.release_resource("BENCH-001")
+        assert rm.request_resource("radar_x_band").bench_id == "BENCH-001"
+        assert sorted(probed) == ["BENCH-001", "BENCH-001", "BENCH-002"]
+
+        rm.release_resource("BENCH-001")
+        rm.request_resource("radar_x_band", force_refresh=True)
+        assert sorted(probed) == ["BENCH-001"] * 3 + ["BENCH-002"] * 2
+
+    def test_candidates_checked_concurrently(self, sample_benches_config, monkeypatch):
+        """Test that all candidates are probed on one event loop and priority is kept."""
+        in_flight = set()
+        peak = []
+        checker = HealthChecker(mock_mode=True, retry_count=1)
+        original = checker.acheck_bench
+
+        async def overlapping_acheck(bench_config):
+            in_flight.add(bench_config["bench_id"])
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.discard(bench_config["bench_id"])
+            return await original(bench_config)
+
+        monkeypatch.setattr(checker, "acheck_bench", overlapping_acheck)
+        checker.set_mock_failure("BENCH-002", ["ping_uut"])
+        rm = ResourceManager(
+            benches_config=sample_benches_config,
+            health_checker=checker,
+        )
+
+        assert rm.request_resource("radar_x_band").bench_id == "BENCH-001"
+        assert max(peak) == 2
+        # BENCH-002 was behind the winner, so its failure is not acted on
+        assert rm.get_bench_status("BENCH-002")["state"] == "available"
+
+    def test_health_checks_inside_event_loop(self, resource_manager):
+        """Test requests made from async code fall back to a thread pool."""
+        async def request():
+            return resource_manager.request_resource("radar_x_band")
+
+        assert asyncio.run(request()).bench_id == "BENCH-001"
+
+    def test_lock_released_during_health_checks(self, resource_manager, monkeypatch):
+        """Test that other callers are not blocked while candidates are probed."""
+        seen = {}
+        original = resource_manager.health_checker.acheck_bench
+
+        async def probing_acheck(bench_config):
+            if bench_config["bench_id"] == "BENCH-001":
+                def other_caller():
+                    seen["own_state"] = resource_manager.get_bench_status("BENCH-001")["state"]
+                    seen["x_band_count"] = resource_manager.get_available_count("radar_x_band")
+                    seen["other"] = resource_manager.request_resource(
+                        "radar_s_band", skip_health_check=True
+                    ).bench_id
+
+                thread = threading.Thread(target=other_caller)
+                thread.start()
+                thread.join(5)
+            return await original(bench_config)
+
+        monkeypatch.setattr(resource_manager.health_checker, "acheck_bench", probing_acheck)
+        metadata = resource_manager.request_resource("radar_x_band", job_id="JOB-1")
+
+        # A bench held for a health check is still reported (and counted) as available
+        assert seen == {"own_state": "available", "x_band_count": 2, "other": "BENCH-003"}
+        assert metadata.bench_id == "BENCH-001"
+        assert resource_manager.get_bench_status("BENCH-002")["state"] == "available"
+
+    def test_concurrent_requests_share_benches(self, resource_manager, monkeypatch):
+        """Test that a request arriving during another's health checks still gets a bench."""
+        outcome = {}
+        original = resource_manager.health_checker.acheck_bench
+
+        def second_request():
+            try:
+                outcome["second"] = resource_manager.request_resource("radar_x_band").bench_id
+            except ResourceAllocationError as exc:
+                outcome["second"] = exc
+
+        second = threading.Thread(target=second_request)
+
+        async def probing_acheck(bench_config):
+            if "waited" not in outcome:
+                # Both X-band benches are reserved by the first request now
+                second.start()
+                second.join(0.5)
+                outcome["waited"] = second.is_alive()
+            return await original(bench_config)
+
+        monkeypatch.setattr(resource_manager.health_checker, "acheck_bench", probing_acheck)
+        first = resource_manager.request_resource("radar_x_band").bench_id
+        second.join(5)
+
+        assert outcome["waited"] is True
+        assert {first, outcome["second"]} == {"BENCH-001", "BENCH-002"}
+
     def test_skip_health_check(self, resource_manager):
         """Test allocation without health check."""
         metadata = resource_manager.request_resource(
@@ -366,6 +770,32 @@ class TestResourceManager:
         assert status["hardware_type"] == "radar_x_band"
         assert status["state"] == "available"
 
+    def test_all_statuses_match_single_status(self, resource_manager):
+        """Test bulk statuses agree with per-bench queries."""
+        resource_manager.request_resource("radar_x_band", job_id="JOB-1")
+        statuses = resource_manager.get_all_bench_statuses()
+
+        assert statuses == [
+            resource_manager.get_bench_status(s["bench_id"]) for s in statuses
+        ]
+        assert resource_manager._count_by_state() == {
+            "busy": 1, "available": 2, "maintenance": 1,
+        }
+
+    def test_state_counts_follow_transitions(self, resource_manager):
+        """Test incremental state counts match a full recount."""
+        metadata = resource_manager.request_resource("radar_x_band")
+        resource_manager.set_bench_state("BENCH-003", BenchState.OFFLINE)
+        resource_manager.release_resource(metadata.bench_id)
+        resource_manager.set_bench_state("BENCH-004", BenchState.AVAILABLE)
+
+        recount = {}
+        for status in resource_manager.get_all_bench_statuses():
+            recount[status["state"]] = recount.get(status["state"], 0) + 1
+        assert resource_manager._count_by_state() == recount == {
+            "available": 3, "offline": 1,
+        }
+
     def test_get_bench_status_not_found(self, resource_manager):
         """Test querying unknown bench returns None."""
         assert resource_manager.get_bench_status("BENCH-999") is None
@@ -385,6 +815,30 @@ class TestResourceManager:
         status = resource_manager.get_bench_status("BENCH-004")
         assert status["state"] == "available"
 
+    def test_available_index_follows_state_changes(self, resource_manager):
+        """Test candidate lookup tracks allocation, release and manual state."""
+        metadata = resource_manager.request_resource("radar_x_band")
+        assert metadata.bench_id == "BENCH-001"
+        assert resource_manager.get_available_count("radar_x_band") == 1
+
+        resource_manager.set_bench_state("BENCH-004", BenchState.AVAILABLE)
+        assert resource_manager.get_available_count("radar_l_band") == 1
+
+        resource_manager.release_resource("BENCH-001")
+        assert resource_manager.get_available_count("radar_x_band") == 2
+        # Config order still decides priority after release
+        assert resource_manager.request_resource("radar_x_band").bench_id == "BENCH-001"
+
+    def test_bench_strings_interned(self, sample_benches_config):
+        """Test config strings are interned and match caller-built strings."""
+        rm = ResourceManager(benches_config=sample_benches_config)
+        bench = rm._benches["BENCH-001"]
+        assert bench.hardware_type is sys.intern("radar_x_band")
+        assert bench.location is sys.intern("Lab A")
+
+        hardware_type = "".join(["radar_", "x_band"])
+        assert rm.request_resource(hardware_type).bench_id == "BENCH-001"
+
     def test_set_bench_state_not_found(self, resource_manager):
         """Test setting state of unknown bench returns False."""
         assert resource_manager.set_bench_state("BENCH-999", BenchState.AVAILABLE) is False
@@ -424,7 +878,7 @@ class TestResourceMetadata:
             psu_ip="192.168.1.20",
             ptp_ip="192.168.1.30",
             location="Lab A",
-            allocated_at=1234567890.0,
+            allocated_at=1_234_567_890_000_000_000,
         )
         d = meta.to_dict()
 
@@ -444,6 +898,43 @@ class TestResourceMetadata:
         d = meta.to_dict()
         assert d["health_check_passed"] is True
 
+    def test_to_dict_is_memoized(self):
+        """Test repeat serialization reuses the cached dict without sharing it."""
+        meta = ResourceMetadata(bench_id="BENCH-001")
+        first = meta.to_dict()
+        first["bench_id"] = "mutated"
+
+        assert meta.to_dict()["bench_id"] == "BENCH-001"
+        assert meta._cached_dict is not None
+        assert "_cached_dict" not in meta.to_dict()
+
+
+class TestBenchRecord:
+    """Tests for the BenchRecord inventory entry."""
+
+    def test_from_config(self, sample_benches_config):
+        """Test parsing a bench entry into attributes."""
+        entry = sample_benches_config["benches"][0]
+        record = BenchRecord.from_config(entry)
+
+        assert record.bench_id == "BENCH-001"
+        assert record.uut_ip == "192.168.1.10"
+        assert record.psu_port == 1
+        assert record.config is entry
+
+    def test_missing_fields_default(self):
+        """Test absent keys fall back to empty values."""
+        record = BenchRecord.from_config({"bench_id": "BENCH-X"})
+        assert record.hardware_type == ""
+        assert record.uut_ip == ""
+        assert record.connection == {}
+
+    def test_frozen(self):
+        """Test records cannot be modified after load."""
+        record = BenchRecord(bench_id="BENCH-X")
+        with pytest.raises(AttributeError):
+            record.uut_ip = "10.0.0.1"
+
 
 # ---------------------------------------------------------------------------
 # BenchState Tests
@@ -465,3 +956,64 @@ class TestBenchState:
         assert BenchState("available") == BenchState.AVAILABLE
         assert BenchState("busy") == BenchState.BUSY
 
+
+# ---------------------------------------------------------------------------
+# ShardedRWLock Tests
+# ---------------------------------------------------------------------------
+
+
+class TestShardedRWLock:
+    """Tests for the sharded reader-writer lock."""
+
+    def test_writer_excludes_readers(self):
+        """Test that a reader waits while another thread holds the write lock."""
+        lock = ShardedRWLock(shards=4)
+        entered = threading.Event()
+
+        def reader():
+            with lock.read():
+                entered.set()
+
+        with lock.write():
+            thread = threading.Thread(target=reader)
+            thread.start()
+            assert not entered.wait(0.1)
+        assert entered.wait(5)
+        thread.join()
+
+    def test_readers_share_access(self):
+        """Test that readers on different shards hold the lock at the same time."""
+        setup = threading.Barrier(3, timeout=5)
+        inside = threading.Barrier(3, timeout=5)
+        native_ids = [threading.get_native_id()]
+        locks = []
+
+        def reader():
+            native_ids.append(threading.get_native_id())
+            setup.wait()  # thread IDs recorded
+            setup.wait()  # lock built
+            with locks[0].read():
+                inside.wait()
+
+        threads = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        setup.wait()
+        # Enough shards that each thread ID maps to a shard of its own
+        locks.append(ShardedRWLock(shards=max(native_ids) - min(native_ids) + 1))
+        setup.wait()
+        with locks[0].read():
+            # Breaks (BrokenBarrierError) unless all three readers are inside
+            inside.wait()
+        for thread in threads:
+            thread.join(5)
+
+    def test_reentrant(self):
+        """Test that the owning thread can nest reads and writes."""
+        lock = ShardedRWLock(shards=2)
+        with lock.write():
+            with lock.read():
+                with lock.write():
+                    pass
+        assert lock.shard_count == 2
+